@@ -38,6 +38,9 @@ def create_app(config_name: str = None) -> Flask:
     setup_logging()
 
     app = Flask(__name__)
+    # ISO 8601 datetimes (orjson-backed when installed)
+    from .utils.json_provider import TradeUpJSONProvider
+    app.json = TradeUpJSONProvider(app)
     config_class = get_config(config_name)
     app.config.from_object(config_class)
 
@@ -109,6 +112,10 @@ def create_app(config_name: str = None) -> Flask:
     from .middleware import init_request_id_tracking
     init_request_id_tracking(app)
 
+    # Flush per-request Flow trigger batches to the background sender
+    from .services.flow_service import init_flow_trigger_buffer
+    init_flow_trigger_buffer(app)
+
     # Register blueprints
     register_blueprints(app)
 
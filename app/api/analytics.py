@@ -1264,7 +1264,8 @@ def export_analytics():
     Export analytics data as CSV.
 
     Query params:
-        type: 'members', 'trade_ins', 'credits', 'points', 'rewards', 'summary'
+        type: 'members', 'trade_ins', 'credits', 'points', 'rewards',
+              'tier_changes', 'summary'
         period: '7', '30', '90', '365', 'all'
     """
     tenant_id = g.tenant_id
@@ -1449,6 +1450,27 @@ def export_analytics():
                 ])
             filename = f'member_activities_export_{datetime.utcnow().strftime("%Y%m%d")}.csv'
 
+        elif export_type == 'tier_changes':
+            # Audit export of tier changes, streamed without ORM hydration
+            writer.writerow([
+                'Date', 'Member ID', 'Previous Tier', 'New Tier', 'Change Type',
+                'Source', 'Reference', 'Reason', 'Expires', 'Changed By'
+            ])
+            for row in TierChangeLog.export_rows(db.session, tenant_id, since=start_date):
+                writer.writerow([
+                    row['created_at'] or '',
+                    row['member_id'],
+                    row['previous_tier'] or '',
+                    row['new_tier'] or '',
+                    row['change_type'],
+                    row['source_type'],
+                    row['source_reference'] or '',
+                    row['reason'] or '',
+                    row['expires_at'] or '',
+                    row['created_by'] or ''
+                ])
+            filename = f'tier_changes_export_{datetime.utcnow().strftime("%Y%m%d")}.csv'
+
         else:  # summary
             writer.writerow(['Metric', 'Value'])
 
@@ -12,6 +12,7 @@ from ..services.shopify_billing import (
 )
 from ..models import Tenant, BillingHistory
 from ..extensions import db
+from ..utils.serialization import serialization_load_options
 from ..middleware.shopify_auth import require_shopify_auth
 from datetime import datetime, timedelta
 
@@ -202,13 +203,13 @@ def subscription_status():
     tenant = g.tenant
 
     # Get member count for usage tracking
-    from ..models import Member
+    from ..models import Member, MembershipTier
     member_count = Member.query.filter_by(
         tenant_id=tenant.id,
         status='active'
     ).count()
 
-    tier_count = tenant.membership_tiers.count()
+    tier_count = MembershipTier.query.filter_by(tenant_id=tenant.id).count()
 
     # Calculate usage percentages and warnings
     member_pct = (member_count / tenant.max_members * 100) if tenant.max_members else 0
@@ -501,6 +502,7 @@ def billing_history():
     per_page = min(request.args.get('per_page', 20, type=int), 100)
 
     history = BillingHistory.query.filter_by(tenant_id=tenant.id)\
+        .options(*serialization_load_options())\
         .order_by(BillingHistory.created_at.desc())\
         .paginate(page=page, per_page=per_page, error_out=False)
 
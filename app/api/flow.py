@@ -22,8 +22,12 @@ ACTIONS (POST endpoints):
 - POST /flow/actions/send-tier-upgrade-email - Send tier upgrade notification
 - POST /flow/actions/create-reward-reminder - Send reward reminder
 - POST /flow/actions/get-points-balance - Get customer's points balance
+
+LIFECYCLE (POST endpoints):
+- POST /flow/lifecycle/<trigger> - Shopify reports whether a trigger has enabled workflows
 """
 from flask import Blueprint, request, jsonify, g
+from decimal import Decimal, InvalidOperation
 from functools import wraps
 import hmac
 import hashlib
@@ -31,9 +35,13 @@ import base64
 
 from ..middleware.shopify_auth import require_shopify_auth, get_shop_from_request
 from ..models import Tenant
+from ..utils.money import to_decimal
 
 flow_bp = Blueprint('flow', __name__)
 
+# Largest credit the ledger can hold: store_credit_ledger.amount is Numeric(10, 2)
+MAX_CREDIT_AMOUNT = Decimal('99999999.99')
+
 
 def require_flow_auth(f):
     """
@@ -48,7 +56,7 @@ def require_flow_auth(f):
         if not shop:
             # Try to get from request body
             data = request.get_json(silent=True) or {}
-            shop = data.get('shop_domain') or data.get('shopDomain')
+            shop = data.get('shop_domain') or data.get('shopDomain') or data.get('shopify_domain')
 
         if not shop:
             return jsonify({'error': 'Shop domain required'}), 400
@@ -110,7 +118,17 @@ def action_add_credit():
             'error': 'customer_email is required'
         }), 400
 
-    if not amount or float(amount) <= 0:
+    # Parse the amount to a Decimal once here; the service uses it as-is.
+    # JSON booleans are ints in Python, so they are rejected explicitly.
+    try:
+        if isinstance(amount, bool) or not isinstance(amount, (int, float, str)):
+            raise TypeError('amount must be a number')
+        amount = to_decimal(amount)
+        valid_amount = amount.is_finite() and 0 < amount <= MAX_CREDIT_AMOUNT
+    except (InvalidOperation, TypeError):
+        valid_amount = False
+
+    if not valid_amount:
         return jsonify({
             'success': False,
             'error': 'Valid amount is required'
@@ -125,7 +143,7 @@ def action_add_credit():
 
         result = flow_svc.action_add_credit(
             customer_email=customer_email,
-            amount=float(amount),
+            amount=amount,
             reason=reason
         )
 
@@ -234,6 +252,43 @@ def action_get_member():
         }), 500
 
 
+# ==================== Flow Trigger Lifecycle ====================
+
+@flow_bp.route('/lifecycle/<trigger_name>', methods=['POST'])
+@require_flow_auth
+def trigger_lifecycle(trigger_name):
+    """
+    Flow trigger lifecycle callback.
+
+    Shopify calls this when the first workflow using a trigger is enabled
+    or the last one is disabled, so triggers nobody listens for are skipped.
+
+    Request body:
+        shopify_domain: Shop the change applies to
+        has_enabled_flow: Whether any enabled workflow uses the trigger
+
+    Returns:
+        success: Whether the subscription state was recorded
+    """
+    data = request.get_json(silent=True) or {}
+
+    if 'has_enabled_flow' not in data:
+        return jsonify({
+            'success': False,
+            'error': 'has_enabled_flow is required'
+        }), 400
+
+    from ..services.flow_service import FlowService
+
+    result = FlowService(g.tenant_id).set_trigger_subscribed(
+        trigger_name,
+        bool(data['has_enabled_flow'])
+    )
+
+    status_code = 200 if result.get('success') else 400
+    return jsonify(result), status_code
+
+
 # ==================== Flow Trigger Endpoints ====================
 # These are called by Shopify to get trigger schema/configuration
 
@@ -64,6 +64,8 @@ def init_database():
             results['add_icon_column'] = f'skipped: {e}'
 
         # Try to create tables (won't override existing)
+        from ..models import load_all_models
+        load_all_models()
         db.create_all()
         results['create_all'] = 'success'
 
@@ -446,7 +446,8 @@ def run_nudges():
         result = nudge_service.process_points_expiring_reminders()
         results['points_expiring'] = result
         if result.get('success'):
-            emails_sent += result.get('reminders_sent', 0)
+            # Emails handed to the background sender count toward the limit
+            emails_sent += result.get('reminders_sent', 0) + result.get('queued', 0)
 
     # 2. Tier progress
     if nudge_service.is_nudge_enabled('tier_progress') and emails_sent < max_emails:
@@ -19,6 +19,7 @@ from ..models.tier_history import (
     MemberPromoUsage
 )
 from ..services.tier_service import TierService
+from ..utils.serialization import serialization_load_options
 
 
 tiers_bp = Blueprint('tiers', __name__, url_prefix='/api/tiers')
@@ -654,7 +655,9 @@ def get_audit_log():
             current_app.logger.warning(f"Invalid to_date format: {to_date}")
 
     total = query.count()
-    logs = query.order_by(TierChangeLog.created_at.desc()).limit(limit).offset(offset).all()
+    logs = query.options(*serialization_load_options()).order_by(
+        TierChangeLog.created_at.desc()
+    ).limit(limit).offset(offset).all()
 
     return jsonify({
         'logs': [log.to_dict() for log in logs],
@@ -697,18 +700,14 @@ def get_tier_stats():
     # Get recent changes
     recent_changes = TierChangeLog.query.filter_by(
         tenant_id=tenant.id
+    ).options(
+        *serialization_load_options()
     ).order_by(
         TierChangeLog.created_at.desc()
     ).limit(10).all()
 
     # Get active promotions
-    now = datetime.utcnow()
-    active_promos = TierPromotion.query.filter(
-        TierPromotion.tenant_id == tenant.id,
-        TierPromotion.is_active == True,
-        TierPromotion.starts_at <= now,
-        TierPromotion.ends_at >= now
-    ).count()
+    active_promos = TierPromotion.active_for_tenant(tenant.id).count()
 
     return jsonify({
         'tier_distribution': {name: count for name, count in tier_counts},
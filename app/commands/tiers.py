@@ -270,14 +270,7 @@ def show_stats(tenant_id):
     click.echo(f'  (No tier): {no_tier} members')
 
     # Active promotions
-    from datetime import datetime
-    now = datetime.utcnow()
-    active_promos = TierPromotion.query.filter(
-        TierPromotion.tenant_id == tenant.id,
-        TierPromotion.is_active == True,
-        TierPromotion.starts_at <= now,
-        TierPromotion.ends_at >= now
-    ).all()
+    active_promos = TierPromotion.active_for_tenant(tenant.id).all()
 
     click.echo(f'\nActive Promotions: {len(active_promos)}')
     for promo in active_promos:
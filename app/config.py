@@ -12,9 +12,22 @@ class BaseConfig:
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    # Raise on lazy relationship loads in to_dict serialization paths
+    STRICT_LOADING = os.getenv('STRICT_LOADING', 'false').lower() == 'true'
+
     # Shopify defaults (overridden per-tenant)
     SHOPIFY_API_VERSION = '2024-01'
 
+    # Send Shopify Flow triggers from a background thread instead of inline
+    FLOW_TRIGGERS_ASYNC = os.getenv('FLOW_TRIGGERS_ASYNC', 'true').lower() == 'true'
+
+    # Recompute a member's precomputed nudges in the background when their points or record change
+    NUDGE_CANDIDATES_INCREMENTAL = os.getenv('NUDGE_CANDIDATES_INCREMENTAL', 'true').lower() == 'true'
+
+    # Queue batch reminder emails for in-process background workers instead of
+    # sending them inline. Off by default: queued emails are lost on restart.
+    NUDGE_EMAILS_ASYNC = os.getenv('NUDGE_EMAILS_ASYNC', 'false').lower() == 'true'
+
     # TradeUp defaults - tier bonus rates
     DEFAULT_BONUS_RATES = {
         'silver': 0.05,   # 5% trade-in bonus
@@ -26,6 +39,7 @@ class BaseConfig:
 class DevelopmentConfig(BaseConfig):
     """Development configuration."""
     DEBUG = True
+    STRICT_LOADING = True
     SQLALCHEMY_DATABASE_URI = os.getenv(
         'DATABASE_URL',
         'sqlite:///tradeup_dev.db'  # SQLite fallback for local dev
@@ -95,6 +109,10 @@ class ProductionConfig(BaseConfig):
 class TestingConfig(BaseConfig):
     """Testing configuration."""
     TESTING = True
+    STRICT_LOADING = True
+    FLOW_TRIGGERS_ASYNC = False
+    NUDGE_CANDIDATES_INCREMENTAL = False
+    NUDGE_EMAILS_ASYNC = False
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
 
 
@@ -43,5 +43,4 @@ from .query_profiler import (
 from .request_id import (
     init_request_id_tracking,
     get_request_id,
-    RequestIdFilter,
 )
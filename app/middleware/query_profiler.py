@@ -8,12 +8,19 @@ Tracks SQL query execution times and provides performance insights:
 - Request-level query statistics
 
 Enable with QUERY_PROFILING=true environment variable.
+Per-request query detail is kept in a bounded buffer (QUERY_PROFILE_CAP,
+default 200). Set QUERY_PROFILE_LOG to a file path (e.g. logs/db-queries.jsonl)
+to have request summaries appended as JSON lines by a background writer.
 """
 import os
+import json
 import time
+import queue
 import logging
+from collections import deque
+from datetime import datetime
 from functools import wraps
-from threading import local
+from threading import Thread, local
 from flask import g, request
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
@@ -23,6 +30,9 @@ logger = logging.getLogger(__name__)
 # Thread-local storage for query stats
 _query_stats = local()
 
+# Queue feeding the background JSONL writer (None when not configured)
+_profile_log_queue = None
+
 
 def is_profiling_enabled():
     """Check if query profiling is enabled."""
@@ -34,22 +44,47 @@ def get_slow_query_threshold():
     return float(os.getenv('SLOW_QUERY_THRESHOLD', '0.1'))  # 100ms default
 
 
+def get_query_profile_cap():
+    """Get the max number of per-query entries kept for a request."""
+    return int(os.getenv('QUERY_PROFILE_CAP', '200'))
+
+
 def get_query_stats():
     """Get query stats for current request."""
     if not hasattr(_query_stats, 'queries'):
-        _query_stats.queries = []
-        _query_stats.total_time = 0.0
-        _query_stats.query_count = 0
+        reset_query_stats()
     return _query_stats
 
 
 def reset_query_stats():
     """Reset query stats for new request."""
-    _query_stats.queries = []
+    _query_stats.queries = deque(maxlen=get_query_profile_cap())
     _query_stats.total_time = 0.0
     _query_stats.query_count = 0
 
 
+def _profile_log_writer(path, q):
+    """Drain request summaries from the queue and append them as JSON lines."""
+    while True:
+        entry = q.get()
+        try:
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, default=str) + '\n')
+        except OSError as e:
+            logger.warning(f"[QueryProfiler] Failed to write profile log: {e}")
+
+
+def _start_profile_log_writer(path):
+    """Start the daemon JSONL writer thread and return its queue."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    q = queue.Queue(maxsize=1000)
+    Thread(target=_profile_log_writer, args=(path, q), daemon=True,
+           name='query-profile-writer').start()
+    return q
+
+
 @event.listens_for(Engine, "before_cursor_execute")
 def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
     """Record query start time."""
@@ -99,6 +134,12 @@ def init_query_profiler(app):
     threshold = get_slow_query_threshold()
     logger.info(f"[QueryProfiler] Slow query threshold: {threshold}s")
 
+    global _profile_log_queue
+    profile_log_path = os.getenv('QUERY_PROFILE_LOG')
+    if profile_log_path and _profile_log_queue is None:
+        _profile_log_queue = _start_profile_log_writer(profile_log_path)
+        logger.info(f"[QueryProfiler] Writing request profiles to {profile_log_path}")
+
     @app.before_request
     def start_query_profiling():
         """Reset stats at the start of each request."""
@@ -128,6 +169,11 @@ def init_query_profiler(app):
                 f"({db_percentage:.1f}% of {request_duration:.3f}s total)"
             )
 
+            # Per-query detail beyond the buffer cap was dropped
+            truncated = stats.query_count > len(stats.queries)
+            if truncated:
+                log_msg += f" [truncated: detail kept for last {len(stats.queries)}]"
+
             # Detect potential N+1 queries (many similar queries)
             if stats.query_count > 10:
                 logger.warning(f"{log_msg} - Possible N+1 pattern detected!")
@@ -141,6 +187,23 @@ def init_query_profiler(app):
                 response.headers['X-Query-Count'] = str(stats.query_count)
                 response.headers['X-Query-Time'] = f"{stats.total_time:.3f}s"
 
+            # Hand the summary to the background writer; never block the response
+            if _profile_log_queue is not None:
+                try:
+                    _profile_log_queue.put_nowait({
+                        'time': datetime.utcnow().isoformat(),
+                        'method': request.method,
+                        'path': request.path,
+                        'status': response.status_code,
+                        'duration': round(request_duration, 4),
+                        'query_count': stats.query_count,
+                        'query_time': round(stats.total_time, 4),
+                        'truncated': truncated,
+                        'queries': list(stats.queries),
+                    })
+                except queue.Full:
+                    logger.debug("[QueryProfiler] Profile log queue full, dropping entry")
+
         return response
 
     return True
@@ -11,17 +11,7 @@ import uuid
 import logging
 from flask import g, request
 
-
-class RequestIdFilter(logging.Filter):
-    """
-    Logging filter that adds request_id to log records.
-
-    This allows log formatters to include %(request_id)s in their format string.
-    """
-
-    def filter(self, record):
-        record.request_id = getattr(g, 'request_id', '-')
-        return True
+from ..utils.logging_config import request_id_var
 
 
 def generate_request_id():
@@ -52,11 +42,6 @@ def init_request_id_tracking(app):
     logger = logging.getLogger(__name__)
     logger.info('[RequestID] Request ID tracking enabled')
 
-    # Add request ID filter to root logger
-    request_id_filter = RequestIdFilter()
-    for handler in logging.getLogger().handlers:
-        handler.addFilter(request_id_filter)
-
     @app.before_request
     def set_request_id():
         """Generate or accept request ID at the start of each request."""
@@ -68,6 +53,8 @@ def init_request_id_tracking(app):
             request_id = generate_request_id()
 
         g.request_id = request_id
+        # Picked up by RequestIdFormatter when a record is emitted
+        g._request_id_token = request_id_var.set(request_id)
 
     @app.after_request
     def add_request_id_header(response):
@@ -77,4 +64,15 @@ def init_request_id_tracking(app):
             response.headers['X-Request-ID'] = request_id
         return response
 
+    @app.teardown_request
+    def reset_request_id(exc=None):
+        """Restore the logging request ID once the request is finished."""
+        token = g.pop('_request_id_token', None)
+        if token is not None:
+            try:
+                request_id_var.reset(token)
+            except ValueError:
+                # Token created in a different context; just clear it
+                request_id_var.set('-')
+
     return True
@@ -1,66 +1,125 @@
 """
 Database models for TradeUp platform.
 Store credit, rewards, and membership management for Shopify.
+
+Model classes are imported lazily (PEP 562) so CLI commands and workers only
+pay for the submodules they actually touch. All submodules are loaded before
+SQLAlchemy configures mappers, so string-based relationships still resolve.
 """
-from .tenant import Tenant, APIKey, BillingHistory
-from .member import MembershipTier, Member
-from .trade_in import TradeInBatch, TradeInItem
-from .trade_ledger import TradeInLedger
-from .points import PointsTransaction, StoreCreditTransaction
-from .partner_integration import PartnerIntegration, PartnerSyncLog
-from .tier_history import (
-    TierChangeLog,
-    TierEligibilityRule,
-    TierPromotion,
-    MemberPromoUsage,
-)
-from .promotions import (
-    Promotion,
-    StoreCreditLedger,
-    MemberCreditBalance,
-    BulkCreditOperation,
-    TierConfiguration,
-    PromotionType,
-    PromotionChannel,
-    CreditEventType,
-    TIER_CASHBACK,
-    seed_tier_configurations,
-)
-from .referral import Referral, ReferralProgram
-from .loyalty_points import (
-    # Enums
-    PointsTransactionType,
-    PointsEarnSource,
-    EarningRuleType,
-    RewardType,
-    RewardRedemptionStatus,
-    # Models
-    PointsBalance,
-    PointsLedger,
-    EarningRule,
-    Reward,
-    RewardRedemption,
-    PointsProgramConfig,
-    # Seeders
-    seed_points_program,
-    DEFAULT_EARNING_RULES,
-    DEFAULT_REWARDS,
-)
-from .cashback_campaign import CashbackCampaign, CashbackRedemption
-from .gamification import Badge, MemberBadge, MemberStreak, Milestone, MemberMilestone, MemberActivity
-from .guest_points import GuestPoints
-from .review_prompt import ReviewPrompt, ReviewPromptResponse
-from .support_ticket import SupportTicket, TicketStatus, TicketSatisfaction
-from .nudge_config import NudgeConfig, NudgeType, seed_nudge_configs, DEFAULT_NUDGE_TEMPLATES, DEFAULT_NUDGE_FREQUENCY
-from .nudge_sent import NudgeSent
-from .loyalty_page import LoyaltyPage, DEFAULT_PAGE_CONFIG
-from .loyalty_page_analytics import (
-    LoyaltyPageView,
-    LoyaltyPageEngagement,
-    LoyaltyPageCTAClick,
-    LoyaltyPageAnalyticsSummary,
-)
-from .widget import Widget, WidgetType, DEFAULT_WIDGET_CONFIGS, seed_widgets
+import importlib
+
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper
+
+
+# Public name -> submodule that defines it
+_MODULE_MAP = {
+    'Tenant': 'app.models.tenant',
+    'APIKey': 'app.models.tenant',
+    'BillingHistory': 'app.models.tenant',
+    'MembershipTier': 'app.models.member',
+    'Member': 'app.models.member',
+    'TradeInBatch': 'app.models.trade_in',
+    'TradeInItem': 'app.models.trade_in',
+    'TradeInLedger': 'app.models.trade_ledger',
+    'PointsTransaction': 'app.models.points',
+    'StoreCreditTransaction': 'app.models.points',
+    'PartnerIntegration': 'app.models.partner_integration',
+    'PartnerSyncLog': 'app.models.partner_integration',
+    'TierChangeLog': 'app.models.tier_history',
+    'TierEligibilityRule': 'app.models.tier_history',
+    'TierPromotion': 'app.models.tier_history',
+    'MemberPromoUsage': 'app.models.tier_history',
+    'Promotion': 'app.models.promotions',
+    'StoreCreditLedger': 'app.models.promotions',
+    'MemberCreditBalance': 'app.models.promotions',
+    'BulkCreditOperation': 'app.models.promotions',
+    'TierConfiguration': 'app.models.promotions',
+    'PromotionType': 'app.models.promotions',
+    'PromotionChannel': 'app.models.promotions',
+    'CreditEventType': 'app.models.promotions',
+    'TIER_CASHBACK': 'app.models.promotions',
+    'seed_tier_configurations': 'app.models.promotions',
+    'Referral': 'app.models.referral',
+    'ReferralProgram': 'app.models.referral',
+    'PointsTransactionType': 'app.models.loyalty_points',
+    'PointsEarnSource': 'app.models.loyalty_points',
+    'EarningRuleType': 'app.models.loyalty_points',
+    'RewardType': 'app.models.loyalty_points',
+    'RewardRedemptionStatus': 'app.models.loyalty_points',
+    'PointsBalance': 'app.models.loyalty_points',
+    'PointsLedger': 'app.models.loyalty_points',
+    'EarningRule': 'app.models.loyalty_points',
+    'Reward': 'app.models.loyalty_points',
+    'RewardRedemption': 'app.models.loyalty_points',
+    'PointsProgramConfig': 'app.models.loyalty_points',
+    'seed_points_program': 'app.models.loyalty_points',
+    'DEFAULT_EARNING_RULES': 'app.models.loyalty_points',
+    'DEFAULT_REWARDS': 'app.models.loyalty_points',
+    'CashbackCampaign': 'app.models.cashback_campaign',
+    'CashbackRedemption': 'app.models.cashback_campaign',
+    'Badge': 'app.models.gamification',
+    'MemberBadge': 'app.models.gamification',
+    'MemberStreak': 'app.models.gamification',
+    'Milestone': 'app.models.gamification',
+    'MemberMilestone': 'app.models.gamification',
+    'MemberActivity': 'app.models.gamification',
+    'GuestPoints': 'app.models.guest_points',
+    'ReviewPrompt': 'app.models.review_prompt',
+    'ReviewPromptResponse': 'app.models.review_prompt',
+    'SupportTicket': 'app.models.support_ticket',
+    'TicketStatus': 'app.models.support_ticket',
+    'TicketSatisfaction': 'app.models.support_ticket',
+    'NudgeConfig': 'app.models.nudge_config',
+    'NudgeType': 'app.models.nudge_config',
+    'seed_nudge_configs': 'app.models.nudge_config',
+    'DEFAULT_NUDGE_TEMPLATES': 'app.models.nudge_config',
+    'DEFAULT_NUDGE_FREQUENCY': 'app.models.nudge_config',
+    'NudgeSent': 'app.models.nudge_sent',
+    'NudgeCandidate': 'app.models.nudge_candidate',
+    'NudgeCandidateRefresh': 'app.models.nudge_candidate',
+    'LoyaltyPage': 'app.models.loyalty_page',
+    'DEFAULT_PAGE_CONFIG': 'app.models.loyalty_page',
+    'LoyaltyPageView': 'app.models.loyalty_page_analytics',
+    'LoyaltyPageEngagement': 'app.models.loyalty_page_analytics',
+    'LoyaltyPageCTAClick': 'app.models.loyalty_page_analytics',
+    'LoyaltyPageAnalyticsSummary': 'app.models.loyalty_page_analytics',
+    'Widget': 'app.models.widget',
+    'WidgetType': 'app.models.widget',
+    'DEFAULT_WIDGET_CONFIGS': 'app.models.widget',
+    'seed_widgets': 'app.models.widget',
+}
+
+
+def __getattr__(name):
+    module_path = _MODULE_MAP.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULE_MAP))
+
+
+def load_all_models():
+    """
+    Import every model submodule.
+
+    Needed wherever the full metadata must be registered up front
+    (db.create_all, Alembic autogenerate, mapper configuration).
+    """
+    for module_path in dict.fromkeys(_MODULE_MAP.values()):
+        importlib.import_module(module_path)
+
+
+@event.listens_for(Mapper, 'before_configured')
+def _load_models_before_configure():
+    # Relationships reference other models by name; make sure they exist
+    load_all_models()
+
 
 __all__ = [
     'Tenant',
@@ -136,6 +195,9 @@ __all__ = [
     'DEFAULT_NUDGE_FREQUENCY',
     # Nudge Sent
     'NudgeSent',
+    # Nudge Candidates
+    'NudgeCandidate',
+    'NudgeCandidateRefresh',
     # Loyalty Page Builder
     'LoyaltyPage',
     'DEFAULT_PAGE_CONFIG',
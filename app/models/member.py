@@ -3,6 +3,7 @@ Member and MembershipTier models.
 """
 from datetime import datetime, date
 from decimal import Decimal
+from sqlalchemy.ext.hybrid import hybrid_property
 from ..extensions import db
 
 
@@ -47,7 +48,10 @@ class MembershipTier(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
+    tenant = db.relationship('Tenant', back_populates='membership_tiers')
     members = db.relationship('Member', backref='tier', lazy='dynamic')
+    eligibility_rules = db.relationship('TierEligibilityRule', back_populates='tier')
+    promotions = db.relationship('TierPromotion', back_populates='tier')
 
     def __repr__(self):
         return f'<MembershipTier {self.name}>'
@@ -149,6 +153,9 @@ class Member(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
+    tenant = db.relationship('Tenant', back_populates='members')
+    tier_history = db.relationship('TierChangeLog', back_populates='member')
+    promo_usages = db.relationship('MemberPromoUsage', back_populates='member')
     trade_in_batches = db.relationship('TradeInBatch', backref='member', lazy='dynamic')
     referred_by = db.relationship('Member', remote_side='Member.id', backref='referrals', foreign_keys=[referred_by_id])
 
@@ -296,6 +303,22 @@ class Member(db.Model):
             return self.created_at.date()
         return date.today()
 
+    @hybrid_property
+    def anniversary_key(self) -> int:
+        """
+        Enrollment month and day packed as month * 100 + day (e.g. 229 for Feb 29).
+
+        Usable in queries, so anniversary lookups can match rows in SQL
+        against ix_members_tenant_anniversary instead of scanning members.
+        """
+        enrollment = self.get_enrollment_date()
+        return enrollment.month * 100 + enrollment.day
+
+    @anniversary_key.expression
+    def anniversary_key(cls):
+        enrollment = db.func.coalesce(cls.membership_start_date, db.func.date(cls.created_at))
+        return db.extract('month', enrollment) * 100 + db.extract('day', enrollment)
+
     def get_anniversary_date(self, for_year: int = None) -> date:
         """
         Calculate the member's anniversary date for a given year.
@@ -371,3 +394,13 @@ class Member(db.Model):
             years -= 1
 
         return max(0, years)
+
+
+# Expression index for "whose anniversary is on these days" lookups; declared
+# after the class because it needs the anniversary_key SQL expression.
+db.Index(
+    'ix_members_tenant_anniversary',
+    Member.tenant_id,
+    Member.anniversary_key,
+    postgresql_where=Member.status == 'active',
+)
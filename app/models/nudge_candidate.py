@@ -0,0 +1,55 @@
+"""
+NudgeCandidate Model
+
+Precomputed pending nudges per tenant, refreshed by a periodic scheduler job.
+Lets the pending-nudges endpoints read one indexed table instead of running
+every tenant-wide nudge scan on each request.
+"""
+
+from datetime import datetime
+from ..extensions import db
+from .types import JSONType
+
+
+class NudgeCandidate(db.Model):
+    """
+    A member who qualified for a nudge at the last candidate refresh.
+
+    Each refresh upserts a tenant's rows and deletes the older ones; there is
+    at most one row per (tenant, member, nudge_type). nudge_type holds
+    the pending-nudges group name (e.g. 'points_expiring', 'tier_upgrade_near')
+    and payload holds the entry exactly as the live scan returns it.
+    """
+    __tablename__ = 'nudge_candidates'
+
+    id = db.Column(db.Integer, primary_key=True)
+    tenant_id = db.Column(db.Integer, db.ForeignKey('tenants.id', ondelete='CASCADE'), nullable=False)
+    member_id = db.Column(db.Integer, db.ForeignKey('members.id', ondelete='CASCADE'), nullable=False)
+    nudge_type = db.Column(db.String(50), nullable=False)
+    payload = db.Column(JSONType, nullable=False)
+    generated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        db.Index('ix_nudge_candidates_tenant_type', 'tenant_id', 'nudge_type'),
+        db.Index('uq_nudge_candidates_tenant_member_type', 'tenant_id', 'member_id', 'nudge_type',
+                 unique=True),
+    )
+
+    def __repr__(self):
+        return f'<NudgeCandidate {self.nudge_type} for member {self.member_id}>'
+
+
+class NudgeCandidateRefresh(db.Model):
+    """
+    When a tenant's nudge candidates were last refreshed.
+
+    Kept apart from the candidate rows so a refresh that finds no candidates
+    still marks the tenant's (empty) snapshot as fresh.
+    """
+    __tablename__ = 'nudge_candidate_refreshes'
+
+    tenant_id = db.Column(db.Integer, db.ForeignKey('tenants.id', ondelete='CASCADE'), primary_key=True)
+    generated_at = db.Column(db.DateTime, nullable=False)
+
+    def __repr__(self):
+        return f'<NudgeCandidateRefresh tenant {self.tenant_id} at {self.generated_at}>'
@@ -6,7 +6,7 @@ Ensures members don't receive the same nudge type multiple times within a cooldo
 """
 
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Optional, List, Set
 import uuid
 from ..extensions import db
 
@@ -112,6 +112,78 @@ class NudgeSent(db.Model):
 
         return recent is not None
 
+    @classmethod
+    def recently_sent_member_ids(
+        cls,
+        tenant_id: int,
+        nudge_type: str,
+        member_ids: List[int],
+        cooldown_days: int = 7
+    ) -> Set[int]:
+        """
+        Get which of the given members were sent this nudge type recently.
+
+        Batch form of was_recently_sent for processing many members at once.
+
+        Args:
+            tenant_id: The tenant ID
+            nudge_type: The type of nudge (e.g., 'points_expiring')
+            member_ids: The member IDs to check
+            cooldown_days: Number of days before the same nudge can be sent again
+
+        Returns:
+            Set of member IDs still within the cooldown period
+        """
+        if not member_ids:
+            return set()
+
+        cutoff = datetime.utcnow() - timedelta(days=cooldown_days)
+
+        rows = db.session.query(cls.member_id).filter(
+            cls.tenant_id == tenant_id,
+            cls.member_id.in_(member_ids),
+            cls.nudge_type == nudge_type,
+            cls.sent_at >= cutoff
+        ).distinct().all()
+
+        return {member_id for (member_id,) in rows}
+
+    @classmethod
+    def sent_row(
+        cls,
+        tenant_id: int,
+        member_id: int,
+        nudge_type: str,
+        context_data: Optional[dict] = None,
+        delivery_method: str = 'email'
+    ) -> dict:
+        """
+        Build the column values for a sent nudge without writing it.
+
+        Args:
+            tenant_id: The tenant ID
+            member_id: The member ID
+            nudge_type: The type of nudge sent
+            context_data: Optional context data about what triggered the nudge
+            delivery_method: How the nudge was delivered (email, sms, push)
+
+        Returns:
+            Dict of column values, including a fresh tracking ID
+        """
+        # Generate unique tracking ID for open/click/conversion tracking
+        tracking_id = f"nudge_{tenant_id}_{member_id}_{nudge_type}_{uuid.uuid4().hex[:12]}"
+
+        return {
+            'tenant_id': tenant_id,
+            'member_id': member_id,
+            'nudge_type': nudge_type,
+            'context_data': context_data or {},
+            'delivery_method': delivery_method,
+            'delivery_status': 'sent',
+            'sent_at': datetime.utcnow(),
+            'tracking_id': tracking_id,
+        }
+
     @classmethod
     def record_sent(
         cls,
@@ -134,23 +206,31 @@ class NudgeSent(db.Model):
         Returns:
             The created NudgeSent record
         """
-        # Generate unique tracking ID for open/click/conversion tracking
-        tracking_id = f"nudge_{tenant_id}_{member_id}_{nudge_type}_{uuid.uuid4().hex[:12]}"
-
-        nudge_sent = cls(
+        nudge_sent = cls(**cls.sent_row(
             tenant_id=tenant_id,
             member_id=member_id,
             nudge_type=nudge_type,
-            context_data=context_data or {},
+            context_data=context_data,
             delivery_method=delivery_method,
-            delivery_status='sent',
-            sent_at=datetime.utcnow(),
-            tracking_id=tracking_id,
-        )
+        ))
         db.session.add(nudge_sent)
         db.session.commit()
         return nudge_sent
 
+    @classmethod
+    def record_sent_many(cls, rows: List[dict]) -> None:
+        """
+        Record many sent nudges with a single multi-row insert.
+
+        Args:
+            rows: Column values built with sent_row
+        """
+        if not rows:
+            return
+
+        db.session.execute(db.insert(cls), rows)
+        db.session.commit()
+
     @classmethod
     def get_by_tracking_id(cls, tracking_id: str) -> Optional['NudgeSent']:
         """Get a nudge sent record by its tracking ID."""
@@ -1,9 +1,12 @@
 """
 Tenant model for multi-tenant SaaS.
 """
-from datetime import datetime
+import hmac
+from sqlalchemy.orm import validates
 from ..extensions import db
-from ..utils.encryption import encrypt_value, decrypt_value, is_encrypted
+from ..utils.money import to_cents
+from ..utils.serialization import make_to_dict
+from .types import JSONType, EncryptedText, utcnow
 
 
 class Tenant(db.Model):
@@ -19,34 +22,9 @@ class Tenant(db.Model):
 
     # Shopify integration
     shopify_domain = db.Column(db.String(255))
-    _shopify_access_token = db.Column('shopify_access_token', db.Text)  # Encrypted at rest
+    shopify_access_token = db.Column(EncryptedText)  # Encrypted at rest
     webhook_secret = db.Column(db.String(100))
 
-    @property
-    def shopify_access_token(self) -> str:
-        """Get decrypted access token."""
-        if not self._shopify_access_token:
-            return None
-        # Handle legacy unencrypted values (starts with 'shpat_')
-        if self._shopify_access_token.startswith('shpat_'):
-            return self._shopify_access_token
-        return decrypt_value(self._shopify_access_token)
-
-    @shopify_access_token.setter
-    def shopify_access_token(self, value: str):
-        """Set and encrypt access token."""
-        if value is None:
-            self._shopify_access_token = None
-        elif value.startswith('shpat_'):
-            # Encrypt new tokens
-            self._shopify_access_token = encrypt_value(value)
-        elif is_encrypted(value):
-            # Already encrypted, store as-is
-            self._shopify_access_token = value
-        else:
-            # Encrypt any other value
-            self._shopify_access_token = encrypt_value(value)
-
     # Shopify Billing (App Store)
     shopify_subscription_id = db.Column(db.String(255))  # gid://shopify/AppSubscription/...
     subscription_plan = db.Column(db.String(50), default='starter')  # starter, growth, pro
@@ -55,6 +33,7 @@ class Tenant(db.Model):
     trial_ends_at = db.Column(db.DateTime)
     current_period_end = db.Column(db.DateTime)
     monthly_price = db.Column(db.Numeric(10, 2))
+    monthly_price_cents = db.Column(db.Integer)  # Mirrors monthly_price; kept in sync by validator
 
     # Usage limits based on plan
     max_members = db.Column(db.Integer, default=100)
@@ -64,32 +43,40 @@ class Tenant(db.Model):
     scheduled_plan_change = db.Column(db.String(50))  # Plan key to switch to
     scheduled_plan_change_date = db.Column(db.DateTime)  # When the change takes effect
 
-    # Settings (JSON for flexibility)
-    settings = db.Column(db.JSON, default=dict)
+    # Settings (JSON for flexibility); empty object filled in by the DB
+    settings = db.Column(JSONType, server_default=db.text("'{}'"))
 
     is_active = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
+    updated_at = db.Column(db.DateTime, server_default=utcnow(), onupdate=utcnow())
 
     # Relationships
-    api_keys = db.relationship('APIKey', backref='tenant', lazy='dynamic')
-    membership_tiers = db.relationship('MembershipTier', backref='tenant', lazy='dynamic')
-    members = db.relationship('Member', backref='tenant', lazy='dynamic')
+    # Plain lazy loads (not 'dynamic') so callers can opt into selectinload()
+    api_keys = db.relationship('APIKey', back_populates='tenant')
+    membership_tiers = db.relationship('MembershipTier', back_populates='tenant')
+    members = db.relationship('Member', back_populates='tenant')
+    billing_history = db.relationship('BillingHistory', back_populates='tenant')
 
     def __repr__(self):
         return f'<Tenant {self.shop_slug}>'
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'shop_name': self.shop_name,
-            'shop_slug': self.shop_slug,
-            'shopify_domain': self.shopify_domain,
-            'subscription_plan': self.subscription_plan,
-            'subscription_status': self.subscription_status,
-            'subscription_active': self.subscription_active,
-            'is_active': self.is_active
-        }
+    @validates('monthly_price')
+    def _sync_monthly_price_cents(self, key, value):
+        self.monthly_price_cents = to_cents(value)
+        return value
+
+    _TO_DICT_COLUMNS = (
+        'id',
+        'shop_name',
+        'shop_slug',
+        'shopify_domain',
+        'subscription_plan',
+        'subscription_status',
+        'subscription_active',
+        'is_active',
+    )
+    _TO_DICT_FIELDS = tuple((c, f'd.get({c!r})') for c in _TO_DICT_COLUMNS)
+    to_dict = make_to_dict(_TO_DICT_FIELDS, columns=_TO_DICT_COLUMNS)
 
 
 class APIKey(db.Model):
@@ -105,25 +92,45 @@ class APIKey(db.Model):
     key_prefix = db.Column(db.String(10), nullable=False)  # First 8 chars for lookup
     name = db.Column(db.String(100))  # 'Employee Dashboard Key'
 
-    permissions = db.Column(db.JSON, default=['read'])  # ['read', 'write', 'admin']
+    permissions = db.Column(JSONType, default=['read'])  # ['read', 'write', 'admin']
 
     last_used_at = db.Column(db.DateTime)
     expires_at = db.Column(db.DateTime)
     is_active = db.Column(db.Boolean, default=True)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
+
+    # Relationships
+    tenant = db.relationship('Tenant', back_populates='api_keys')
+
+    __table_args__ = (
+        # Containment lookups: permissions @> '["admin"]'
+        db.Index('ix_api_keys_permissions', 'permissions', postgresql_using='gin'),
+    )
 
     def __repr__(self):
         return f'<APIKey {self.key_prefix}...>'
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'key_prefix': self.key_prefix,
-            'name': self.name,
-            'permissions': self.permissions,
-            'last_used_at': self.last_used_at.isoformat() if self.last_used_at else None,
-            'is_active': self.is_active
-        }
+    @staticmethod
+    def verify_prefix(candidate: str, stored: str) -> bool:
+        """
+        Compare a presented key prefix with a stored one in constant time.
+
+        Callers must use this instead of == so auth timing does not leak
+        how many leading characters matched.
+        """
+        if candidate is None or stored is None:
+            return False
+        return hmac.compare_digest(candidate.encode(), stored.encode())
+
+    _TO_DICT_FIELDS = (
+        ('id', 'self.id'),
+        ('key_prefix', 'self.key_prefix'),
+        ('name', 'self.name'),
+        ('permissions', 'self.permissions'),
+        ('last_used_at', 'self.last_used_at.isoformat() if self.last_used_at else None'),
+        ('is_active', 'self.is_active'),
+    )
+    to_dict = make_to_dict(_TO_DICT_FIELDS)
 
 
 class BillingHistory(db.Model):
@@ -142,6 +149,7 @@ class BillingHistory(db.Model):
     plan_from = db.Column(db.String(50))
     plan_to = db.Column(db.String(50))
     amount = db.Column(db.Numeric(10, 2))
+    amount_cents = db.Column(db.BigInteger)  # Mirrors amount; kept in sync by validator
     currency = db.Column(db.String(3), default='USD')
 
     # Shopify reference
@@ -149,24 +157,34 @@ class BillingHistory(db.Model):
     shopify_subscription_id = db.Column(db.String(255))
 
     # Extra data
-    extra_data = db.Column(db.JSON, default=dict)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    extra_data = db.Column(JSONType, server_default=db.text("'{}'"))
+    created_at = db.Column(db.DateTime, server_default=utcnow())
 
     # Relationship
-    tenant = db.relationship('Tenant', backref=db.backref('billing_history', lazy='dynamic'))
+    tenant = db.relationship('Tenant', back_populates='billing_history')
+
+    __table_args__ = (
+        # "Latest events for tenant" history reads
+        db.Index('ix_billing_history_tenant_created', 'tenant_id', 'created_at'),
+    )
 
     def __repr__(self):
         return f'<BillingHistory {self.event_type} for tenant {self.tenant_id}>'
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'event_type': self.event_type,
-            'event_description': self.event_description,
-            'plan_from': self.plan_from,
-            'plan_to': self.plan_to,
-            'amount': float(self.amount) if self.amount else None,
-            'currency': self.currency,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'extra_data': self.extra_data
-        }
+    @validates('amount')
+    def _sync_amount_cents(self, key, value):
+        self.amount_cents = to_cents(value)
+        return value
+
+    _TO_DICT_FIELDS = (
+        ('id', 'self.id'),
+        ('event_type', 'self.event_type'),
+        ('event_description', 'self.event_description'),
+        ('plan_from', 'self.plan_from'),
+        ('plan_to', 'self.plan_to'),
+        ('amount', 'self.amount_cents / 100 if self.amount_cents else None'),
+        ('currency', 'self.currency'),
+        ('created_at', 'self.created_at'),
+        ('extra_data', 'self.extra_data'),
+    )
+    to_dict = make_to_dict(_TO_DICT_FIELDS)
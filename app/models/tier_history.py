@@ -6,7 +6,12 @@ Supports compliance, analytics, and debugging tier assignment issues.
 """
 from datetime import datetime
 from decimal import Decimal
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import validates
 from ..extensions import db
+from ..utils.money import to_cents
+from ..utils.serialization import make_to_dict
+from .types import JSONType, utcnow
 
 
 class TierChangeLog(db.Model):
@@ -48,38 +53,123 @@ class TierChangeLog(db.Model):
 
     # Additional context
     reason = db.Column(db.Text)  # Human-readable reason
-    extra_data = db.Column(db.JSON, default=dict)  # Additional structured data
+    extra_data = db.Column(JSONType, server_default=db.text("'{}'"))  # Additional structured data
 
     # Expiration tracking
     expires_at = db.Column(db.DateTime)  # When this tier assignment expires
 
     # Audit fields
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime, server_default=utcnow(), nullable=False)
     created_by = db.Column(db.String(100))  # User or system that made change
     ip_address = db.Column(db.String(45))  # For security auditing
 
     # Relationships
-    member = db.relationship('Member', backref=db.backref('tier_history', lazy='dynamic'))
-    previous_tier = db.relationship('MembershipTier', foreign_keys=[previous_tier_id])
-    new_tier = db.relationship('MembershipTier', foreign_keys=[new_tier_id])
+    member = db.relationship('Member', back_populates='tier_history')
+    # Read previous_tier_name/new_tier_name instead; audit views that need the
+    # live tier must joinedload() these explicitly.
+    previous_tier = db.relationship('MembershipTier', foreign_keys=[previous_tier_id], lazy='raise')
+    new_tier = db.relationship('MembershipTier', foreign_keys=[new_tier_id], lazy='raise')
+
+    # On PostgreSQL the table is hash-partitioned by tenant_id with a
+    # (id, tenant_id) primary key (migration q2r3s4t5u6v7); id alone stays
+    # the ORM identity.
+    __table_args__ = (
+        # History reads are "latest N for tenant" or "timeline for member"
+        db.Index('ix_tier_change_logs_tenant_created', 'tenant_id', 'created_at'),
+        db.Index('ix_tier_change_logs_member_created', 'member_id', 'created_at'),
+    )
 
     def __repr__(self):
         return f'<TierChangeLog {self.id}: {self.previous_tier_name} -> {self.new_tier_name}>'
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'member_id': self.member_id,
-            'previous_tier': self.previous_tier_name,
-            'new_tier': self.new_tier_name,
-            'change_type': self.change_type,
-            'source_type': self.source_type,
-            'source_reference': self.source_reference,
-            'reason': self.reason,
-            'expires_at': self.expires_at.isoformat() if self.expires_at else None,
-            'created_at': self.created_at.isoformat(),
-            'created_by': self.created_by
-        }
+    @classmethod
+    def bulk_log(cls, session, changes, batch_size=500):
+        """
+        Insert many tier change log rows in batched round-trips.
+
+        Uses INSERT ... RETURNING with executemany, so a sweep touching
+        thousands of members issues one statement per batch instead of one
+        per row. Does not commit.
+
+        Args:
+            session: SQLAlchemy session
+            changes: List of dicts of TierChangeLog column values
+            batch_size: Rows per INSERT round-trip
+
+        Returns:
+            List of inserted ids, in input order
+        """
+        ids = []
+        stmt = db.insert(cls).returning(cls.id, sort_by_parameter_order=True)
+        for start in range(0, len(changes), batch_size):
+            batch = changes[start:start + batch_size]
+            ids.extend(session.scalars(stmt, batch).all())
+        return ids
+
+    @classmethod
+    def export_rows(cls, session, tenant_id, since=None, batch_size=1000):
+        """
+        Stream a tenant's tier change log for audit export.
+
+        Uses a Core select with yield_per instead of hydrating ORM objects,
+        and formats timestamps as ISO strings in the database, so each
+        yielded row is a plain mapping ready to write out.
+
+        Args:
+            session: SQLAlchemy session
+            tenant_id: Tenant to export
+            since: Optional datetime lower bound on created_at
+            batch_size: Rows fetched per round-trip
+
+        Yields:
+            Row mappings with to_dict-compatible keys
+        """
+        dialect = session.get_bind().dialect.name
+        if dialect == 'postgresql':
+            iso_format = 'YYYY-MM-DD"T"HH24:MI:SS'
+            expires_at = db.func.to_char(cls.expires_at, iso_format)
+            created_at = db.func.to_char(cls.created_at, iso_format)
+        elif dialect == 'sqlite':
+            iso_format = '%Y-%m-%dT%H:%M:%S'
+            expires_at = db.func.strftime(iso_format, cls.expires_at)
+            created_at = db.func.strftime(iso_format, cls.created_at)
+        else:
+            expires_at, created_at = cls.expires_at, cls.created_at
+
+        stmt = db.select(
+            cls.id,
+            cls.member_id,
+            cls.previous_tier_name.label('previous_tier'),
+            cls.new_tier_name.label('new_tier'),
+            cls.change_type,
+            cls.source_type,
+            cls.source_reference,
+            cls.reason,
+            expires_at.label('expires_at'),
+            created_at.label('created_at'),
+            cls.created_by,
+        ).where(cls.tenant_id == tenant_id)
+        if since is not None:
+            stmt = stmt.where(cls.created_at >= since)
+        stmt = stmt.order_by(cls.created_at.desc()).execution_options(yield_per=batch_size)
+
+        for row in session.execute(stmt):
+            yield row._mapping
+
+    _TO_DICT_FIELDS = (
+        ('id', 'self.id'),
+        ('member_id', 'self.member_id'),
+        ('previous_tier', 'self.previous_tier_name'),
+        ('new_tier', 'self.new_tier_name'),
+        ('change_type', 'self.change_type'),
+        ('source_type', 'self.source_type'),
+        ('source_reference', 'self.source_reference'),
+        ('reason', 'self.reason'),
+        ('expires_at', 'self.expires_at'),
+        ('created_at', 'self.created_at'),
+        ('created_by', 'self.created_by'),
+    )
+    to_dict = make_to_dict(_TO_DICT_FIELDS)
 
 
 class TierEligibilityRule(db.Model):
@@ -113,6 +203,9 @@ class TierEligibilityRule(db.Model):
     threshold_operator = db.Column(db.String(10), default='>=')
     # Values: '>=', '>', '<=', '<', '==', 'between'
     threshold_max = db.Column(db.Numeric(12, 2))  # For 'between' operator
+    # Integer-cent mirrors of the thresholds; kept in sync by validator
+    threshold_value_cents = db.Column(db.BigInteger)
+    threshold_max_cents = db.Column(db.BigInteger)
 
     # Time window
     time_window_days = db.Column(db.Integer)  # NULL = all-time
@@ -129,31 +222,50 @@ class TierEligibilityRule(db.Model):
     is_active = db.Column(db.Boolean, default=True)
 
     # Audit
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
+    updated_at = db.Column(db.DateTime, server_default=utcnow(), onupdate=utcnow())
 
     # Relationships
-    tier = db.relationship('MembershipTier', backref='eligibility_rules')
+    tier = db.relationship('MembershipTier', back_populates='eligibility_rules')
 
     def __repr__(self):
         return f'<TierEligibilityRule {self.name}: {self.metric} {self.threshold_operator} {self.threshold_value}>'
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'tier_id': self.tier_id,
-            'name': self.name,
-            'description': self.description,
-            'rule_type': self.rule_type,
-            'metric': self.metric,
-            'threshold_value': float(self.threshold_value),
-            'threshold_operator': self.threshold_operator,
-            'time_window_days': self.time_window_days,
-            'rolling_window': self.rolling_window,
-            'action': self.action,
-            'priority': self.priority,
-            'is_active': self.is_active
-        }
+    @validates('threshold_value', 'threshold_max')
+    def _sync_threshold_cents(self, key, value):
+        setattr(self, f'{key}_cents', to_cents(value))
+        return value
+
+    @property
+    def threshold_cents(self):
+        """threshold_value in cents, converted on the fly for rows written without the validator."""
+        if self.threshold_value_cents is not None:
+            return self.threshold_value_cents
+        return to_cents(self.threshold_value)
+
+    @property
+    def max_threshold_cents(self):
+        """threshold_max in cents, with the same fallback as threshold_cents."""
+        if self.threshold_max_cents is not None:
+            return self.threshold_max_cents
+        return to_cents(self.threshold_max)
+
+    _TO_DICT_FIELDS = (
+        ('id', 'self.id'),
+        ('tier_id', 'self.tier_id'),
+        ('name', 'self.name'),
+        ('description', 'self.description'),
+        ('rule_type', 'self.rule_type'),
+        ('metric', 'self.metric'),
+        ('threshold_value', 'self.threshold_cents / 100 if self.threshold_cents is not None else None'),
+        ('threshold_operator', 'self.threshold_operator'),
+        ('time_window_days', 'self.time_window_days'),
+        ('rolling_window', 'self.rolling_window'),
+        ('action', 'self.action'),
+        ('priority', 'self.priority'),
+        ('is_active', 'self.is_active'),
+    )
+    to_dict = make_to_dict(_TO_DICT_FIELDS)
 
 
 class TierPromotion(db.Model):
@@ -187,8 +299,8 @@ class TierPromotion(db.Model):
     # Targeting
     target_type = db.Column(db.String(30), default='all')
     # Values: 'all', 'new_members', 'tier_specific', 'tagged', 'manual'
-    target_tiers = db.Column(db.JSON)  # List of tier IDs that can use this
-    target_tags = db.Column(db.JSON)  # Customer tags that qualify
+    target_tiers = db.Column(JSONType)  # List of tier IDs that can use this
+    target_tags = db.Column(JSONType)  # Customer tags that qualify
 
     # Limits
     max_uses = db.Column(db.Integer)  # NULL = unlimited
@@ -204,16 +316,49 @@ class TierPromotion(db.Model):
     is_active = db.Column(db.Boolean, default=True)
 
     # Audit
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, server_default=utcnow())
     created_by = db.Column(db.String(100))
 
     # Relationships
-    tier = db.relationship('MembershipTier', backref='promotions')
+    tier = db.relationship('MembershipTier', back_populates='promotions')
+    usages = db.relationship('MemberPromoUsage', back_populates='promotion')
+
+    __table_args__ = (
+        db.Index('ix_tier_promotions_code', 'tenant_id', 'code'),
+        db.Index('ix_tier_promotions_active', 'tenant_id', 'is_active', 'starts_at', 'ends_at'),
+        # Partial indexes: most promotions are inactive at any given time
+        db.Index(
+            'ix_tier_promotions_active_window', 'tenant_id', 'ends_at',
+            postgresql_where=db.text('is_active = true'),
+        ),
+        db.Index(
+            'ix_tier_promotions_active_code', 'tenant_id', 'code',
+            postgresql_where=db.text('is_active = true'),
+        ),
+        # Containment lookups: target_tags @> '["vip"]'
+        db.Index('ix_tier_promotions_target_tags', 'target_tags', postgresql_using='gin'),
+    )
 
     def __repr__(self):
         return f'<TierPromotion {self.name}>'
 
-    @property
+    @classmethod
+    def active_for_tenant(cls, tenant_id, now=None):
+        """
+        Query promotions whose active window covers ``now``.
+
+        The window check runs in SQL (served by ix_tier_promotions_active_window)
+        instead of loading rows and evaluating is_currently_active in Python.
+        """
+        now = now or datetime.utcnow()
+        return cls.query.filter(
+            cls.tenant_id == tenant_id,
+            cls.is_active == True,
+            cls.starts_at <= now,
+            cls.ends_at >= now
+        )
+
+    @hybrid_property
     def is_currently_active(self):
         """Check if promotion is currently running."""
         now = datetime.utcnow()
@@ -223,22 +368,34 @@ class TierPromotion(db.Model):
             (self.max_uses is None or self.current_uses < self.max_uses)
         )
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'tier_id': self.tier_id,
-            'name': self.name,
-            'code': self.code,
-            'description': self.description,
-            'starts_at': self.starts_at.isoformat(),
-            'ends_at': self.ends_at.isoformat(),
-            'grant_duration_days': self.grant_duration_days,
-            'target_type': self.target_type,
-            'max_uses': self.max_uses,
-            'current_uses': self.current_uses,
-            'is_active': self.is_active,
-            'is_currently_active': self.is_currently_active
-        }
+    @is_currently_active.expression
+    def is_currently_active(cls):
+        """SQL form, usable as TierPromotion.query.filter(TierPromotion.is_currently_active)."""
+        # Columns hold naive UTC, so compare against datetime.utcnow() rather than func.now()
+        now = datetime.utcnow()
+        return db.and_(
+            cls.is_active == True,
+            cls.starts_at <= now,
+            cls.ends_at >= now,
+            db.or_(cls.max_uses.is_(None), cls.current_uses < cls.max_uses)
+        )
+
+    _TO_DICT_FIELDS = (
+        ('id', 'self.id'),
+        ('tier_id', 'self.tier_id'),
+        ('name', 'self.name'),
+        ('code', 'self.code'),
+        ('description', 'self.description'),
+        ('starts_at', 'self.starts_at'),
+        ('ends_at', 'self.ends_at'),
+        ('grant_duration_days', 'self.grant_duration_days'),
+        ('target_type', 'self.target_type'),
+        ('max_uses', 'self.max_uses'),
+        ('current_uses', 'self.current_uses'),
+        ('is_active', 'self.is_active'),
+        ('is_currently_active', 'self.is_currently_active'),
+    )
+    to_dict = make_to_dict(_TO_DICT_FIELDS)
 
 
 class MemberPromoUsage(db.Model):
@@ -253,7 +410,7 @@ class MemberPromoUsage(db.Model):
     promotion_id = db.Column(db.Integer, db.ForeignKey('tier_promotions.id'), nullable=False)
 
     # When the promo was applied
-    applied_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    applied_at = db.Column(db.DateTime, server_default=utcnow(), nullable=False)
 
     # Previous tier (to revert to if needed)
     previous_tier_id = db.Column(db.Integer, db.ForeignKey('membership_tiers.id'))
@@ -268,10 +425,15 @@ class MemberPromoUsage(db.Model):
     reverted_at = db.Column(db.DateTime)
 
     # Relationships
-    member = db.relationship('Member', backref=db.backref('promo_usages', lazy='dynamic'))
-    promotion = db.relationship('TierPromotion', backref='usages')
+    member = db.relationship('Member', back_populates='promo_usages')
+    promotion = db.relationship('TierPromotion', back_populates='usages')
     previous_tier = db.relationship('MembershipTier')
 
     __table_args__ = (
         db.UniqueConstraint('member_id', 'promotion_id', name='uq_member_promotion'),
+        # Covering index for "active promos for member" (index-only on PostgreSQL)
+        db.Index(
+            'ix_member_promo_usages_member_status', 'member_id', 'status',
+            postgresql_include=['promotion_id', 'expires_at'],
+        ),
     )
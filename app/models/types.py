@@ -0,0 +1,65 @@
+"""
+Shared column types for TradeUp models.
+"""
+from sqlalchemy import JSON, Text, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.types import TypeDecorator
+
+from ..utils.encryption import (
+    encrypt_value, decrypt_value, ENCRYPTED_PREFIX, FERNET_MIN_TOKEN_LENGTH
+)
+
+# Binary JSON on PostgreSQL (indexable, no re-parse on read); plain JSON
+# elsewhere so SQLite-backed tests keep working. Using JSONB as the base type
+# gives column expressions the PostgreSQL operators (.astext, .contains).
+JSONType = JSONB().with_variant(JSON(), 'sqlite')
+
+
+class EncryptedText(TypeDecorator):
+    """
+    Text column encrypted at rest with Fernet.
+
+    Python code always sees plaintext; encryption happens when the value is
+    bound and decryption when the row is loaded. Values that already look
+    encrypted are stored as-is. Legacy plaintext tokens (anything shorter
+    than a Fernet token, or starting with 'shpat_') are returned unchanged
+    without attempting a decrypt.
+    """
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or value.startswith(ENCRYPTED_PREFIX):
+            return value
+        return encrypt_value(value)
+
+    def process_result_value(self, value, dialect):
+        if not value or len(value) < FERNET_MIN_TOKEN_LENGTH or value.startswith('shpat_'):
+            return value
+        return decrypt_value(value)
+
+
+class utcnow(FunctionElement):
+    """
+    Current UTC time as a naive timestamp, evaluated by the database.
+
+    Timestamp columns store naive UTC (matching datetime.utcnow), so plain
+    now() is not enough on PostgreSQL, where it follows the session time zone.
+
+    Usage:
+        created_at = db.Column(db.DateTime, server_default=utcnow())
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    return 'CURRENT_TIMESTAMP'
+
+
+@compiles(utcnow, 'postgresql')
+def _utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
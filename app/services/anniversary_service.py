@@ -4,16 +4,47 @@ Anniversary Rewards Service
 Handles anniversary tracking and automatic reward issuance for membership anniversaries.
 """
 
-from datetime import date, datetime
-from decimal import Decimal
+import calendar
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 
 from flask import current_app
+from sqlalchemy import case, func, insert
+from sqlalchemy.orm import load_only, selectinload
 
 from app import db
 from app.models.member import Member
+from app.models.points import PointsTransaction
 from app.models.promotions import StoreCreditLedger, CreditEventType
-from app.models.tenant import Tenant
+from app.services.tenant_settings_service import get_cached_tenant_settings
+from app.utils.money import to_decimal
+from app.utils.serialization import serialization_load_options
+
+
+# Ordinal suffix for every value of n % 100 ('st', 'nd', 'rd', except 11-13)
+_ORDINAL_SUFFIXES = tuple(
+    'th' if 11 <= i <= 13 else {1: 'st', 2: 'nd', 3: 'rd'}.get(i % 10, 'th')
+    for i in range(100)
+)
+
+# Columns read by the read-only anniversary listings (identity plus the
+# enrollment date inputs). Reward issuance mutates members and loads them fully.
+_ANNIVERSARY_COLUMNS = (
+    Member.id,
+    Member.member_number,
+    Member.name,
+    Member.email,
+    Member.status,
+    Member.membership_start_date,
+    Member.created_at,
+)
+
+
+@lru_cache(maxsize=8)
+def _date_stamp(day: date) -> str:
+    """YYYYMMDD stamp for discount codes; one value per run, so cached."""
+    return f"{day.year:04d}{day.month:02d}{day.day:02d}"
 
 
 class AnniversaryService:
@@ -29,24 +60,30 @@ class AnniversaryService:
         """
         self.tenant_id = tenant_id
         self._settings = settings
+        self._anniversary_settings = None
 
     @property
     def settings(self) -> Dict:
-        """Get tenant settings, loading from DB if not provided."""
+        """Get tenant settings, loading from the settings cache if not provided."""
         if self._settings is None:
-            tenant = Tenant.query.get(self.tenant_id)
-            self._settings = tenant.settings if tenant else {}
+            self._settings = get_cached_tenant_settings(self.tenant_id)
         return self._settings
 
     def get_anniversary_settings(self) -> Dict[str, Any]:
         """
         Get anniversary reward settings for the tenant.
 
+        Built once per service instance; a reward run consults it for every
+        member. Callers must treat the returned dict as read-only.
+
         Returns:
             Dict with anniversary reward configuration.
         """
+        if self._anniversary_settings is not None:
+            return self._anniversary_settings
+
         anniversary_settings = self.settings.get('anniversary', {})
-        return {
+        self._anniversary_settings = {
             'enabled': anniversary_settings.get('enabled', False),
             'reward_type': anniversary_settings.get('reward_type', 'points'),  # points, credit, or discount_code
             'reward_amount': anniversary_settings.get('reward_amount', 100),  # Default 100 points or $10
@@ -55,6 +92,7 @@ class AnniversaryService:
             'tiered_rewards_enabled': anniversary_settings.get('tiered_rewards_enabled', False),
             'tiered_rewards': anniversary_settings.get('tiered_rewards', {}),
         }
+        return self._anniversary_settings
 
     def get_reward_amount_for_year(self, anniversary_year: int) -> float:
         """
@@ -86,29 +124,25 @@ class AnniversaryService:
         # Fall back to default amount if year not configured
         return settings['reward_amount']
 
-    def get_todays_anniversaries(self) -> List[Member]:
+    def get_todays_anniversaries(self, today: Optional[date] = None) -> List[Member]:
         """
         Get all members whose anniversary is today.
 
+        Args:
+            today: Day to match (defaults to date.today())
+
         Returns:
             List of Member objects with anniversary today.
         """
-        today = date.today()
+        today = today or date.today()
 
-        # Query all active members for this tenant
-        members = Member.query.filter(
+        # Match enrollment month/day in SQL (ix_members_tenant_anniversary)
+        return Member.query.filter(
             Member.tenant_id == self.tenant_id,
-            Member.status == 'active'
+            Member.status == 'active',
+            Member.anniversary_key.in_(anniversary_keys_for(today))
         ).all()
 
-        # Filter to those with anniversary today
-        anniversary_members = [
-            member for member in members
-            if member.is_anniversary_today()
-        ]
-
-        return anniversary_members
-
     def get_members_with_upcoming_anniversaries(self, days_ahead: int = 7) -> List[Dict[str, Any]]:
         """
         Get members with anniversaries in the next N days.
@@ -122,57 +156,88 @@ class AnniversaryService:
         today = date.today()
         upcoming = []
 
-        members = Member.query.filter(
-            Member.tenant_id == self.tenant_id,
-            Member.status == 'active'
-        ).all()
-
-        for member in members:
+        # Only fetch members whose anniversary falls inside the window
+        for member in self._upcoming_query(anniversary_window(today, days_ahead)).all():
             days_until = member.days_until_anniversary()
             if 0 <= days_until <= days_ahead:
-                # Calculate anniversary year (how many years they'll have been a member)
-                anniversary_year = member.membership_years()
-                if days_until > 0:
-                    # If anniversary hasn't happened yet, add 1
-                    anniversary_year += 1
-
-                upcoming.append({
-                    'member': member.to_dict(),
-                    'member_id': member.id,
-                    'enrollment_date': member.get_enrollment_date().isoformat(),
-                    'anniversary_date': member.get_anniversary_date(today.year if days_until > 0 or member.is_anniversary_today() else today.year + 1).isoformat(),
-                    'days_until': days_until,
-                    'anniversary_year': anniversary_year,
-                    'already_rewarded': member.last_anniversary_reward_year == today.year if hasattr(member, 'last_anniversary_reward_year') and member.last_anniversary_reward_year else False,
-                })
+                upcoming.append(self._upcoming_entry(member, days_until, today))
 
         # Sort by days until anniversary
         upcoming.sort(key=lambda x: x['days_until'])
         return upcoming
 
-    def get_anniversary_year(self, member: Member) -> int:
+    def _upcoming_query(self, window: Dict[int, int]):
+        """Active members whose anniversary_key is in the window, ready for _upcoming_entry."""
+        return Member.query.options(
+            load_only(*_ANNIVERSARY_COLUMNS, Member.tier_id, Member.last_anniversary_reward_year),
+            *serialization_load_options(selectinload(Member.tier))
+        ).filter(
+            Member.tenant_id == self.tenant_id,
+            Member.status == 'active',
+            Member.anniversary_key.in_(window)
+        )
+
+    @staticmethod
+    def _upcoming_entry(member: Member, days_until: int, today: date) -> Dict[str, Any]:
+        """Build one upcoming-anniversary entry."""
+        # Calculate anniversary year (how many years they'll have been a member)
+        anniversary_year = member.membership_years()
+        if days_until > 0:
+            # If anniversary hasn't happened yet, add 1
+            anniversary_year += 1
+
+        return {
+            # Only the fields the anniversary views use; full
+            # to_dict() costs extra queries per member (trade-ins).
+            'member': {
+                'id': member.id,
+                'member_number': member.member_number,
+                'name': member.name,
+                'email': member.email,
+                'tier': member.tier.name if member.tier else None,
+            },
+            'member_id': member.id,
+            'enrollment_date': member.get_enrollment_date().isoformat(),
+            'anniversary_date': (today + timedelta(days=days_until)).isoformat(),
+            'days_until': days_until,
+            'anniversary_year': anniversary_year,
+            'already_rewarded': member.last_anniversary_reward_year == today.year,
+        }
+
+    def get_anniversary_year(self, member: Member, today: Optional[date] = None) -> int:
         """
         Get the anniversary year for a member (1st, 2nd, 3rd year, etc.).
 
         Args:
             member: Member object
+            today: Reference day (defaults to date.today())
 
         Returns:
             Integer representing the anniversary year (1 for first anniversary, etc.)
         """
-        years = member.membership_years()
+        if today is None:
+            years = member.membership_years()
+            is_anniversary = member.is_anniversary_today()
+        else:
+            enrollment = member.get_enrollment_date()
+            years = today.year - enrollment.year
+            if (today.month, today.day) < (enrollment.month, enrollment.day):
+                years -= 1
+            years = max(0, years)
+            is_anniversary = member.get_anniversary_date(today.year) == today
         # If their anniversary is today, they're completing this year
-        if member.is_anniversary_today():
+        if is_anniversary:
             return years
         # Otherwise, next anniversary will be years + 1
         return years + 1 if years >= 0 else 1
 
-    def issue_anniversary_reward(self, member_id: int) -> Dict[str, Any]:
+    def issue_anniversary_reward(self, member_id: int, today: Optional[date] = None) -> Dict[str, Any]:
         """
         Issue anniversary reward to a member.
 
         Args:
             member_id: ID of the member to reward
+            today: Reward date (defaults to date.today())
 
         Returns:
             Dict with result info including success status and reward details.
@@ -185,22 +250,50 @@ class AnniversaryService:
         if not member:
             return {'success': False, 'error': 'Member not found'}
 
+        return self._issue_reward(member, self.get_anniversary_settings(), today or date.today())
+
+    def _issue_reward(
+        self,
+        member: Member,
+        settings: Dict[str, Any],
+        today: date,
+        commit: bool = True,
+        defer_badge: bool = False,
+        points_rows: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Issue the anniversary reward to an already-loaded member.
+
+        Args:
+            member: Member to reward
+            settings: Result of get_anniversary_settings()
+            today: Reward date; a batch passes one value so every reward
+                in a run crossing midnight is dated the same
+            commit: Commit (and log) this reward on its own. Batch callers
+                pass False and commit once for the whole run.
+            defer_badge: Skip the badge award and activity log; the batch
+                awards all badges at once and then calls _finish_reward.
+            points_rows: Collect PointsTransaction rows here instead of adding
+                ORM objects (see _issue_points_reward)
+
+        Returns:
+            Dict with result info including success status and reward details.
+        """
+        member_id = member.id
+
         if member.status != 'active':
             return {'success': False, 'error': f'Member is not active (status: {member.status})'}
 
-        settings = self.get_anniversary_settings()
-
         if not settings['enabled']:
             return {'success': False, 'error': 'Anniversary rewards not enabled'}
 
         # Check if already rewarded this year
-        current_year = date.today().year
-        last_reward_year = getattr(member, 'last_anniversary_reward_year', None)
-        if last_reward_year == current_year:
+        current_year = today.year
+        if member.last_anniversary_reward_year == current_year:
             return {'success': False, 'error': 'Already rewarded this year', 'already_rewarded': True}
 
         # Calculate anniversary year
-        anniversary_year = self.get_anniversary_year(member)
+        anniversary_year = self.get_anniversary_year(member, today)
 
         reward_type = settings['reward_type']
         # Get reward amount - use tiered amount if configured, otherwise default
@@ -219,42 +312,63 @@ class AnniversaryService:
 
         if reward_type == 'credit':
             # Issue store credit
-            credit_result = self._issue_store_credit_reward(member, reward_amount, anniversary_year, settings['message'])
+            credit_result = self._issue_store_credit_reward(member, reward_amount, anniversary_year, settings['message'], today)
             result.update(credit_result)
 
         elif reward_type == 'points':
             # Issue points
-            points_result = self._issue_points_reward(member, reward_amount, anniversary_year)
+            points_result = self._issue_points_reward(member, reward_amount, anniversary_year, today, points_rows)
             result.update(points_result)
 
         elif reward_type == 'discount_code':
             # Generate discount code
-            discount_result = self._issue_discount_code_reward(member, reward_amount, anniversary_year)
+            discount_result = self._issue_discount_code_reward(member, reward_amount, anniversary_year, today)
             result.update(discount_result)
 
         else:
             return {'success': False, 'error': f'Unknown reward type: {reward_type}'}
 
-        # Mark as rewarded this year (if we have the field)
-        if hasattr(member, 'last_anniversary_reward_year'):
-            member.last_anniversary_reward_year = current_year
+        # Mark as rewarded this year
+        member.last_anniversary_reward_year = current_year
+
+        if not defer_badge:
+            # Award anniversary badge if applicable (1, 2, or 5 year milestones)
+            badge_awarded = None
+            try:
+                badge_awarded = self._award_anniversary_badge(member_id, anniversary_year, commit=commit)
+            except Exception as e:
+                # Don't fail the reward if badge awarding fails
+                current_app.logger.warning(f"Failed to award anniversary badge for member {member_id}: {e}")
+            self._finish_reward(member, result, badge_awarded)
+
+        if not commit:
+            return result
 
-        # Award anniversary badge if applicable (1, 2, or 5 year milestones)
-        badge_awarded = None
         try:
-            badge_awarded = self._award_anniversary_badge(member_id, anniversary_year)
-            if badge_awarded:
-                result['badge_awarded'] = {
-                    'id': badge_awarded.badge_id,
-                    'name': badge_awarded.badge.name if badge_awarded.badge else None,
-                }
-                current_app.logger.info(
-                    f"Anniversary badge awarded: {badge_awarded.badge.name if badge_awarded.badge else 'Unknown'} "
-                    f"to member {member.member_number}"
-                )
+            db.session.commit()
+            current_app.logger.info(
+                f"Anniversary reward issued: Member {member.member_number} "
+                f"({anniversary_year} year anniversary), "
+                f"{reward_type}: {reward_amount}"
+            )
         except Exception as e:
-            # Don't fail the reward if badge awarding fails
-            current_app.logger.warning(f"Failed to award anniversary badge for member {member_id}: {e}")
+            db.session.rollback()
+            current_app.logger.error(f"Failed to commit anniversary reward for member {member_id}: {e}")
+            return {'success': False, 'error': str(e)}
+
+        return result
+
+    def _finish_reward(self, member: Member, result: Dict[str, Any], badge_awarded) -> None:
+        """Record the badge (if any) on the result and log the reward activity."""
+        if badge_awarded:
+            result['badge_awarded'] = {
+                'id': badge_awarded.badge_id,
+                'name': badge_awarded.badge.name if badge_awarded.badge else None,
+            }
+            current_app.logger.info(
+                f"Anniversary badge awarded: {badge_awarded.badge.name if badge_awarded.badge else 'Unknown'} "
+                f"to member {member.member_number}"
+            )
 
         # Log activity in member activity history
         try:
@@ -270,37 +384,24 @@ class AnniversaryService:
             activity = MemberActivity.log_anniversary_reward(
                 tenant_id=self.tenant_id,
                 member_id=member.id,
-                anniversary_year=anniversary_year,
-                reward_type=reward_type,
-                reward_amount=reward_amount,
+                anniversary_year=result['anniversary_year'],
+                reward_type=result['reward_type'],
+                reward_amount=result['reward_amount'],
                 reward_reference=reward_reference,
                 badge_id=badge_awarded.badge_id if badge_awarded else None
             )
             result['activity_id'] = activity.id if activity else None
         except Exception as e:
             # Don't fail the reward if activity logging fails
-            current_app.logger.warning(f"Failed to log anniversary activity for member {member_id}: {e}")
-
-        try:
-            db.session.commit()
-            current_app.logger.info(
-                f"Anniversary reward issued: Member {member.member_number} "
-                f"({anniversary_year} year anniversary), "
-                f"{reward_type}: {reward_amount}"
-            )
-        except Exception as e:
-            db.session.rollback()
-            current_app.logger.error(f"Failed to commit anniversary reward for member {member_id}: {e}")
-            return {'success': False, 'error': str(e)}
-
-        return result
+            current_app.logger.warning(f"Failed to log anniversary activity for member {member.id}: {e}")
 
     def _issue_store_credit_reward(
         self,
         member: Member,
         amount: float,
         anniversary_year: int,
-        message: str
+        message: str,
+        today: date
     ) -> Dict[str, Any]:
         """Issue store credit as anniversary reward."""
         try:
@@ -310,11 +411,11 @@ class AnniversaryService:
 
             entry = store_credit_service.add_credit(
                 member_id=member.id,
-                amount=Decimal(str(amount)),
+                amount=to_decimal(amount),
                 event_type=event_type,
                 description=f"{self._ordinal(anniversary_year)} Anniversary Reward - {message}",
                 source_type='anniversary_reward',
-                source_id=str(date.today().year),
+                source_id=str(today.year),
                 created_by='system:anniversary_service',
                 sync_to_shopify=True
             )
@@ -331,29 +432,38 @@ class AnniversaryService:
         self,
         member: Member,
         amount: int,
-        anniversary_year: int
+        anniversary_year: int,
+        today: date,
+        points_rows: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
-        """Issue points as anniversary reward."""
+        """
+        Issue points as anniversary reward.
+
+        When points_rows is given the PointsTransaction is appended to it as
+        a plain row for the caller to insert with the rest of the batch.
+        """
         try:
             # Update member's points balance directly
             member.points_balance = (member.points_balance or 0) + amount
             member.lifetime_points_earned = (member.lifetime_points_earned or 0) + amount
 
             # Create points transaction for tracking
-            from app.models.points import PointsTransaction
-            transaction = PointsTransaction(
-                tenant_id=self.tenant_id,
-                member_id=member.id,
-                points=amount,
-                remaining_points=amount,
-                transaction_type='earn',
-                source='anniversary',
-                reference_id=str(date.today().year),
-                reference_type='anniversary_reward',
-                description=f"{self._ordinal(anniversary_year)} Anniversary Reward",
-                created_at=datetime.utcnow()
-            )
-            db.session.add(transaction)
+            row = {
+                'tenant_id': self.tenant_id,
+                'member_id': member.id,
+                'points': amount,
+                'remaining_points': amount,
+                'transaction_type': 'earn',
+                'source': 'anniversary',
+                'reference_id': str(today.year),
+                'reference_type': 'anniversary_reward',
+                'description': f"{self._ordinal(anniversary_year)} Anniversary Reward",
+                'created_at': datetime.utcnow(),
+            }
+            if points_rows is not None:
+                points_rows.append(row)
+            else:
+                db.session.add(PointsTransaction(**row))
 
             return {
                 'points_issued': amount,
@@ -367,14 +477,15 @@ class AnniversaryService:
         self,
         member: Member,
         amount: float,
-        anniversary_year: int
+        anniversary_year: int,
+        today: date
     ) -> Dict[str, Any]:
         """Generate a discount code as anniversary reward."""
         try:
             from .shopify_client import ShopifyClient
 
             # Generate unique discount code
-            code = f"ANNIV{anniversary_year}Y-{member.member_number}-{date.today().strftime('%Y%m%d')}"
+            code = f"ANNIV{anniversary_year}Y-{member.member_number}-{_date_stamp(today)}"
 
             shopify_client = ShopifyClient(self.tenant_id)
             result = shopify_client.create_reward_discount_code(
@@ -402,11 +513,15 @@ class AnniversaryService:
             current_app.logger.error(f"Failed to issue anniversary discount for member {member.id}: {e}")
             return {'success': False, 'error': f'Failed to issue discount: {e}'}
 
-    def process_anniversary_rewards(self) -> Dict[str, Any]:
+    def process_anniversary_rewards(self, today: Optional[date] = None) -> Dict[str, Any]:
         """
         Process anniversary rewards for all members with anniversaries today.
         Called by scheduled task daily.
 
+        Args:
+            today: Run date (defaults to date.today()); read once and used
+                for every reward in the run
+
         Returns:
             Dict with processing results.
         """
@@ -415,23 +530,77 @@ class AnniversaryService:
         if not settings['enabled']:
             return {'success': False, 'error': 'Anniversary rewards not enabled', 'processed': 0}
 
-        anniversary_members = self.get_todays_anniversaries()
-        results = []
-
-        for member in anniversary_members:
-            result = self.issue_anniversary_reward(member.id)
-            results.append(result)
+        today = today or date.today()
+        anniversary_members = self.get_todays_anniversaries(today)
+
+        # Points rewards only touch our database, so the whole run shares one
+        # commit. Credit and discount rewards call Shopify per member and keep
+        # committing each reward as it is issued.
+        batch = settings['reward_type'] == 'points'
+        points_rows = [] if batch else None
+        results = [
+            self._issue_reward(member, settings, today, commit=not batch, defer_badge=True, points_rows=points_rows)
+            for member in anniversary_members
+        ]
 
-        successful = [r for r in results if r.get('success')]
-        failed = [r for r in results if not r.get('success')]
-        already_rewarded = [r for r in failed if r.get('already_rewarded')]
+        # Award milestone badges for the whole run at once, then log activities
+        rewarded = {
+            member.id: (member, r)
+            for member, r in zip(anniversary_members, results)
+            if r.get('success')
+        }
+        badges = {}
+        if rewarded:
+            try:
+                badges = self._award_anniversary_badges_bulk(
+                    [(member_id, r['anniversary_year']) for member_id, (_, r) in rewarded.items()],
+                    commit=False
+                )
+            except Exception as e:
+                # Don't fail the rewards if badge awarding fails
+                current_app.logger.warning(f"Failed to award anniversary badges for tenant {self.tenant_id}: {e}")
+            for member_id, (member, r) in rewarded.items():
+                self._finish_reward(member, r, badges.get(member_id))
+            if not batch:
+                try:
+                    db.session.commit()
+                except Exception as e:
+                    db.session.rollback()
+                    current_app.logger.error(f"Failed to commit anniversary badges for tenant {self.tenant_id}: {e}")
+
+        if batch and any(r.get('success') for r in results):
+            try:
+                if points_rows:
+                    # One executemany INSERT instead of an ORM object per reward
+                    db.session.execute(insert(PointsTransaction), points_rows)
+                db.session.commit()
+                current_app.logger.info(
+                    f"Anniversary rewards issued for tenant {self.tenant_id}: "
+                    f"{sum(1 for r in results if r.get('success'))} members"
+                )
+            except Exception as e:
+                db.session.rollback()
+                current_app.logger.error(f"Failed to commit anniversary rewards for tenant {self.tenant_id}: {e}")
+                results = [
+                    {'success': False, 'member_id': r.get('member_id'), 'error': str(e)} if r.get('success') else r
+                    for r in results
+                ]
+
+        successful = failed = already_rewarded = 0
+        for r in results:
+            if r.get('success'):
+                successful += 1
+            else:
+                failed += 1
+                if r.get('already_rewarded'):
+                    already_rewarded += 1
 
         return {
             'success': True,
             'processed': len(results),
-            'successful': len(successful),
-            'failed': len(failed),
-            'already_rewarded': len(already_rewarded),
+            'successful': successful,
+            'failed': failed,
+            'already_rewarded': already_rewarded,
             'details': results,
         }
 
@@ -445,31 +614,38 @@ class AnniversaryService:
         today = date.today()
         current_year = today.year
 
-        # Count active members
-        total_active_members = Member.query.filter(
+        window = anniversary_window(today, 7)
+        days_until = case(window, value=Member.anniversary_key)
+
+        # Active, rewarded-this-year, upcoming and today counts in one pass
+        counts = db.session.query(
+            func.count(Member.id).label('active'),
+            func.coalesce(func.sum(case(
+                (Member.last_anniversary_reward_year == current_year, 1), else_=0
+            )), 0).label('rewarded'),
+            func.coalesce(func.sum(case(
+                (Member.anniversary_key.in_(window), 1), else_=0
+            )), 0).label('upcoming'),
+            func.coalesce(func.sum(case(
+                (days_until == 0, 1), else_=0
+            )), 0).label('today')
+        ).filter(
             Member.tenant_id == self.tenant_id,
             Member.status == 'active'
-        ).count()
+        ).one()
 
-        # Count members rewarded this year
-        rewarded_this_year = Member.query.filter(
-            Member.tenant_id == self.tenant_id,
-            Member.last_anniversary_reward_year == current_year,
-            Member.status == 'active'
-        ).count() if hasattr(Member, 'last_anniversary_reward_year') else 0
-
-        # Get upcoming anniversaries (next 7 days)
-        upcoming = self.get_members_with_upcoming_anniversaries(days_ahead=7)
-
-        # Count anniversaries today
-        anniversaries_today = len([m for m in upcoming if m['days_until'] == 0])
+        # Top 5 upcoming (next 7 days), ordered in SQL
+        soonest = self._upcoming_query(window).order_by(days_until, Member.id).limit(5).all()
 
         return {
-            'total_active_members': total_active_members,
-            'rewarded_this_year': rewarded_this_year,
-            'anniversaries_today': anniversaries_today,
-            'upcoming_7_days': len(upcoming),
-            'upcoming_anniversaries': upcoming[:5],  # Top 5 upcoming
+            'total_active_members': counts.active,
+            'rewarded_this_year': counts.rewarded,
+            'anniversaries_today': counts.today,
+            'upcoming_7_days': counts.upcoming,
+            'upcoming_anniversaries': [
+                self._upcoming_entry(member, window[member.anniversary_key], today)
+                for member in soonest
+            ],
         }
 
     @staticmethod
@@ -483,19 +659,27 @@ class AnniversaryService:
         Returns:
             String like "1st", "2nd", "3rd", "4th", etc.
         """
-        if 11 <= (n % 100) <= 13:
-            suffix = 'th'
-        else:
-            suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10, 'th')
-        return f"{n}{suffix}"
+        return f"{n}{_ORDINAL_SUFFIXES[n % 100]}"
 
-    def _award_anniversary_badge(self, member_id: int, anniversary_year: int):
+    def _award_anniversary_badges_bulk(self, awards, commit: bool = True):
+        """
+        Award anniversary badges for many (member_id, anniversary_year) pairs.
+
+        Returns:
+            Dict of member_id -> MemberBadge
+        """
+        from .gamification_service import GamificationService
+
+        return GamificationService(self.tenant_id).award_anniversary_badges_bulk(awards, commit=commit)
+
+    def _award_anniversary_badge(self, member_id: int, anniversary_year: int, commit: bool = True):
         """
         Award anniversary badge via GamificationService integration.
 
         Args:
             member_id: ID of the member
             anniversary_year: The anniversary year (1, 2, 5, etc.)
+            commit: Passed through; False leaves the badge flushed but uncommitted
 
         Returns:
             MemberBadge if awarded, None otherwise
@@ -503,7 +687,7 @@ class AnniversaryService:
         from .gamification_service import GamificationService
 
         gamification_service = GamificationService(self.tenant_id)
-        return gamification_service.award_anniversary_badge(member_id, anniversary_year)
+        return gamification_service.award_anniversary_badge(member_id, anniversary_year, commit=commit)
 
     def get_members_for_anniversary_reminder(self) -> List[Dict[str, Any]]:
         """
@@ -528,10 +712,11 @@ class AnniversaryService:
         today = date.today()
         reminder_members = []
 
-        # Get all active members for this tenant
-        members = Member.query.filter(
+        # Active members whose anniversary is email_days_before days away
+        members = Member.query.options(load_only(*_ANNIVERSARY_COLUMNS)).filter(
             Member.tenant_id == self.tenant_id,
-            Member.status == 'active'
+            Member.status == 'active',
+            Member.anniversary_key.in_(anniversary_keys_for(today + timedelta(days=email_days_before)))
         ).all()
 
         for member in members:
@@ -557,7 +742,7 @@ class AnniversaryService:
                     'member_name': member.name or member.email.split('@')[0],
                     'member_email': member.email,
                     'enrollment_date': enrollment.isoformat(),
-                    'anniversary_date': member.get_anniversary_date(today.year if days_until > 0 else today.year + 1).isoformat(),
+                    'anniversary_date': (today + timedelta(days=days_until)).isoformat(),
                     'days_until': days_until,
                     'anniversary_year': anniversary_year,
                 })
@@ -689,22 +874,52 @@ class AnniversaryService:
             result = self.send_anniversary_reminder(member_info['member_id'])
             results.append(result)
 
-        successful = [r for r in results if r.get('success')]
-        failed = [r for r in results if not r.get('success')]
-        skipped = [r for r in failed if r.get('skipped')]
+        successful = failed = skipped = 0
+        for r in results:
+            if r.get('success'):
+                successful += 1
+            else:
+                failed += 1
+                if r.get('skipped'):
+                    skipped += 1
 
         return {
             'success': True,
             'processed': len(results),
-            'successful': len(successful),
-            'failed': len(failed),
-            'skipped': len(skipped),
+            'successful': successful,
+            'failed': failed,
+            'skipped': skipped,
             'email_days_before': email_days_before,
             'details': results,
         }
 
 
 # Convenience functions for simpler usage
+def anniversary_keys_for(day: date) -> List[int]:
+    """
+    Member.anniversary_key values whose anniversary falls on the given day.
+
+    Feb 29 enrollments celebrate on Feb 28 in non-leap years, so that day
+    matches both keys.
+    """
+    keys = [day.month * 100 + day.day]
+    if keys[0] == 228 and not calendar.isleap(day.year):
+        keys.append(229)
+    return keys
+
+
+def anniversary_window(today: date, days_ahead: int) -> Dict[int, int]:
+    """
+    Map each Member.anniversary_key falling in the next days_ahead days to
+    its days-until value (0 = today).
+    """
+    window = {}
+    for offset in range(min(days_ahead, 366) + 1):
+        for key in anniversary_keys_for(today + timedelta(days=offset)):
+            window.setdefault(key, offset)
+    return window
+
+
 def get_anniversary_service(tenant_id: int, settings: Optional[Dict] = None) -> AnniversaryService:
     """Get an AnniversaryService instance for a tenant."""
     return AnniversaryService(tenant_id, settings)
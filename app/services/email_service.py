@@ -10,6 +10,8 @@ Handles transactional emails for:
 - Nudge emails (points expiring, tier progress, inactive, trade-in reminder)
 """
 import os
+import re
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from pathlib import Path
@@ -18,6 +20,27 @@ from sendgrid import SendGridAPIClient
 from sendgrid.helpers.mail import Mail, Email, To, Content
 
 
+# Template syntax, compiled once rather than on every render
+# {{#if var}}...{{/if}} - include content if var is truthy
+_CONDITIONAL_PATTERN = re.compile(r'\{\{#if (\w+)\}\}(.*?)\{\{/if\}\}', re.DOTALL)
+_PLACEHOLDER_PATTERN = re.compile(r'\{\{[^}]+\}\}')
+
+
+def _replace_conditionals(text: str, context: Dict[str, Any]) -> str:
+    """Keep {{#if var}} blocks whose var is truthy in context, drop the rest."""
+    return _CONDITIONAL_PATTERN.sub(
+        lambda match: match.group(2) if context.get(match.group(1)) else '',
+        text
+    )
+
+
+@lru_cache(maxsize=32)
+def _read_html_template(template_path: Path) -> str:
+    """Read an HTML template file; the files ship with the app, so each is read once."""
+    with open(template_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
 class EmailService:
     """Service for sending transactional emails."""
 
@@ -689,23 +712,8 @@ P.S. Not sure what your cards are worth? Stop by and we'll give you a free evalu
             body = body.replace(placeholder, str(value or ''))
 
         # Handle conditionals (basic support)
-        # {{#if var}}...{{/if}} - include content if var is truthy
-        import re
-
-        def replace_conditionals(text: str, data: Dict[str, Any]) -> str:
-            pattern = r'\{\{#if (\w+)\}\}(.*?)\{\{/if\}\}'
-
-            def replacer(match):
-                var_name = match.group(1)
-                content = match.group(2)
-                if data.get(var_name):
-                    return content
-                return ''
-
-            return re.sub(pattern, replacer, text, flags=re.DOTALL)
-
-        subject = replace_conditionals(subject, data)
-        body = replace_conditionals(body, data)
+        subject = _replace_conditionals(subject, data)
+        body = _replace_conditionals(body, data)
 
         return {
             'subject': subject.strip(),
@@ -761,8 +769,6 @@ P.S. Not sure what your cards are worth? Stop by and we'll give you a free evalu
 
     def _markdown_to_html(self, text: str) -> str:
         """Convert simple markdown to HTML."""
-        import re
-
         # Convert **bold** to <strong>
         text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
 
@@ -813,8 +819,7 @@ P.S. Not sure what your cards are worth? Stop by and we'll give you a free evalu
             return None
 
         try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return _read_html_template(template_path)
         except Exception as e:
             current_app.logger.warning(f'Failed to load HTML template {template_key}: {str(e)}')
             return None
@@ -861,8 +866,6 @@ P.S. Not sure what your cards are worth? Stop by and we'll give you a free evalu
         Returns:
             Rendered HTML string or None if template not found
         """
-        import re
-
         html_content = self._load_html_template(template_key)
         if not html_content:
             return None
@@ -877,22 +880,10 @@ P.S. Not sure what your cards are worth? Stop by and we'll give you a free evalu
             html_content = html_content.replace(placeholder, str(value or ''))
 
         # Handle conditionals: {{#if var}}...{{/if}}
-        def replace_conditionals(text: str, context: Dict[str, Any]) -> str:
-            pattern = r'\{\{#if (\w+)\}\}(.*?)\{\{/if\}\}'
-
-            def replacer(match):
-                var_name = match.group(1)
-                content = match.group(2)
-                if context.get(var_name):
-                    return content
-                return ''
-
-            return re.sub(pattern, replacer, text, flags=re.DOTALL)
-
-        html_content = replace_conditionals(html_content, data)
+        html_content = _replace_conditionals(html_content, data)
 
         # Clean up any remaining unmatched placeholders
-        html_content = re.sub(r'\{\{[^}]+\}\}', '', html_content)
+        html_content = _PLACEHOLDER_PATTERN.sub('', html_content)
 
         return html_content
 
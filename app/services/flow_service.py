@@ -36,14 +36,274 @@ Flow Integration Architecture:
 3. Actions are HTTP endpoints that Flow calls
 4. All operations are idempotent with proper error handling
 """
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache, wraps
+from threading import Lock, Thread
 from typing import Dict, Any, Optional, List
-from flask import current_app
+from flask import current_app, g, has_request_context
 import hashlib
 import json
+import logging
+import queue
+import time
 
 from ..extensions import db
+from ..utils.money import to_decimal
+
+logger = logging.getLogger(__name__)
+
+FLOW_TRIGGER_MUTATION = """
+mutation flowTriggerReceive($handle: String!, $payload: JSON!) {
+    flowTriggerReceive(handle: $handle, payload: $payload) {
+        userErrors {
+            field
+            message
+        }
+    }
+}
+"""
+
+# Trigger handles registered under tradeup/ in the Flow extension
+FLOW_TRIGGER_HANDLES = {
+    name: f'tradeup/{name}'
+    for name in (
+        'member-enrolled', 'tier-changed', 'tier-upgraded', 'tier-downgraded',
+        'points-earned', 'points-redeemed', 'reward-unlocked',
+        'trade-in-completed', 'credit-issued',
+    )
+}
+
+# Queue feeding the background Flow trigger sender (started on first use).
+# Each item is a batch of (shopify_client, trigger_name, payload) tuples.
+FLOW_TRIGGER_QUEUE_SIZE = 1000
+FLOW_TRIGGER_MAX_WORKERS = 8
+_flow_trigger_queue = None
+_flow_trigger_lock = Lock()
+
+# Failed triggers are logged, then tallied and summarized periodically (see _record_flow_failure)
+FLOW_FAILURE_REPORT_INTERVAL = 60
+FLOW_RECENT_FAILURES_SIZE = 100
+_flow_failure_counts = Counter()
+_recent_flow_failures = deque(maxlen=FLOW_RECENT_FAILURES_SIZE)
+_flow_failure_lock = Lock()
+_flow_failure_reporter = None
+
+# Flow actions arrive in bursts for the same customers; remember which member
+# an email resolved to so repeat actions load the row by primary key.
+FLOW_MEMBER_CACHE_TTL = 60
+
+
+def _get_cache():
+    """Get cache instance, returns None if unavailable."""
+    try:
+        from ..utils.cache import cache
+        return cache
+    except ImportError:
+        return None
+
+
+def _deliver_flow_trigger(shopify_client, trigger_name: str, payload: Dict) -> Dict[str, Any]:
+    """Send one flowTriggerReceive mutation and return the result dict."""
+    # The handle format is typically "app-slug/trigger-name"; an unknown
+    # trigger name is a caller bug and raises KeyError
+    result = shopify_client._execute_query(FLOW_TRIGGER_MUTATION, {
+        'handle': FLOW_TRIGGER_HANDLES[trigger_name],
+        'payload': payload
+    })
+
+    errors = result.get('flowTriggerReceive', {}).get('userErrors', [])
+    if errors:
+        return {
+            'success': False,
+            'errors': errors,
+            'trigger': trigger_name
+        }
+
+    return {
+        'success': True,
+        'trigger': trigger_name,
+        'payload': payload
+    }
+
+
+def _record_flow_failure(shopify_client, trigger_name: str, error, tenant_id=None) -> None:
+    """
+    Log a failed trigger and count it for the periodic summary.
+
+    Queued triggers report only that they were queued, so each failure is
+    logged here with its trigger and tenant. Failures are also tallied per
+    (shop, trigger), the last FLOW_RECENT_FAILURES_SIZE are kept for
+    inspection, and a daemon reporter logs one summary per
+    FLOW_FAILURE_REPORT_INTERVAL.
+    """
+    global _flow_failure_reporter
+    shop = getattr(shopify_client, 'shop_domain', None)
+    logger.warning("Flow trigger '%s' failed for tenant %s: %s", trigger_name, tenant_id, error)
+    with _flow_failure_lock:
+        _flow_failure_counts[(shop, trigger_name)] += 1
+        _recent_flow_failures.append({
+            'shop': shop,
+            'tenant_id': tenant_id,
+            'trigger': trigger_name,
+            'error': str(error),
+            'at': datetime.utcnow().isoformat() + 'Z'
+        })
+        if _flow_failure_reporter is None:
+            _flow_failure_reporter = Thread(target=_report_flow_failures, daemon=True,
+                                            name='flow-failure-reporter')
+            _flow_failure_reporter.start()
+
+
+def _drain_flow_failure_counts() -> Dict:
+    """Return and reset the failure tallies since the last report."""
+    with _flow_failure_lock:
+        counts = dict(_flow_failure_counts)
+        _flow_failure_counts.clear()
+    return counts
+
+
+def _report_flow_failures():
+    """Log aggregated trigger failures once per interval."""
+    while True:
+        time.sleep(FLOW_FAILURE_REPORT_INTERVAL)
+        counts = _drain_flow_failure_counts()
+        if counts:
+            summary = ', '.join(f"{shop or '?'}/{trigger}: {n}" for (shop, trigger), n in counts.items())
+            logger.warning(
+                'Flow trigger failures in the last %ds: %s', FLOW_FAILURE_REPORT_INTERVAL, summary
+            )
+
+
+def get_recent_flow_failures() -> List[Dict[str, Any]]:
+    """Most recent Flow trigger failures, oldest first."""
+    with _flow_failure_lock:
+        return list(_recent_flow_failures)
+
+
+def _deliver_flow_trigger_quietly(shopify_client, trigger_name: str, payload: Dict,
+                                  tenant_id=None) -> None:
+    """Deliver a trigger from the background sender, recording any failure."""
+    try:
+        result = _deliver_flow_trigger(shopify_client, trigger_name, payload)
+        if not result['success']:
+            _record_flow_failure(shopify_client, trigger_name, result['errors'], tenant_id)
+    except Exception as e:
+        _record_flow_failure(shopify_client, trigger_name, e, tenant_id)
+
+
+def _flow_trigger_worker(q):
+    """Drain queued trigger batches and deliver each batch concurrently."""
+    with ThreadPoolExecutor(max_workers=FLOW_TRIGGER_MAX_WORKERS,
+                            thread_name_prefix='flow-trigger') as pool:
+        while True:
+            batch = q.get()
+            try:
+                if len(batch) == 1:
+                    _deliver_flow_trigger_quietly(*batch[0])
+                else:
+                    list(pool.map(lambda item: _deliver_flow_trigger_quietly(*item), batch))
+            finally:
+                q.task_done()
+
+
+def _get_flow_trigger_queue():
+    """Return the trigger queue, starting the daemon sender thread on first use."""
+    global _flow_trigger_queue
+    if _flow_trigger_queue is None:
+        with _flow_trigger_lock:
+            if _flow_trigger_queue is None:
+                q = queue.Queue(maxsize=FLOW_TRIGGER_QUEUE_SIZE)
+                Thread(target=_flow_trigger_worker, args=(q,), daemon=True,
+                       name='flow-trigger-sender').start()
+                _flow_trigger_queue = q
+    return _flow_trigger_queue
+
+
+def _flow_timestamp() -> str:
+    """
+    UTC ISO timestamp for trigger payloads.
+
+    Inside a request the timestamp is computed once and shared by every
+    trigger the request fires, since they belong to one user action.
+    """
+    if has_request_context():
+        if '_flow_ts' not in g:
+            g._flow_ts = datetime.utcnow().isoformat() + 'Z'
+        return g._flow_ts
+    return datetime.utcnow().isoformat() + 'Z'
+
+
+def _flow_trigger_key(trigger_name: str, payload: Dict) -> str:
+    """Idempotency key for a trigger: hash of its name and payload data."""
+    data = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(f"{trigger_name}:{data}".encode()).hexdigest()
+
+
+def _flush_flow_triggers(exc=None):
+    """
+    Hand the request's buffered Flow triggers to the sender as one batch.
+
+    A request that failed with an exception is rolled back, so its triggers
+    describe changes that were never committed and are dropped.
+    """
+    g.pop('_flow_ts', None)
+    buffered = g.pop('_flow_triggers', None)
+    if not buffered:
+        return
+    if exc is not None:
+        logger.info('Request failed, discarding %d buffered Flow trigger(s)', len(buffered))
+        return
+    batch = list(buffered.values())
+    try:
+        _get_flow_trigger_queue().put_nowait(batch)
+    except queue.Full:
+        # Same fallback as unbuffered triggers: the request's changes are
+        # committed, so send the events inline rather than lose them
+        logger.warning('Flow trigger queue full, sending %d trigger(s) inline', len(batch))
+        for item in batch:
+            _deliver_flow_trigger_quietly(*item)
+
+
+def init_flow_trigger_buffer(app):
+    """
+    Flush per-request Flow trigger buffers when each request tears down.
+
+    Call this in the app factory after creating the Flask app.
+    """
+    app.teardown_request(_flush_flow_triggers)
+
+
+# Audit fields stamped on everything a Flow action creates
+FLOW_CREATED_BY = 'shopify_flow'
+FLOW_SOURCE_TYPE = 'flow_action'
+
+
+@lru_cache(maxsize=64)
+def _flow_description(reason: str) -> str:
+    """Ledger/tier-log description for a Flow action; bulk runs repeat one reason."""
+    return f"Flow: {reason}"
+
+
+def _requires_shopify(f):
+    """
+    Return the "not configured" result before a trigger builds its payload.
+
+    Tenants without a linked store (and tests) would otherwise assemble a
+    payload and timestamp only for _send_flow_trigger to discard them.
+    """
+    @wraps(f)
+    def decorated_function(self, *args, **kwargs):
+        if not self.shopify_client:
+            return {
+                'success': False,
+                'error': 'Shopify client not configured'
+            }
+        return f(self, *args, **kwargs)
+
+    return decorated_function
 
 
 class FlowService:
@@ -77,6 +337,7 @@ class FlowService:
     # ==================== Flow Triggers ====================
     # These methods send events to Shopify Flow
 
+    @_requires_shopify
     def trigger_member_enrolled(
         self,
         member_id: int,
@@ -95,7 +356,7 @@ class FlowService:
         """
         payload = {
             'trigger': 'member_enrolled',
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': _flow_timestamp(),
             'data': {
                 'member_id': member_id,
                 'member_number': member_number,
@@ -107,6 +368,7 @@ class FlowService:
 
         return self._send_flow_trigger('member-enrolled', payload)
 
+    @_requires_shopify
     def trigger_tier_changed(
         self,
         member_id: int,
@@ -128,7 +390,7 @@ class FlowService:
         """
         payload = {
             'trigger': 'tier_changed',
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': _flow_timestamp(),
             'data': {
                 'member_id': member_id,
                 'member_number': member_number,
@@ -143,6 +405,7 @@ class FlowService:
 
         return self._send_flow_trigger('tier-changed', payload)
 
+    @_requires_shopify
     def trigger_trade_in_completed(
         self,
         member_id: int,
@@ -165,7 +428,7 @@ class FlowService:
         """
         payload = {
             'trigger': 'trade_in_completed',
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': _flow_timestamp(),
             'data': {
                 'member_id': member_id,
                 'member_number': member_number,
@@ -182,6 +445,7 @@ class FlowService:
 
         return self._send_flow_trigger('trade-in-completed', payload)
 
+    @_requires_shopify
     def trigger_credit_issued(
         self,
         member_id: int,
@@ -203,7 +467,7 @@ class FlowService:
         """
         payload = {
             'trigger': 'credit_issued',
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': _flow_timestamp(),
             'data': {
                 'member_id': member_id,
                 'member_number': member_number,
@@ -220,6 +484,7 @@ class FlowService:
 
     # ==================== Points Triggers ====================
 
+    @_requires_shopify
     def trigger_points_earned(
         self,
         member_id: int,
@@ -259,7 +524,7 @@ class FlowService:
         """
         payload = {
             'trigger': 'points_earned',
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': _flow_timestamp(),
             'data': {
                 'member_id': member_id,
                 'member_number': member_number,
@@ -276,6 +541,7 @@ class FlowService:
 
         return self._send_flow_trigger('points-earned', payload)
 
+    @_requires_shopify
     def trigger_points_redeemed(
         self,
         member_id: int,
@@ -313,7 +579,7 @@ class FlowService:
         """
         payload = {
             'trigger': 'points_redeemed',
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': _flow_timestamp(),
             'data': {
                 'member_id': member_id,
                 'member_number': member_number,
@@ -329,6 +595,7 @@ class FlowService:
 
         return self._send_flow_trigger('points-redeemed', payload)
 
+    @_requires_shopify
     def trigger_tier_upgraded(
         self,
         member_id: int,
@@ -366,7 +633,7 @@ class FlowService:
         """
         payload = {
             'trigger': 'tier_upgraded',
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': _flow_timestamp(),
             'data': {
                 'member_id': member_id,
                 'member_number': member_number,
@@ -383,6 +650,7 @@ class FlowService:
 
         return self._send_flow_trigger('tier-upgraded', payload)
 
+    @_requires_shopify
     def trigger_tier_downgraded(
         self,
         member_id: int,
@@ -420,7 +688,7 @@ class FlowService:
         """
         payload = {
             'trigger': 'tier_downgraded',
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': _flow_timestamp(),
             'data': {
                 'member_id': member_id,
                 'member_number': member_number,
@@ -437,6 +705,7 @@ class FlowService:
 
         return self._send_flow_trigger('tier-downgraded', payload)
 
+    @_requires_shopify
     def trigger_reward_unlocked(
         self,
         member_id: int,
@@ -474,7 +743,7 @@ class FlowService:
         """
         payload = {
             'trigger': 'reward_unlocked',
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'timestamp': _flow_timestamp(),
             'data': {
                 'member_id': member_id,
                 'member_number': member_number,
@@ -544,12 +813,69 @@ class FlowService:
 
         return results
 
+    def is_trigger_subscribed(self, trigger_name: str) -> bool:
+        """
+        Check whether a Flow workflow may be listening for this trigger.
+
+        Only an explicit "no enabled workflows" report from the lifecycle
+        callback turns a trigger off; unknown triggers are assumed subscribed.
+        """
+        from .tenant_settings_service import get_cached_tenant_settings
+
+        subscriptions = get_cached_tenant_settings(self.tenant_id).get('flow_triggers') or {}
+        return subscriptions.get(trigger_name) is not False
+
+    def set_trigger_subscribed(self, trigger_name: str, has_enabled_flow: bool) -> Dict[str, Any]:
+        """
+        Record whether the merchant has an enabled workflow for a trigger.
+
+        Called from Shopify's trigger lifecycle callback. Committing the
+        settings change invalidates the cached tenant settings.
+
+        Args:
+            trigger_name: Trigger handle without the tradeup/ prefix
+            has_enabled_flow: True if at least one enabled workflow uses it
+
+        Returns:
+            Dict with result
+        """
+        from ..models import Tenant
+
+        if trigger_name not in FLOW_TRIGGER_HANDLES:
+            return {
+                'success': False,
+                'error': f'Unknown trigger: {trigger_name}'
+            }
+
+        tenant = db.session.get(Tenant, self.tenant_id)
+        if not tenant:
+            return {
+                'success': False,
+                'error': f'Tenant not found: {self.tenant_id}'
+            }
+
+        settings = tenant.settings or {}
+        subscriptions = {**(settings.get('flow_triggers') or {}), trigger_name: bool(has_enabled_flow)}
+        tenant.settings = {**settings, 'flow_triggers': subscriptions}
+        db.session.commit()
+
+        return {
+            'success': True,
+            'trigger': trigger_name,
+            'has_enabled_flow': bool(has_enabled_flow)
+        }
+
     def _send_flow_trigger(self, trigger_name: str, payload: Dict) -> Dict[str, Any]:
         """
         Send a trigger event to Shopify Flow.
 
         Note: Shopify Flow triggers are sent via the flowTriggerReceive mutation.
         The trigger must be registered in shopify.app.toml.
+
+        Triggers the merchant has no enabled workflow for are skipped.
+        With FLOW_TRIGGERS_ASYNC enabled the trigger is queued for a background
+        sender and the result only reports that it was queued. Inside a request,
+        triggers are buffered on ``g`` and flushed as one batch on teardown.
         """
         if not self.shopify_client:
             return {
@@ -557,44 +883,46 @@ class FlowService:
                 'error': 'Shopify client not configured'
             }
 
-        mutation = """
-        mutation flowTriggerReceive($handle: String!, $payload: JSON!) {
-            flowTriggerReceive(handle: $handle, payload: $payload) {
-                userErrors {
-                    field
-                    message
-                }
+        if not self.is_trigger_subscribed(trigger_name):
+            # No workflow uses this trigger; skip the mutation entirely
+            return {
+                'success': True,
+                'skipped': True,
+                'trigger': trigger_name
             }
-        }
-        """
-
-        try:
-            # The handle format is typically "app-slug/trigger-name"
-            # For custom apps, use the trigger URI path
-            handle = f"tradeup/{trigger_name}"
-
-            result = self.shopify_client._execute_query(mutation, {
-                'handle': handle,
-                'payload': payload
-            })
 
-            errors = result.get('flowTriggerReceive', {}).get('userErrors', [])
-            if errors:
+        if current_app.config.get('FLOW_TRIGGERS_ASYNC'):
+            # Flow triggers are non-critical: hand them to the background
+            # sender so the request doesn't wait on a GraphQL round-trip.
+            item = (self.shopify_client, trigger_name, payload, self.tenant_id)
+            if has_request_context():
+                # Coalesce the request's triggers into one batch, flushed on
+                # teardown; repeat events in the same request are sent once.
+                buffered = g.setdefault('_flow_triggers', {})
+                key = _flow_trigger_key(trigger_name, payload)
+                was_duplicate = key in buffered
+                buffered.setdefault(key, item)
                 return {
-                    'success': False,
-                    'errors': errors,
+                    'success': True,
+                    'queued': True,
+                    'trigger': trigger_name,
+                    'was_duplicate': was_duplicate
+                }
+            try:
+                _get_flow_trigger_queue().put_nowait([item])
+                return {
+                    'success': True,
+                    'queued': True,
                     'trigger': trigger_name
                 }
+            except queue.Full:
+                logger.warning("Flow trigger queue full, sending '%s' inline", trigger_name)
 
-            return {
-                'success': True,
-                'trigger': trigger_name,
-                'payload': payload
-            }
-
+        try:
+            return _deliver_flow_trigger(self.shopify_client, trigger_name, payload)
         except Exception as e:
-            # Log but don't fail - Flow triggers are non-critical
-            current_app.logger.warning(f"Flow trigger '{trigger_name}' failed: {e}")
+            # Record but don't fail - Flow triggers are non-critical
+            _record_flow_failure(self.shopify_client, trigger_name, e, self.tenant_id)
             return {
                 'success': False,
                 'error': str(e),
@@ -604,10 +932,40 @@ class FlowService:
     # ==================== Flow Actions ====================
     # These methods handle incoming action requests from Flow
 
+    def _get_member_by_email(self, customer_email: str):
+        """
+        Find the tenant's member with this email.
+
+        The member id is cached for FLOW_MEMBER_CACHE_TTL seconds. A cached id
+        is only trusted if the loaded row still has this tenant and email, so
+        email changes and deletions fall back to the query.
+        """
+        from ..models import Member
+
+        cache = _get_cache()
+        cache_key = f'flow_member_id:{self.tenant_id}:{customer_email}'
+
+        if cache:
+            member_id = cache.get(cache_key)
+            if member_id is not None:
+                member = db.session.get(Member, member_id)
+                if member and member.tenant_id == self.tenant_id and member.email == customer_email:
+                    return member
+
+        member = Member.query.filter_by(
+            tenant_id=self.tenant_id,
+            email=customer_email
+        ).first()
+
+        if member and cache:
+            cache.set(cache_key, member.id, timeout=FLOW_MEMBER_CACHE_TTL)
+
+        return member
+
     def action_add_credit(
         self,
         customer_email: str,
-        amount: float,
+        amount: Decimal,
         reason: str = 'Flow automation'
     ) -> Dict[str, Any]:
         """
@@ -615,20 +973,16 @@ class FlowService:
 
         Args:
             customer_email: Customer's email address
-            amount: Credit amount to add
+            amount: Credit amount to add (Decimal; other numbers are converted)
             reason: Description for the credit
 
         Returns:
             Dict with result and new balance
         """
-        from ..models import Member
         from .store_credit_service import store_credit_service
         from ..models.promotions import CreditEventType
 
-        member = Member.query.filter_by(
-            tenant_id=self.tenant_id,
-            email=customer_email
-        ).first()
+        member = self._get_member_by_email(customer_email)
 
         if not member:
             return {
@@ -639,11 +993,11 @@ class FlowService:
         try:
             entry = store_credit_service.add_credit(
                 member_id=member.id,
-                amount=Decimal(str(amount)),
-                event_type=CreditEventType.PROMO.value,
-                description=f"Flow: {reason}",
-                source_type='flow_action',
-                created_by='shopify_flow',
+                amount=amount if isinstance(amount, Decimal) else to_decimal(amount),
+                event_type=CreditEventType.PROMOTION_BONUS.value,
+                description=_flow_description(reason),
+                source_type=FLOW_SOURCE_TYPE,
+                created_by=FLOW_CREATED_BY,
                 sync_to_shopify=True
             )
 
@@ -683,14 +1037,10 @@ class FlowService:
         Returns:
             Dict with result
         """
-        from ..models import Member
-        from ..models.promotions import TierConfiguration
+        from .tier_cache_service import get_cached_tier_by_name
         from .tier_service import TierService
 
-        member = Member.query.filter_by(
-            tenant_id=self.tenant_id,
-            email=customer_email
-        ).first()
+        member = self._get_member_by_email(customer_email)
 
         if not member:
             return {
@@ -698,18 +1048,8 @@ class FlowService:
                 'error': f'Member not found: {customer_email}'
             }
 
-        # Find the tier
-        tier = TierConfiguration.query.filter_by(
-            tenant_id=self.tenant_id,
-            name=new_tier_name
-        ).first()
-
-        if not tier:
-            # Try case-insensitive
-            tier = TierConfiguration.query.filter(
-                TierConfiguration.tenant_id == self.tenant_id,
-                TierConfiguration.name.ilike(new_tier_name)
-            ).first()
+        # Find the tier (exact name, then case-insensitive)
+        tier = get_cached_tier_by_name(self.tenant_id, new_tier_name)
 
         if not tier:
             return {
@@ -718,21 +1058,22 @@ class FlowService:
             }
 
         try:
-            tier_svc = TierService(self.tenant_id)
+            tier_svc = TierService(self.tenant_id, self.shopify_client)
             result = tier_svc.assign_tier(
                 member_id=member.id,
-                tier_id=tier.id,
-                source='api',  # Flow is an API source
-                assigned_by='shopify_flow',
-                notes=f"Flow: {reason}"
+                tier_id=tier['id'],
+                source_type='api',  # Flow is an API source
+                source_reference=FLOW_CREATED_BY,
+                reason=_flow_description(reason),
+                created_by=FLOW_CREATED_BY
             )
 
             return {
                 'success': result.get('success', False),
                 'member_id': member.id,
                 'member_number': member.member_number,
-                'old_tier': result.get('old_tier'),
-                'new_tier': result.get('new_tier'),
+                'old_tier': result.get('previous_tier'),
+                'new_tier': result.get('tier_name'),
                 'change_type': result.get('change_type')
             }
 
@@ -746,18 +1087,37 @@ class FlowService:
         """
         Flow action: Get member information.
 
+        Selects just the returned columns (plus the tier name) as a row
+        instead of loading the Member and its tier as ORM objects.
+
         Args:
             customer_email: Customer's email address
 
         Returns:
             Dict with member data
         """
-        from ..models import Member
+        from ..models import Member, MembershipTier
         from .store_credit_service import store_credit_service
 
-        member = Member.query.filter_by(
-            tenant_id=self.tenant_id,
-            email=customer_email
+        member = db.session.query(
+            Member.id,
+            Member.tenant_id,
+            Member.member_number,
+            Member.email,
+            Member.name,
+            MembershipTier.name.label('tier_name'),
+            Member.status,
+            Member.points_balance,
+            Member.total_trade_ins,
+            Member.total_trade_value,
+            Member.total_bonus_earned,
+            Member.membership_start_date,
+            Member.shopify_customer_id
+        ).outerjoin(
+            MembershipTier, Member.tier_id == MembershipTier.id
+        ).filter(
+            Member.tenant_id == self.tenant_id,
+            Member.email == customer_email
         ).first()
 
         if not member:
@@ -767,12 +1127,9 @@ class FlowService:
                 'is_member': False
             }
 
-        # Get credit balance from Shopify (source of truth)
-        try:
-            balance_info = store_credit_service.get_shopify_balance(member)
-            balance = balance_info.get('balance', 0)
-        except Exception:
-            balance = 0
+        # Get credit balance from Shopify (source of truth); failures come
+        # back as a zero balance with an 'error' key
+        balance = store_credit_service.get_cached_shopify_balance(member).get('balance', 0)
 
         return {
             'success': True,
@@ -782,7 +1139,7 @@ class FlowService:
                 'member_number': member.member_number,
                 'email': member.email,
                 'name': member.name,
-                'tier': member.tier.name if member.tier else None,
+                'tier': member.tier_name,
                 'status': member.status,
                 'credit_balance': float(balance),
                 'points_balance': member.points_balance or 0,
@@ -824,7 +1181,6 @@ class FlowService:
                 new_balance: New points balance
                 was_duplicate: True if this was a duplicate request
         """
-        from ..models import Member
         from .points_service import PointsService
 
         # Validate input
@@ -841,10 +1197,7 @@ class FlowService:
             }
 
         # Find member
-        member = Member.query.filter_by(
-            tenant_id=self.tenant_id,
-            email=customer_email
-        ).first()
+        member = self._get_member_by_email(customer_email)
 
         if not member:
             return {
@@ -874,9 +1227,9 @@ class FlowService:
                 amount=points,
                 source_type='bonus',
                 source_id=idempotency_key or f'flow_{datetime.utcnow().isoformat()}',
-                description=f"Flow: {reason}",
+                description=_flow_description(reason),
                 apply_multipliers=False,  # Bonus points don't get multipliers
-                created_by='shopify_flow'
+                created_by=FLOW_CREATED_BY
             )
 
             if result.get('success'):
@@ -896,7 +1249,7 @@ class FlowService:
                 }
 
         except Exception as e:
-            current_app.logger.error(f"Flow action_award_bonus_points failed: {e}")
+            logger.error('Flow action_award_bonus_points failed: %s', e)
             return {
                 'success': False,
                 'error': str(e)
@@ -925,13 +1278,9 @@ class FlowService:
                 member_id: Member's internal ID
                 email_sent: True if email was successfully queued
         """
-        from ..models import Member
         from .notification_service import notification_service
 
-        member = Member.query.filter_by(
-            tenant_id=self.tenant_id,
-            email=customer_email
-        ).first()
+        member = self._get_member_by_email(customer_email)
 
         if not member:
             return {
@@ -968,7 +1317,7 @@ class FlowService:
             }
 
         except Exception as e:
-            current_app.logger.error(f"Flow action_send_tier_upgrade_email failed: {e}")
+            logger.error('Flow action_send_tier_upgrade_email failed: %s', e)
             return {
                 'success': False,
                 'error': str(e)
@@ -1000,14 +1349,10 @@ class FlowService:
                 reminder_type: Type of reminder sent
                 available_rewards: List of rewards member can redeem
         """
-        from ..models import Member
         from ..models.loyalty_points import Reward
         from .notification_service import notification_service
 
-        member = Member.query.filter_by(
-            tenant_id=self.tenant_id,
-            email=customer_email
-        ).first()
+        member = self._get_member_by_email(customer_email)
 
         if not member:
             return {
@@ -1111,7 +1456,7 @@ Your TradeUp Team
             }
 
         except Exception as e:
-            current_app.logger.error(f"Flow action_create_reward_reminder failed: {e}")
+            logger.error('Flow action_create_reward_reminder failed: %s', e)
             return {
                 'success': False,
                 'error': str(e)
@@ -1137,13 +1482,9 @@ Your TradeUp Team
                 tier_bonus_percent: Tier bonus rate as percentage
                 available_rewards_count: Number of rewards they can redeem
         """
-        from ..models import Member
         from ..models.loyalty_points import Reward
 
-        member = Member.query.filter_by(
-            tenant_id=self.tenant_id,
-            email=customer_email
-        ).first()
+        member = self._get_member_by_email(customer_email)
 
         if not member:
             return {
@@ -20,6 +20,14 @@ from app.models.loyalty_points import PointsLedger
 class GamificationService:
     """Service for gamification features."""
 
+    # Anniversary years that earn a badge, mapped to the badge criteria_value
+    # (membership days): 1 year = 365, 2 years = 730, 5 years = 1825
+    ANNIVERSARY_BADGE_DAYS = {
+        1: 365,
+        2: 730,
+        5: 1825,
+    }
+
     # Default badge definitions for new tenants
     DEFAULT_BADGES = [
         {
@@ -679,7 +687,7 @@ class GamificationService:
         db.session.commit()
 
     # Anniversary Badge Integration
-    def award_anniversary_badge(self, member_id: int, anniversary_year: int) -> Optional[MemberBadge]:
+    def award_anniversary_badge(self, member_id: int, anniversary_year: int, commit: bool = True) -> Optional[MemberBadge]:
         """
         Award the appropriate anniversary badge based on membership years.
 
@@ -689,58 +697,82 @@ class GamificationService:
         Args:
             member_id: ID of the member to award badge to
             anniversary_year: The anniversary year (1, 2, 3, 4, 5, etc.)
+            commit: Commit the award; False only flushes, for callers that
+                commit a larger batch themselves
 
         Returns:
             MemberBadge if a badge was awarded, None if no matching badge or already earned
         """
-        # Map anniversary years to days for criteria matching
-        # 1 year = 365 days, 2 years = 730 days, 5 years = 1825 days
-        anniversary_days_map = {
-            1: 365,
-            2: 730,
-            5: 1825,
-        }
+        return self.award_anniversary_badges_bulk([(member_id, anniversary_year)], commit=commit).get(member_id)
 
-        # Only award badges for milestone years (1, 2, 5)
-        if anniversary_year not in anniversary_days_map:
-            return None
+    def award_anniversary_badges_bulk(self, awards, commit: bool = True) -> Dict[int, MemberBadge]:
+        """
+        Award anniversary milestone badges to many members at once.
 
-        target_days = anniversary_days_map[anniversary_year]
+        Looks up the tenant's anniversary badges and the members' existing
+        badges with one query each, then adds only the missing MemberBadge rows.
 
-        # Find the anniversary badge with matching criteria
-        badge = Badge.query.filter_by(
-            tenant_id=self.tenant_id,
-            criteria_type='member_anniversary',
-            criteria_value=target_days,
-            is_active=True
-        ).first()
+        Args:
+            awards: Iterable of (member_id, anniversary_year) pairs
+            commit: Commit the awards; False only flushes, for callers that
+                commit a larger batch themselves
 
-        if not badge:
-            return None
+        Returns:
+            Dict of member_id -> MemberBadge (newly awarded or already earned)
+            for members who reached a milestone with a configured badge
+        """
+        wanted = {
+            member_id: self.ANNIVERSARY_BADGE_DAYS[year]
+            for member_id, year in awards
+            if year in self.ANNIVERSARY_BADGE_DAYS
+        }
+        if not wanted:
+            return {}
 
-        # Check if already earned
-        existing = MemberBadge.query.filter_by(
-            member_id=member_id,
-            badge_id=badge.id
-        ).first()
+        # Find the anniversary badges with matching criteria
+        badges = {}
+        for badge in Badge.query.filter(
+            Badge.tenant_id == self.tenant_id,
+            Badge.criteria_type == 'member_anniversary',
+            Badge.criteria_value.in_(set(wanted.values())),
+            Badge.is_active == True
+        ).order_by(Badge.id):
+            badges.setdefault(badge.criteria_value, badge)
+
+        targets = {member_id: badges[days] for member_id, days in wanted.items() if days in badges}
+        if not targets:
+            return {}
 
-        if existing:
-            return existing
+        # Check which are already earned
+        existing = {
+            (mb.member_id, mb.badge_id): mb
+            for mb in MemberBadge.query.filter(
+                MemberBadge.member_id.in_(targets),
+                MemberBadge.badge_id.in_({badge.id for badge in targets.values()})
+            )
+        }
 
-        # Award the badge
-        member_badge = MemberBadge(
-            member_id=member_id,
-            badge_id=badge.id,
-            progress=badge.criteria_value,
-            progress_max=badge.criteria_value,
-        )
-        db.session.add(member_badge)
+        awarded = {}
+        for member_id, badge in targets.items():
+            member_badge = existing.get((member_id, badge.id))
+            if member_badge is None:
+                member_badge = MemberBadge(
+                    member_id=member_id,
+                    badge_id=badge.id,
+                    progress=badge.criteria_value,
+                    progress_max=badge.criteria_value,
+                )
+                db.session.add(member_badge)
 
-        # Award badge rewards (points/credit)
-        self._award_badge_rewards(member_id, badge)
+                # Award badge rewards (points/credit)
+                self._award_badge_rewards(member_id, badge)
+            awarded[member_id] = member_badge
 
-        db.session.commit()
-        return member_badge
+        if commit:
+            db.session.commit()
+        else:
+            db.session.flush()
+        return awarded
 
     def get_anniversary_badges(self) -> List[Badge]:
         """
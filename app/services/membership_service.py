@@ -466,7 +466,7 @@ class MembershipService:
                 'error': str(e)
             }
 
-    def sync_member_metafields_to_shopify(self, member: Member) -> Dict[str, Any]:
+    def sync_member_metafields_to_shopify(self, member: Member, background: bool = False) -> Dict[str, Any]:
         """
         Sync member data to Shopify customer metafields.
 
@@ -481,9 +481,12 @@ class MembershipService:
 
         Args:
             member: Member to sync
+            background: Read the member data now but make the Shopify calls
+                on the shared background pool instead of waiting for them
 
         Returns:
-            Dict with sync result
+            Dict with sync result ({'success': True, 'queued': True} when
+            background is set)
         """
         if not self.shopify_client:
             return {'success': False, 'error': 'Shopify not configured'}
@@ -492,17 +495,6 @@ class MembershipService:
             return {'success': False, 'error': 'Member not linked to Shopify'}
 
         try:
-            # Get store credit balance from Shopify
-            credit_balance = 0
-            try:
-                credit_result = self.shopify_client.get_store_credit_balance(
-                    member.shopify_customer_id
-                )
-                if credit_result:
-                    credit_balance = float(credit_result.get('balance', {}).get('amount', 0))
-            except Exception:
-                pass  # If credit fetch fails, use 0
-
             # Calculate trade-in stats
             from ..models.trade_in import TradeInBatch
             trade_in_count = TradeInBatch.query.filter_by(
@@ -552,12 +544,10 @@ class MembershipService:
                 # Convert bonus_rate to multiplier: 1.0 + bonus_rate
                 tier_earning_multiplier = 1.0 + float(member.tier.bonus_rate or 0)
 
-            # Sync to Shopify
-            result = self.shopify_client.sync_member_metafields(
+            fields = dict(
                 customer_id=member.shopify_customer_id,
                 member_number=member.member_number,
                 tier_name=member.tier.name if member.tier else None,
-                credit_balance=credit_balance,
                 trade_in_count=trade_in_count,
                 total_bonus_earned=total_bonus,
                 joined_date=member.membership_start_date.isoformat() if member.membership_start_date else None,
@@ -565,12 +555,16 @@ class MembershipService:
                 # New loyalty mode fields
                 loyalty_mode=loyalty_mode,
                 points_balance=points_balance,
-                store_credit_balance=credit_balance,  # Same as credit_balance
                 tier_cashback_pct=tier_cashback_pct,
                 tier_earning_multiplier=tier_earning_multiplier
             )
 
-            return result
+            if background:
+                from .shopify_client import submit_background
+                submit_background(self._push_member_metafields, fields)
+                return {'success': True, 'queued': True}
+
+            return self._push_member_metafields(fields)
 
         except Exception as e:
             return {
@@ -578,6 +572,31 @@ class MembershipService:
                 'error': str(e)
             }
 
+    def _push_member_metafields(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fetch the store credit balance and write the member metafields.
+
+        Only talks to Shopify (no database access), so it is safe to run on
+        the background pool.
+        """
+        # Get store credit balance from Shopify
+        credit_balance = 0
+        try:
+            credit_result = self.shopify_client.get_store_credit_balance(
+                fields['customer_id']
+            )
+            if credit_result:
+                credit_balance = float(credit_result.get('balance', {}).get('amount', 0))
+        except Exception:
+            pass  # If credit fetch fails, use 0
+
+        # Sync to Shopify
+        return self.shopify_client.sync_member_metafields(
+            credit_balance=credit_balance,
+            store_credit_balance=credit_balance,  # Same as credit_balance
+            **fields
+        )
+
     def remove_tier_tag(self, member: Member, tier_name: str) -> bool:
         """
         Remove a tier tag from Shopify customer.
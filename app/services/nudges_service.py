@@ -9,18 +9,115 @@ Automated notifications to engage members:
 """
 
 import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, date
 from decimal import Decimal
+from functools import lru_cache
+from itertools import count
+from threading import Lock, Thread, Timer
 from typing import Optional, List, Dict, Any
 
+from flask import current_app, has_app_context
+from sqlalchemy import and_, case, event, func, inspect
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, load_only, object_session, selectinload
+from sqlalchemy.orm.attributes import flag_modified
+
 from app import db
 from app.models.member import Member
-from app.models.loyalty_points import PointsLedger, PointsBalance
+from app.models.loyalty_points import PointsBalance
+from app.models.points import PointsTransaction
+from app.models.nudge_candidate import NudgeCandidate, NudgeCandidateRefresh
 from app.models.nudge_config import NudgeConfig, NudgeType
 from app.models.nudge_sent import NudgeSent
+from app.services.tier_cache_service import get_cached_tiers
+from app.utils.serialization import serialization_load_options
 
 logger = logging.getLogger(__name__)
 
+# Candidates older than this are ignored and pending nudges are computed live
+NUDGE_CANDIDATES_MAX_AGE = timedelta(minutes=30)
+
+# Bound on members waiting for an incremental candidate recompute
+NUDGE_CANDIDATES_QUEUE_SIZE = 1000
+
+# Member fields the candidate scans depend on; updates to other fields (profile
+# edits, timestamps) don't queue a recompute
+_NUDGE_CANDIDATE_MEMBER_FIELDS = ('points_balance', 'lifetime_points_earned', 'tier_id', 'status')
+
+# Rows fetched per round-trip when streaming member scans
+MEMBER_SCAN_BATCH_SIZE = 500
+
+# Concurrent email sends per reminder batch, and worker threads for queued sends
+NUDGE_EMAIL_MAX_WORKERS = 10
+
+# Queued reminder emails: capacity, retries after the first attempt, and the
+# base delay in seconds for exponential backoff between attempts
+NUDGE_EMAIL_QUEUE_SIZE = 5000
+NUDGE_EMAIL_MAX_RETRIES = 3
+NUDGE_EMAIL_RETRY_BASE_DELAY = 2
+
+# Member columns read by nudge listings: Member.to_dict() (without the
+# optional sections) plus the fields the listings filter and report on
+_NUDGE_MEMBER_COLUMNS = (
+    Member.id,
+    Member.tenant_id,
+    Member.tier_id,
+    Member.member_number,
+    Member.shopify_customer_id,
+    Member.shopify_customer_gid,
+    Member.partner_customer_id,
+    Member.email,
+    Member.name,
+    Member.phone,
+    Member.status,
+    Member.membership_start_date,
+    Member.created_at,
+    Member.updated_at,
+    Member.total_trade_ins,
+    Member.total_trade_value,
+    Member.total_bonus_earned,
+    Member.points_balance,
+    Member.lifetime_points_earned,
+    Member.lifetime_points_spent,
+    Member.birthday,
+)
+
+
+@lru_cache(maxsize=64)
+def _expiration_date_label(day: date) -> str:
+    """Human-readable expiry date for emails; batches share few dates, so cached."""
+    return day.strftime('%B %d, %Y')
+
+
+def _send_template_emails(emails: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Send template emails concurrently, returning results in input order.
+
+    Each email is a dict of send_template_email keyword arguments. Sends run
+    on a thread pool, each inside its own app context, since the work is
+    provider I/O. A send that raises becomes a failed result.
+    """
+    from app.services.email_service import email_service
+
+    app = current_app._get_current_object()
+
+    def send(email):
+        try:
+            with app.app_context():
+                return email_service.send_template_email(**email)
+        except Exception as e:
+            logger.exception('Template email to %s failed', email.get('to_email'))
+            return {'success': False, 'error': str(e)}
+
+    if len(emails) <= 1:
+        return [send(email) for email in emails]
+
+    with ThreadPoolExecutor(max_workers=min(NUDGE_EMAIL_MAX_WORKERS, len(emails)),
+                            thread_name_prefix='nudge-email') as pool:
+        return list(pool.map(send, emails))
+
 
 class NudgesService:
     """Service for managing member nudges and reminders."""
@@ -28,6 +125,31 @@ class NudgesService:
     def __init__(self, tenant_id: int, settings: Optional[Dict] = None):
         self.tenant_id = tenant_id
         self.settings = settings or {}
+        # Loaded once per service instance; cleared by the update_*_config methods
+        self._configs_by_type: Optional[Dict[str, NudgeConfig]] = None
+        self._nudge_settings: Optional[Dict[str, Any]] = None
+        self._tenant = None
+
+    def _get_configs_by_type(self) -> Dict[str, NudgeConfig]:
+        """Get the tenant's nudge configs keyed by nudge type, loading them once."""
+        if self._configs_by_type is None:
+            self._configs_by_type = {
+                config.nudge_type: config
+                for config in NudgeConfig.get_all_for_tenant(self.tenant_id)
+            }
+        return self._configs_by_type
+
+    def _get_tenant(self):
+        """Get the tenant, loading it once per service instance."""
+        if self._tenant is None:
+            from app.models.tenant import Tenant
+            self._tenant = Tenant.query.get(self.tenant_id)
+        return self._tenant
+
+    def _invalidate_nudge_configs(self) -> None:
+        """Drop the cached configs and settings after a config write."""
+        self._configs_by_type = None
+        self._nudge_settings = None
 
     def get_nudge_settings(self) -> Dict[str, Any]:
         """
@@ -35,8 +157,14 @@ class NudgesService:
 
         First checks NudgeConfig database records, then falls back to tenant settings JSON.
         """
+        if self._nudge_settings is None:
+            self._nudge_settings = self._build_nudge_settings()
+        return self._nudge_settings
+
+    def _build_nudge_settings(self) -> Dict[str, Any]:
+        """Build nudge settings from NudgeConfig records or tenant settings."""
         # Try to get settings from NudgeConfig database records
-        configs = NudgeConfig.get_all_for_tenant(self.tenant_id)
+        configs = self.get_all_nudge_configs()
 
         if configs:
             # Build settings from database configs
@@ -82,11 +210,11 @@ class NudgesService:
 
     def get_nudge_config(self, nudge_type: str) -> Optional[NudgeConfig]:
         """Get a specific nudge configuration by type."""
-        return NudgeConfig.get_by_type(self.tenant_id, nudge_type)
+        return self._get_configs_by_type().get(nudge_type)
 
     def get_all_nudge_configs(self) -> List[NudgeConfig]:
         """Get all nudge configurations for the tenant."""
-        return NudgeConfig.get_all_for_tenant(self.tenant_id)
+        return list(self._get_configs_by_type().values())
 
     def is_nudge_enabled(self, nudge_type: str) -> bool:
         """Check if a specific nudge type is enabled."""
@@ -96,67 +224,69 @@ class NudgesService:
         # Fall back to legacy settings
         return self.settings.get('nudges', {}).get('enabled', True)
 
-    def get_members_with_expiring_points(self, days_ahead: int = 30) -> List[Dict[str, Any]]:
-        """Get members with points expiring within N days."""
-        expiry_date = datetime.utcnow() + timedelta(days=days_ahead)
-
-        # Find points ledger entries expiring soon
-        expiring_entries = PointsLedger.query.filter(
-            PointsLedger.tenant_id == self.tenant_id,
-            PointsLedger.expires_at.isnot(None),
-            PointsLedger.expires_at <= expiry_date,
-            PointsLedger.expires_at > datetime.utcnow(),
-            PointsLedger.expired == False,
-            PointsLedger.remaining_points > 0
-        ).all()
-
-        # Group by member
-        member_points = {}
-        for entry in expiring_entries:
-            if entry.member_id not in member_points:
-                member_points[entry.member_id] = {
-                    'total_expiring': 0,
-                    'earliest_expiry': None,
-                    'entries': []
-                }
-
-            member_points[entry.member_id]['total_expiring'] += entry.remaining_points or entry.points
-            member_points[entry.member_id]['entries'].append(entry)
-
-            entry_expiry = entry.expires_at
-            if member_points[entry.member_id]['earliest_expiry'] is None or entry_expiry < member_points[entry.member_id]['earliest_expiry']:
-                member_points[entry.member_id]['earliest_expiry'] = entry_expiry
-
-        # Build result list
-        results = []
-        for member_id, data in member_points.items():
-            member = Member.query.get(member_id)
-            if member and member.status == 'active':
-                days_until = (data['earliest_expiry'] - datetime.utcnow()).days
-                results.append({
-                    'member': member.to_dict(),
-                    'expiring_points': data['total_expiring'],
-                    'earliest_expiry': data['earliest_expiry'].isoformat(),
-                    'days_until_expiry': days_until,
-                    'nudge_type': NudgeType.POINTS_EXPIRING.value,
-                })
-
-        # Sort by days until expiry (most urgent first)
-        results.sort(key=lambda x: x['days_until_expiry'])
-        return results
+    def get_members_with_expiring_points(
+        self,
+        days_ahead: int = 30,
+        member_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get members with points expiring within N days, optionally for one member."""
+        now = datetime.utcnow()
+        expiry_date = now + timedelta(days=days_ahead)
+
+        # Total unspent points and earliest expiry per member, aggregated in SQL
+        expiring_query = db.session.query(
+            PointsTransaction.member_id.label('member_id'),
+            func.sum(PointsTransaction.remaining_points).label('total_expiring'),
+            func.min(PointsTransaction.expires_at).label('earliest_expiry')
+        ).filter(
+            PointsTransaction.tenant_id == self.tenant_id,
+            PointsTransaction.transaction_type == 'earn',
+            PointsTransaction.reversed_at.is_(None),
+            PointsTransaction.expires_at.isnot(None),
+            PointsTransaction.expires_at <= expiry_date,
+            PointsTransaction.expires_at > now,
+            PointsTransaction.remaining_points > 0
+        )
+        if member_id is not None:
+            expiring_query = expiring_query.filter(PointsTransaction.member_id == member_id)
+        expiring = expiring_query.group_by(PointsTransaction.member_id).subquery()
+
+        # Most urgent first
+        rows = db.session.query(
+            Member, expiring.c.total_expiring, expiring.c.earliest_expiry
+        ).join(
+            expiring, expiring.c.member_id == Member.id
+        ).filter(
+            Member.tenant_id == self.tenant_id,
+            Member.status == 'active'
+        ).options(
+            load_only(*_NUDGE_MEMBER_COLUMNS),
+            *serialization_load_options(selectinload(Member.tier))
+        ).order_by(expiring.c.earliest_expiry).all()
+
+        return [
+            {
+                'member': member.to_dict(),
+                'expiring_points': int(total_expiring),
+                'earliest_expiry': earliest_expiry.isoformat(),
+                'days_until_expiry': (earliest_expiry - now).days,
+                'nudge_type': NudgeType.POINTS_EXPIRING.value,
+            }
+            for member, total_expiring, earliest_expiry in rows
+        ]
 
-    def get_members_near_tier_upgrade(self, threshold: float = 0.9) -> List[Dict[str, Any]]:
+    def get_members_near_tier_upgrade(
+        self,
+        threshold: float = 0.9,
+        member_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get members who are close to upgrading to the next tier.
         threshold = 0.9 means within 90% of required points/spend.
+        Pass member_id to check a single member.
         """
-        from app.models.member import MembershipTier
-
         # Get all tiers ordered by some criteria (e.g., bonus_rate or monthly_price)
-        tiers = MembershipTier.query.filter_by(
-            tenant_id=self.tenant_id,
-            is_active=True
-        ).order_by(MembershipTier.monthly_price.asc()).all()
+        tiers = self._get_active_tiers(sort_key='monthly_price')
 
         if len(tiers) < 2:
             return []  # Need at least 2 tiers for upgrades
@@ -164,149 +294,390 @@ class NudgesService:
         # Create tier progression map
         tier_progression = {}
         for i, tier in enumerate(tiers[:-1]):
-            tier_progression[tier.id] = tiers[i + 1]
+            tier_progression[tier['id']] = tiers[i + 1]
+
+        # Define tier thresholds based on tier benefits
+        # In a real implementation, this would be configurable per tier
+        tier_point_thresholds = {
+            'silver': 0,
+            'gold': 1000,
+            'platinum': 5000,
+        }
 
-        results = []
-        members = Member.query.filter_by(
-            tenant_id=self.tenant_id,
-            status='active'
-        ).all()
+        # Points required to reach the next tier, keyed by current tier ID
+        required_by_tier = {}
+        for tier_id, next_tier in tier_progression.items():
+            required_points = tier_point_thresholds.get(next_tier['name'].lower(), 0)
+            if required_points > 0:
+                required_by_tier[tier_id] = required_points
 
-        for member in members:
-            if not member.tier_id or member.tier_id not in tier_progression:
-                continue
+        if not required_by_tier:
+            return []
+
+        # Only candidates within the threshold leave the database
+        current_points = func.coalesce(Member.lifetime_points_earned, 0)
+        required = case(required_by_tier, value=Member.tier_id)
+        members_query = Member.query.options(
+            load_only(*_NUDGE_MEMBER_COLUMNS),
+            *serialization_load_options(selectinload(Member.tier))
+        ).filter(
+            Member.tenant_id == self.tenant_id,
+            Member.status == 'active',
+            Member.tier_id.in_(required_by_tier),
+            current_points >= required * threshold,
+            current_points < required
+        )
+        if member_id is not None:
+            members_query = members_query.filter(Member.id == member_id)
+        members = members_query.all()
 
+        results = []
+        for member in members:
             next_tier = tier_progression[member.tier_id]
+            required_points = required_by_tier[member.tier_id]
 
             # Check if member is near upgrade based on lifetime points
             # This is simplified - could be based on spend, trade-ins, etc.
             current_points = member.lifetime_points_earned or 0
-
-            # Define tier thresholds based on tier benefits
-            # In a real implementation, this would be configurable per tier
-            tier_point_thresholds = {
-                'silver': 0,
-                'gold': 1000,
-                'platinum': 5000,
-            }
-
-            next_tier_name = next_tier.name.lower()
-            if next_tier_name in tier_point_thresholds:
-                required_points = tier_point_thresholds[next_tier_name]
-                if required_points > 0:
-                    progress = current_points / required_points
-                    if progress >= threshold and progress < 1.0:
-                        points_needed = required_points - current_points
-                        results.append({
-                            'member': member.to_dict(),
-                            'current_tier': member.tier.to_dict() if member.tier else None,
-                            'next_tier': next_tier.to_dict(),
-                            'progress_percent': round(progress * 100, 1),
-                            'points_needed': points_needed,
-                            'nudge_type': NudgeType.TIER_UPGRADE_NEAR.value,
-                        })
+            progress = current_points / required_points
+            if progress >= threshold and progress < 1.0:
+                points_needed = required_points - current_points
+                results.append({
+                    'member': member.to_dict(),
+                    'current_tier': member.tier.to_dict() if member.tier else None,
+                    'next_tier': next_tier,
+                    'progress_percent': round(progress * 100, 1),
+                    'points_needed': points_needed,
+                    'nudge_type': NudgeType.TIER_PROGRESS.value,
+                })
 
         # Sort by progress (highest first)
         results.sort(key=lambda x: x['progress_percent'], reverse=True)
         return results
 
-    def get_inactive_members(self, days_inactive: int = 30) -> List[Dict[str, Any]]:
-        """Get members who haven't been active for N days."""
-        cutoff_date = datetime.utcnow() - timedelta(days=days_inactive)
+    def get_inactive_members(
+        self,
+        days_inactive: int = 30,
+        member_id: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Get members who haven't been active for N days, optionally for one member."""
+        now = datetime.utcnow()
+        cutoff_date = now - timedelta(days=days_inactive)
 
         # Find members with no recent activity
-        inactive_members = Member.query.filter(
+        query = Member.query.options(
+            load_only(*_NUDGE_MEMBER_COLUMNS),
+            *serialization_load_options(selectinload(Member.tier))
+        ).filter(
             Member.tenant_id == self.tenant_id,
             Member.status == 'active',
             Member.updated_at < cutoff_date
-        ).all()
+        )
+        if member_id is not None:
+            query = query.filter(Member.id == member_id)
+        inactive_members = query.all()
 
         results = []
         for member in inactive_members:
-            days_since_activity = (datetime.utcnow() - (member.updated_at or member.created_at)).days
+            days_since_activity = (now - (member.updated_at or member.created_at)).days
             results.append({
                 'member': member.to_dict(),
                 'days_inactive': days_since_activity,
                 'last_activity': member.updated_at.isoformat() if member.updated_at else None,
-                'nudge_type': NudgeType.INACTIVE_MEMBER.value,
+                'nudge_type': NudgeType.INACTIVE_REMINDER.value,
             })
 
         # Sort by days inactive (longest first)
         results.sort(key=lambda x: x['days_inactive'], reverse=True)
         return results
 
-    def get_members_at_points_milestone(self) -> List[Dict[str, Any]]:
-        """Get members who recently crossed a points milestone."""
+    def get_members_at_points_milestone(self, member_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get members who recently crossed a points milestone, optionally for one member."""
         settings = self.get_nudge_settings()
         milestones = settings['points_milestones']
 
-        results = []
-        members = Member.query.filter(
+        if not milestones:
+            return []
+
+        # First milestone (in configured order) the member is within 10% above,
+        # matched in SQL so only qualifying members are loaded
+        points = Member.lifetime_points_earned
+        milestone_reached = case(
+            *[
+                (and_(points >= milestone, points < milestone * 1.1), milestone)
+                for milestone in milestones
+            ]
+        ).label('milestone')
+
+        query = db.session.query(Member, milestone_reached).options(
+            load_only(*_NUDGE_MEMBER_COLUMNS),
+            *serialization_load_options(selectinload(Member.tier))
+        ).filter(
             Member.tenant_id == self.tenant_id,
             Member.status == 'active',
-            Member.lifetime_points_earned > 0
-        ).all()
-
-        for member in members:
-            points = member.lifetime_points_earned or 0
-            for milestone in milestones:
-                # Check if member just crossed this milestone (within last update)
-                if points >= milestone and points < milestone * 1.1:  # Within 10% above milestone
-                    results.append({
-                        'member': member.to_dict(),
-                        'milestone': milestone,
-                        'current_points': points,
-                        'nudge_type': NudgeType.POINTS_MILESTONE.value,
-                    })
-                    break  # Only count highest applicable milestone
+            Member.lifetime_points_earned > 0,
+            milestone_reached.isnot(None)
+        )
+        if member_id is not None:
+            query = query.filter(Member.id == member_id)
 
-        return results
+        # Stream members in batches rather than holding the whole tenant in memory
+        return [
+            {
+                'member': member.to_dict(),
+                'milestone': milestone,
+                'current_points': member.lifetime_points_earned,
+                'nudge_type': 'points_milestone',
+            }
+            for member, milestone in query.yield_per(MEMBER_SCAN_BATCH_SIZE)
+        ]
 
     def get_all_pending_nudges(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Get all pending nudges grouped by type."""
+        """
+        Get all pending nudges grouped by type.
+
+        Served from the precomputed nudge_candidates table when the last
+        refresh is recent enough, otherwise computed live.
+        """
         settings = self.get_nudge_settings()
 
         if not settings['enabled']:
             return {'error': 'Nudges are disabled', 'nudges': {}}
 
-        nudges = {
-            'points_expiring': self.get_members_with_expiring_points(days_ahead=30),
-            'tier_upgrade_near': self.get_members_near_tier_upgrade(
-                threshold=settings['tier_upgrade_threshold']
-            ),
-            'inactive_members': self.get_inactive_members(
-                days_inactive=settings['inactive_days']
-            ),
-            'points_milestones': self.get_members_at_points_milestone(),
-        }
-
-        # Add trade-in reminders only if trade-ins are enabled
-        if self.is_trade_ins_enabled_for_tenant():
-            trade_in_reminder_days = settings.get('trade_in_reminder_days', 60)
-            nudges['trade_in_reminders'] = self.get_members_needing_trade_in_reminder(
-                min_days_since_last=trade_in_reminder_days
-            )
+        nudges, generated_at = self._get_stored_pending_nudges()
+        if nudges is None:
+            nudges, generated_at = self._compute_pending_nudges(settings), None
 
         return {
             'success': True,
             'nudges': nudges,
             'total_count': sum(len(n) for n in nudges.values()),
+            'generated_at': generated_at.isoformat() if generated_at else None,
         }
 
+    def _compute_pending_nudges(
+        self,
+        settings: Dict[str, Any],
+        member_id: Optional[int] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Run the enabled nudge scans, tenant-wide or for one member, and group the results by type."""
+        groups = self._enabled_nudge_groups()
+        nudges = {}
+        if 'points_expiring' in groups:
+            nudges['points_expiring'] = self.get_members_with_expiring_points(
+                days_ahead=30, member_id=member_id
+            )
+        if 'tier_upgrade_near' in groups:
+            nudges['tier_upgrade_near'] = self.get_members_near_tier_upgrade(
+                threshold=settings['tier_upgrade_threshold'], member_id=member_id
+            )
+        if 'inactive_members' in groups:
+            nudges['inactive_members'] = self.get_inactive_members(
+                days_inactive=settings['inactive_days'], member_id=member_id
+            )
+        nudges['points_milestones'] = self.get_members_at_points_milestone(member_id=member_id)
+        if 'trade_in_reminders' in groups:
+            trade_in_reminder_days = settings.get('trade_in_reminder_days', 60)
+            nudges['trade_in_reminders'] = self.get_members_needing_trade_in_reminder(
+                min_days_since_last=trade_in_reminder_days, member_id=member_id
+            )
+
+        return nudges
+
+    def _enabled_nudge_groups(self) -> List[str]:
+        """
+        Pending-nudge group names whose nudge type is enabled, in display order.
+
+        Disabled types are dropped before their scan runs; the enabled checks
+        read the cached configs, so they cost no extra queries.
+        """
+        groups = []
+        if self.is_nudge_enabled(NudgeType.POINTS_EXPIRING.value):
+            groups.append('points_expiring')
+        if self.is_nudge_enabled(NudgeType.TIER_PROGRESS.value):
+            groups.append('tier_upgrade_near')
+        if self.is_nudge_enabled(NudgeType.INACTIVE_REMINDER.value):
+            groups.append('inactive_members')
+        groups.append('points_milestones')
+
+        # Add trade-in reminders only if trade-ins are enabled
+        if (self.is_nudge_enabled(NudgeType.TRADE_IN_REMINDER.value)
+                and self.is_trade_ins_enabled_for_tenant()):
+            groups.append('trade_in_reminders')
+        return groups
+
+    @staticmethod
+    def _candidate_rows(tenant_id: int, nudges: Dict[str, List[Dict[str, Any]]],
+                        generated_at: datetime) -> List[Dict[str, Any]]:
+        """Flatten grouped nudges into nudge_candidates column values."""
+        return [
+            {
+                'tenant_id': tenant_id,
+                'member_id': entry['member']['id'],
+                'nudge_type': nudge_type,
+                'payload': entry,
+                'generated_at': generated_at,
+            }
+            for nudge_type, entries in nudges.items()
+            for entry in entries
+        ]
+
+    @staticmethod
+    def _upsert_candidate_rows(rows: List[Dict[str, Any]]) -> None:
+        """
+        Write candidate rows, replacing any row with the same
+        (tenant_id, member_id, nudge_type).
+
+        Keyed on the unique index so a member recompute racing the full
+        refresh overwrites rows instead of duplicating them.
+        """
+        if not rows:
+            return
+        dialect = postgresql if db.session.get_bind().dialect.name == 'postgresql' else sqlite
+        stmt = dialect.insert(NudgeCandidate)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['tenant_id', 'member_id', 'nudge_type'],
+            set_={'payload': stmt.excluded.payload, 'generated_at': stmt.excluded.generated_at}
+        )
+        db.session.execute(stmt, rows)
+
+    def _get_fresh_candidates_time(self) -> Optional[datetime]:
+        """
+        Time of this tenant's last candidate refresh, or None when there is
+        no refresh newer than NUDGE_CANDIDATES_MAX_AGE.
+        """
+        generated_at = db.session.query(NudgeCandidateRefresh.generated_at).filter(
+            NudgeCandidateRefresh.tenant_id == self.tenant_id
+        ).scalar()
+
+        if generated_at is None or generated_at < datetime.utcnow() - NUDGE_CANDIDATES_MAX_AGE:
+            return None
+        return generated_at
+
+    def _get_stored_pending_nudges(self):
+        """
+        Read pending nudges from the nudge_candidates table.
+
+        Returns:
+            (nudges grouped by type, generated_at), or (None, None) when there
+            is no refresh newer than NUDGE_CANDIDATES_MAX_AGE
+        """
+        generated_at = self._get_fresh_candidates_time()
+        if generated_at is None:
+            return None, None
+
+        rows = NudgeCandidate.query.filter_by(
+            tenant_id=self.tenant_id
+        ).order_by(NudgeCandidate.id).all()
+
+        nudges = {group: [] for group in self._enabled_nudge_groups()}
+
+        for row in rows:
+            if row.nudge_type in nudges:
+                nudges[row.nudge_type].append(row.payload)
+
+        return nudges, generated_at
+
+    def refresh_nudge_candidates(self) -> int:
+        """
+        Recompute this tenant's pending nudges into the nudge_candidates table.
+
+        Upserts the new rows, deletes the tenant's older ones and records the
+        refresh time in a single transaction. The refresh time is recorded even
+        when no member qualifies, so an empty snapshot still counts as fresh.
+
+        Returns:
+            Number of candidate rows written
+        """
+        settings = self.get_nudge_settings()
+        nudges = self._compute_pending_nudges(settings) if settings['enabled'] else {}
+
+        generated_at = datetime.utcnow()
+        rows = self._candidate_rows(self.tenant_id, nudges, generated_at)
+
+        self._upsert_candidate_rows(rows)
+        NudgeCandidate.query.filter(
+            NudgeCandidate.tenant_id == self.tenant_id,
+            NudgeCandidate.generated_at < generated_at
+        ).delete(synchronize_session=False)
+        db.session.merge(NudgeCandidateRefresh(tenant_id=self.tenant_id, generated_at=generated_at))
+        db.session.commit()
+
+        return len(rows)
+
+    def recompute_member_nudges(self, member_id: int) -> int:
+        """
+        Recompute one member's rows in the nudge_candidates table.
+
+        Only applies while the tenant has a fresh refresh to patch; otherwise
+        reads fall back to live scans and the next full refresh covers the
+        member. Rows keep the refresh's generated_at, so the next refresh
+        replaces them along with the rest of the snapshot.
+
+        Returns:
+            Number of candidate rows written for the member
+        """
+        generated_at = self._get_fresh_candidates_time()
+        if generated_at is None:
+            return 0
+
+        settings = self.get_nudge_settings()
+        if not settings['enabled']:
+            return 0
+
+        nudges = self._compute_pending_nudges(settings, member_id=member_id)
+        rows = self._candidate_rows(self.tenant_id, nudges, generated_at)
+
+        # Drop the member's rows for nudges it no longer qualifies for, then
+        # upsert the rest
+        NudgeCandidate.query.filter(
+            NudgeCandidate.tenant_id == self.tenant_id,
+            NudgeCandidate.member_id == member_id,
+            NudgeCandidate.nudge_type.notin_([row['nudge_type'] for row in rows])
+        ).delete(synchronize_session=False)
+        self._upsert_candidate_rows(rows)
+        db.session.commit()
+
+        return len(rows)
+
+    def get_nudge_counts(self) -> Dict[str, int]:
+        """
+        Count pending nudges per group without building the entries.
+
+        Counts are grouped in SQL from the nudge_candidates table when the
+        last refresh is recent enough, otherwise the scans run live.
+        """
+        if self._get_fresh_candidates_time() is None:
+            nudges = self._compute_pending_nudges(self.get_nudge_settings())
+            return {group: len(entries) for group, entries in nudges.items()}
+
+        rows = db.session.query(
+            NudgeCandidate.nudge_type,
+            func.count(NudgeCandidate.id)
+        ).filter(
+            NudgeCandidate.tenant_id == self.tenant_id
+        ).group_by(NudgeCandidate.nudge_type).all()
+
+        counts = {group: 0 for group in self._enabled_nudge_groups()}
+        for nudge_type, count in rows:
+            if nudge_type in counts:
+                counts[nudge_type] = count
+        return counts
+
     def get_nudge_stats(self) -> Dict[str, Any]:
         """Get statistics about pending nudges."""
-        nudges = self.get_all_pending_nudges()
+        if not self.get_nudge_settings()['enabled']:
+            return {'error': 'Nudges are disabled', 'nudges': {}}
 
-        if 'error' in nudges:
-            return nudges
+        counts = self.get_nudge_counts()
 
         stats = {
-            'points_expiring': len(nudges['nudges'].get('points_expiring', [])),
-            'tier_upgrade_near': len(nudges['nudges'].get('tier_upgrade_near', [])),
-            'inactive_members': len(nudges['nudges'].get('inactive_members', [])),
-            'points_milestones': len(nudges['nudges'].get('points_milestones', [])),
-            'trade_in_reminders': len(nudges['nudges'].get('trade_in_reminders', [])),
-            'total': nudges.get('total_count', 0),
+            'points_expiring': counts.get('points_expiring', 0),
+            'tier_upgrade_near': counts.get('tier_upgrade_near', 0),
+            'inactive_members': counts.get('inactive_members', 0),
+            'points_milestones': counts.get('points_milestones', 0),
+            'trade_in_reminders': counts.get('trade_in_reminders', 0),
+            'total': sum(counts.values()),
         }
 
         return {
@@ -324,32 +695,14 @@ class NudgesService:
         if not member:
             return []
 
+        # Each check is scoped to this member rather than scanning the tenant
         nudges = []
+        nudges.extend(self.get_members_with_expiring_points(days_ahead=30, member_id=member_id))
+        nudges.extend(self.get_members_near_tier_upgrade(member_id=member_id))
+        nudges.extend(self.get_inactive_members(member_id=member_id))
 
-        # Check points expiring
-        expiring = self.get_members_with_expiring_points(days_ahead=30)
-        for n in expiring:
-            if n['member']['id'] == member_id:
-                nudges.append(n)
-
-        # Check tier upgrade proximity
-        tier_near = self.get_members_near_tier_upgrade()
-        for n in tier_near:
-            if n['member']['id'] == member_id:
-                nudges.append(n)
-
-        # Check inactivity
-        inactive = self.get_inactive_members()
-        for n in inactive:
-            if n['member']['id'] == member_id:
-                nudges.append(n)
-
-        # Check trade-in reminder (only if trade-ins enabled)
-        if self.is_trade_ins_enabled_for_tenant():
-            trade_in_reminders = self.get_members_needing_trade_in_reminder()
-            for n in trade_in_reminders:
-                if n['member']['id'] == member_id:
-                    nudges.append(n)
+        # Check trade-in reminder (disabled tenants get an empty list)
+        nudges.extend(self.get_members_needing_trade_in_reminder(member_id=member_id))
 
         return nudges
 
@@ -424,17 +777,18 @@ class NudgesService:
         threshold_days = config['threshold_days']
         max_threshold = max(threshold_days) if threshold_days else 30
 
-        expiring_members = self.get_members_with_expiring_points(days_ahead=max_threshold)
-        for data in expiring_members:
-            if data['member']['id'] == member_id:
-                return True
-
-        return False
+        return bool(self.get_members_with_expiring_points(
+            days_ahead=max_threshold, member_id=member_id
+        ))
 
     def send_points_expiring_reminder(
         self,
         member_id: int,
-        force: bool = False
+        force: bool = False,
+        expiring_data: Optional[Dict[str, Any]] = None,
+        record_sent_later: bool = False,
+        tenant=None,
+        points_balances: Optional[Dict[int, int]] = None
     ) -> Dict[str, Any]:
         """
         Send a points expiring reminder to a specific member.
@@ -442,13 +796,49 @@ class NudgesService:
         Args:
             member_id: The member to send reminder to
             force: Skip cooldown check if True
+            expiring_data: This member's entry from get_members_with_expiring_points,
+                           if the caller already has it
+            record_sent_later: Return the NudgeSent row as 'sent_record' instead of
+                               writing it, so batch callers can insert them together
+            tenant: The already-loaded Tenant, if the caller has it
+            points_balances: Available points keyed by member ID, preloaded by batch
+                             callers; members missing from it have no PointsBalance row
 
         Returns:
             Dict with success status and details
         """
-        from app.models.tenant import Tenant
         from app.services.email_service import email_service
 
+        prepared = self._prepare_points_expiring_reminder(
+            member_id,
+            force=force,
+            expiring_data=expiring_data,
+            tenant=tenant,
+            points_balances=points_balances,
+        )
+        if 'email' not in prepared:
+            return prepared
+
+        result = email_service.send_template_email(**prepared['email'])
+        return self._complete_points_expiring_reminder(prepared, result, record_sent_later)
+
+    def _prepare_points_expiring_reminder(
+        self,
+        member_id: int,
+        force: bool = False,
+        expiring_data: Optional[Dict[str, Any]] = None,
+        tenant=None,
+        points_balances: Optional[Dict[int, int]] = None
+    ) -> Dict[str, Any]:
+        """
+        Do the database work for a points expiring reminder, without sending.
+
+        Takes the same arguments as send_points_expiring_reminder.
+
+        Returns:
+            Dict with member_id, expiring_data and 'email' (send_template_email
+            keyword arguments), or an error dict if the reminder can't be sent
+        """
         member = Member.query.filter_by(
             id=member_id,
             tenant_id=self.tenant_id
@@ -469,53 +859,74 @@ class NudgesService:
                 return {'success': False, 'error': 'Reminder not due (cooldown or no expiring points)'}
 
         # Get tenant info
-        tenant = Tenant.query.get(self.tenant_id)
+        if tenant is None:
+            tenant = self._get_tenant()
         if not tenant:
             return {'success': False, 'error': 'Tenant not found'}
 
         # Get expiring points data
-        expiring_data = None
-        config = self.get_points_expiring_config()
-        max_threshold = max(config['threshold_days']) if config['threshold_days'] else 30
+        if expiring_data is None:
+            config = self.get_points_expiring_config()
+            max_threshold = max(config['threshold_days']) if config['threshold_days'] else 30
 
-        for data in self.get_members_with_expiring_points(days_ahead=max_threshold):
-            if data['member']['id'] == member_id:
-                expiring_data = data
-                break
+            expiring = self.get_members_with_expiring_points(
+                days_ahead=max_threshold, member_id=member_id
+            )
+            expiring_data = expiring[0] if expiring else None
 
         if not expiring_data:
             return {'success': False, 'error': 'No expiring points found for this member'}
 
         # Get member's current points balance
-        points_balance = PointsBalance.query.filter_by(member_id=member_id).first()
-        current_balance = points_balance.available_points if points_balance else member.points_balance or 0
+        if points_balances is not None:
+            available_points = points_balances.get(member_id)
+        else:
+            points_balance = PointsBalance.query.filter_by(member_id=member_id).first()
+            available_points = points_balance.available_points if points_balance else None
+        current_balance = available_points if available_points is not None else member.points_balance or 0
 
         # Build email data
         email_data = {
             'member_name': member.name or member.email.split('@')[0],
             'expiring_points': expiring_data['expiring_points'],
-            'expiration_date': datetime.fromisoformat(expiring_data['earliest_expiry']).strftime('%B %d, %Y'),
+            'expiration_date': _expiration_date_label(
+                datetime.fromisoformat(expiring_data['earliest_expiry']).date()
+            ),
             'days_until': expiring_data['days_until_expiry'],
             'current_balance': current_balance,
-            'shop_name': tenant.shop_name or tenant.shop_domain.split('.')[0].title(),
-            'shop_url': f"https://{tenant.shop_domain}",
+            'shop_name': tenant.shop_name or tenant.shopify_domain.split('.')[0].title(),
+            'shop_url': f"https://{tenant.shopify_domain}",
             'rewards_available': True,  # Could check for available rewards
             'rewards_list': '',  # Could list available rewards
         }
 
-        # Send email
-        result = email_service.send_template_email(
-            template_key='points_expiring',
-            tenant_id=self.tenant_id,
-            to_email=member.email,
-            to_name=member.name or '',
-            data=email_data,
-            from_name=email_data['shop_name'],
-        )
+        return {
+            'member_id': member_id,
+            'expiring_data': expiring_data,
+            'email': {
+                'template_key': 'points_expiring',
+                'tenant_id': self.tenant_id,
+                'to_email': member.email,
+                'to_name': member.name or '',
+                'data': email_data,
+                'from_name': email_data['shop_name'],
+            },
+        }
+
+    def _complete_points_expiring_reminder(
+        self,
+        prepared: Dict[str, Any],
+        result: Dict[str, Any],
+        record_sent_later: bool = False
+    ) -> Dict[str, Any]:
+        """Record and log the outcome of sending a prepared points expiring reminder."""
+        member_id = prepared['member_id']
+        expiring_data = prepared['expiring_data']
 
         # Record the nudge sent
+        sent_record = None
         if result.get('success'):
-            NudgeSent.record_sent(
+            sent_record = NudgeSent.sent_row(
                 tenant_id=self.tenant_id,
                 member_id=member_id,
                 nudge_type=NudgeType.POINTS_EXPIRING.value,
@@ -526,6 +937,9 @@ class NudgesService:
                 },
                 delivery_method='email',
             )
+            if not record_sent_later:
+                NudgeSent.record_sent_many([sent_record])
+                sent_record = None
             logger.info(f"Points expiring reminder sent to member {member_id} "
                        f"({expiring_data['expiring_points']} points expiring in "
                        f"{expiring_data['days_until_expiry']} days)")
@@ -541,6 +955,7 @@ class NudgesService:
             'days_until_expiry': expiring_data['days_until_expiry'],
             'email_sent': result.get('success', False),
             'error': result.get('error'),
+            'sent_record': sent_record,
         }
 
     def process_points_expiring_reminders(
@@ -550,6 +965,12 @@ class NudgesService:
         """
         Process and send points expiring reminders to all eligible members.
 
+        Reminders are prepared one by one, then the emails are sent concurrently
+        and the sent records inserted together. With NUDGE_EMAILS_ASYNC the
+        emails are queued for the background email workers instead, most
+        urgent first, and the result reports how many were queued; callers
+        count 'queued' alongside 'reminders_sent'.
+
         Args:
             days_threshold: Only process members with points expiring within this many days.
                            Uses config threshold_days if not provided.
@@ -578,30 +999,87 @@ class NudgesService:
             'errors': [],
         }
 
+        member_ids = [data['member']['id'] for data in expiring_members]
+
+        # One cooldown query for the whole batch
+        recently_sent = NudgeSent.recently_sent_member_ids(
+            tenant_id=self.tenant_id,
+            nudge_type=NudgeType.POINTS_EXPIRING.value,
+            member_ids=member_ids,
+            cooldown_days=config['frequency_days']
+        )
+
+        # Tenant and points balances are shared by every send in the batch
+        tenant = self._get_tenant()
+        points_balances = dict(db.session.query(
+            PointsBalance.member_id, PointsBalance.available_points
+        ).filter(PointsBalance.member_id.in_(member_ids)).all()) if member_ids else {}
+
+        prepared_reminders = []
         for data in expiring_members:
             member_id = data['member']['id']
 
             # Check cooldown
-            if NudgeSent.was_recently_sent(
-                tenant_id=self.tenant_id,
-                member_id=member_id,
-                nudge_type=NudgeType.POINTS_EXPIRING.value,
-                cooldown_days=config['frequency_days']
-            ):
+            if member_id in recently_sent:
                 results['skipped'] += 1
                 continue
 
-            # Send reminder
-            result = self.send_points_expiring_reminder(member_id, force=True)
-
-            if result.get('success'):
-                results['reminders_sent'] += 1
+            # Prepare reminder, reusing the data already fetched for this member
+            prepared = self._prepare_points_expiring_reminder(
+                member_id,
+                force=True,
+                expiring_data=data,
+                tenant=tenant,
+                points_balances=points_balances,
+            )
+            if 'email' in prepared:
+                prepared_reminders.append(prepared)
             else:
                 results['errors'].append({
                     'member_id': member_id,
-                    'error': result.get('error'),
+                    'error': prepared.get('error'),
                 })
 
+        if current_app.config.get('NUDGE_EMAILS_ASYNC'):
+            # Hand off to the email workers; they record each send as it succeeds
+            results['queued'] = 0
+            for prepared in prepared_reminders:
+                if _enqueue_nudge_email(
+                    self.tenant_id,
+                    NudgeType.POINTS_EXPIRING.value,
+                    prepared,
+                    priority=prepared['expiring_data']['days_until_expiry'],
+                ):
+                    results['queued'] += 1
+                else:
+                    results['errors'].append({
+                        'member_id': prepared['member_id'],
+                        'error': 'Reminder already queued or email queue full',
+                    })
+            return results
+
+        send_results = _send_template_emails([p['email'] for p in prepared_reminders])
+
+        # Sent records are inserted together once the batch finishes
+        sent_records = []
+        try:
+            for prepared, send_result in zip(prepared_reminders, send_results):
+                result = self._complete_points_expiring_reminder(
+                    prepared, send_result, record_sent_later=True
+                )
+
+                if result.get('success'):
+                    results['reminders_sent'] += 1
+                    sent_records.append(result['sent_record'])
+                else:
+                    results['errors'].append({
+                        'member_id': result['member_id'],
+                        'error': result.get('error'),
+                    })
+        finally:
+            # Record whatever was sent, even if a later member raised
+            NudgeSent.record_sent_many(sent_records)
+
         return results
 
     def get_points_expiring_nudge_history(
@@ -666,7 +1144,8 @@ class NudgesService:
 
     def get_members_near_tier_progress(
         self,
-        threshold_percent: Optional[float] = None
+        threshold_percent: Optional[float] = None,
+        member_id: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Get members who are close to reaching the next tier.
@@ -674,21 +1153,17 @@ class NudgesService:
         Args:
             threshold_percent: Minimum progress percentage (0.0-1.0) to include.
                              Default is 0.9 (90%), meaning members within 10% of next tier.
+            member_id: Only check this member (optional)
 
         Returns:
             List of dicts with member info, current tier, next tier, progress details
         """
-        from app.models.member import MembershipTier
-
         config = self.get_tier_progress_config()
         if threshold_percent is None:
             threshold_percent = config['threshold_percent']
 
         # Get all tiers ordered by bonus_rate (as a proxy for tier level)
-        tiers = MembershipTier.query.filter_by(
-            tenant_id=self.tenant_id,
-            is_active=True
-        ).order_by(MembershipTier.bonus_rate.asc()).all()
+        tiers = self._get_active_tiers(sort_key='bonus_rate')
 
         if len(tiers) < 2:
             return []  # Need at least 2 tiers for progression
@@ -703,48 +1178,72 @@ class NudgesService:
         base_threshold = 500  # Points needed for first upgrade
         for i, tier in enumerate(tiers):
             if i == 0:
-                tier_thresholds[tier.id] = 0  # Base tier requires no points
+                tier_thresholds[tier['id']] = 0  # Base tier requires no points
             else:
                 # Each tier requires more points (can be customized per tenant)
-                tier_thresholds[tier.id] = base_threshold * i
+                tier_thresholds[tier['id']] = base_threshold * i
 
             if i < len(tiers) - 1:
-                tier_progression[tier.id] = tiers[i + 1]
+                tier_progression[tier['id']] = tiers[i + 1]
+
+        # Position of each tier's range, keyed by current tier ID. The
+        # highest tier has no next tier, so its members are never candidates.
+        current_thresholds = {}
+        range_sizes = {}
+        for tier_id, next_tier in tier_progression.items():
+            next_tier_threshold = tier_thresholds.get(next_tier['id'], 0)
+            points_range = next_tier_threshold - tier_thresholds.get(tier_id, 0)
+            if next_tier_threshold > 0 and points_range > 0:
+                current_thresholds[tier_id] = tier_thresholds.get(tier_id, 0)
+                range_sizes[tier_id] = points_range
+
+        if not range_sizes:
+            return []
 
-        # Get highest tier ID (members at this tier are already at the top)
-        highest_tier_id = tiers[-1].id
+        # Benefits of each next tier, formatted once rather than per member
+        benefits_by_tier = {
+            tier_id: self._format_tier_benefits(tier_progression[tier_id])
+            for tier_id in range_sizes
+        }
 
-        results = []
-        members = Member.query.filter_by(
-            tenant_id=self.tenant_id,
-            status='active'
-        ).all()
+        # Filter on progress through the current range in SQL so only
+        # candidates near the next tier are loaded and serialized
+        points_in_range = (
+            func.coalesce(Member.lifetime_points_earned, 0)
+            - case(current_thresholds, value=Member.tier_id)
+        )
+        points_range = case(range_sizes, value=Member.tier_id)
+        progress_filters = [points_in_range < points_range]
+        if threshold_percent > 0:
+            # Progress is clamped at 0, so a non-positive threshold admits
+            # members below their tier's threshold as well
+            progress_filters.append(points_in_range >= points_range * threshold_percent)
+
+        members_query = Member.query.options(
+            load_only(*_NUDGE_MEMBER_COLUMNS),
+            *serialization_load_options(selectinload(Member.tier))
+        ).filter(
+            Member.tenant_id == self.tenant_id,
+            Member.status == 'active',
+            Member.tier_id.in_(range_sizes),
+            *progress_filters
+        )
+        if member_id is not None:
+            members_query = members_query.filter(Member.id == member_id)
+        members = members_query.yield_per(MEMBER_SCAN_BATCH_SIZE)
 
+        results = []
         for member in members:
-            # Skip members without a tier or at the highest tier
-            if not member.tier_id:
-                continue
-            if member.tier_id == highest_tier_id:
-                continue  # Already at highest tier, no progress to show
-            if member.tier_id not in tier_progression:
-                continue
-
             next_tier = tier_progression[member.tier_id]
-            next_tier_threshold = tier_thresholds.get(next_tier.id, 0)
-
-            if next_tier_threshold <= 0:
-                continue
+            next_tier_threshold = tier_thresholds[next_tier['id']]
 
             # Calculate progress based on lifetime points earned
             current_points = member.lifetime_points_earned or 0
-            current_tier_threshold = tier_thresholds.get(member.tier_id, 0)
+            current_tier_threshold = current_thresholds[member.tier_id]
 
             # Points needed within this tier range
             points_in_current_range = current_points - current_tier_threshold
-            points_range = next_tier_threshold - current_tier_threshold
-
-            if points_range <= 0:
-                continue
+            points_range = range_sizes[member.tier_id]
 
             progress = min(1.0, max(0.0, points_in_current_range / points_range))
 
@@ -752,19 +1251,16 @@ class NudgesService:
             if progress >= threshold_percent and progress < 1.0:
                 points_needed = next_tier_threshold - current_points
 
-                # Get benefits of next tier
-                next_tier_benefits = self._format_tier_benefits(next_tier)
-
                 results.append({
                     'member': member.to_dict(),
                     'current_tier': member.tier.to_dict() if member.tier else None,
-                    'next_tier': next_tier.to_dict(),
+                    'next_tier': next_tier,
                     'progress_percent': round(progress * 100, 1),
                     'progress_decimal': round(progress, 4),
                     'current_points': current_points,
                     'points_needed': max(0, points_needed),
                     'next_tier_threshold': next_tier_threshold,
-                    'next_tier_benefits': next_tier_benefits,
+                    'next_tier_benefits': benefits_by_tier[member.tier_id],
                     'nudge_type': NudgeType.TIER_PROGRESS.value,
                 })
 
@@ -772,40 +1268,86 @@ class NudgesService:
         results.sort(key=lambda x: x['progress_percent'], reverse=True)
         return results
 
+    def get_member_tier_progress(
+        self,
+        member_id: int,
+        threshold_percent: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get one member's tier progress entry, querying only that member.
+
+        Args:
+            member_id: The member ID
+            threshold_percent: Minimum progress (0.0-1.0); uses config threshold_percent
+                             if not provided
+
+        Returns:
+            The member's get_members_near_tier_progress entry, or None if they
+            are not near their next tier
+        """
+        if threshold_percent is None:
+            threshold_percent = self.get_tier_progress_config()['threshold_percent']
+
+        near_upgrade = self.get_members_near_tier_progress(
+            threshold_percent=threshold_percent, member_id=member_id
+        )
+        return near_upgrade[0] if near_upgrade else None
+
+    def _get_active_tiers(self, sort_key: str) -> List[Dict[str, Any]]:
+        """
+        Get the tenant's active tiers from the tier cache, lowest first.
+
+        The tier cache is invalidated whenever a tier is committed, so the
+        progression tables built from this stay current without a query per call.
+
+        Args:
+            sort_key: Tier field that orders the progression (e.g. 'bonus_rate')
+
+        Returns:
+            List of tier dicts sorted ascending by sort_key
+        """
+        return sorted(get_cached_tiers(self.tenant_id), key=lambda t: t[sort_key] or 0)
+
     def _format_tier_benefits(self, tier) -> List[str]:
         """
         Format tier benefits as a list of human-readable strings.
 
         Args:
-            tier: MembershipTier instance
+            tier: MembershipTier instance or its to_dict() output
 
         Returns:
             List of benefit descriptions
         """
+        if not isinstance(tier, dict):
+            tier = tier.to_dict()
+
         benefits = []
+        bonus_rate = float(tier['bonus_rate'] or 0)
+        monthly_credit = float(tier['monthly_credit_amount'] or 0)
+        cashback_pct = float(tier['purchase_cashback_pct'] or 0)
 
         # Bonus rate benefit
-        if tier.bonus_rate and float(tier.bonus_rate) > 0:
-            bonus_pct = round(float(tier.bonus_rate) * 100, 1)
-            benefits.append(f"{bonus_pct}% bonus on trade-ins")
+        if bonus_rate > 0:
+            benefits.append(f"{round(bonus_rate * 100, 1)}% bonus on trade-ins")
 
         # Monthly credit benefit
-        if tier.monthly_credit_amount and float(tier.monthly_credit_amount) > 0:
-            benefits.append(f"${float(tier.monthly_credit_amount):.2f} monthly store credit")
+        if monthly_credit > 0:
+            benefits.append(f"${monthly_credit:.2f} monthly store credit")
 
         # Purchase cashback benefit
-        if tier.purchase_cashback_pct and float(tier.purchase_cashback_pct) > 0:
-            benefits.append(f"{float(tier.purchase_cashback_pct)}% cashback on purchases")
+        if cashback_pct > 0:
+            benefits.append(f"{cashback_pct}% cashback on purchases")
 
         # JSON benefits field
-        if tier.benefits:
-            if tier.benefits.get('discount_percent'):
-                benefits.append(f"{tier.benefits['discount_percent']}% member discount")
-            if tier.benefits.get('free_shipping_threshold'):
-                benefits.append(f"Free shipping on orders ${tier.benefits['free_shipping_threshold']}+")
-            if tier.benefits.get('early_access'):
+        extra = tier['benefits']
+        if extra:
+            if extra.get('discount_percent'):
+                benefits.append(f"{extra['discount_percent']}% member discount")
+            if extra.get('free_shipping_threshold'):
+                benefits.append(f"Free shipping on orders ${extra['free_shipping_threshold']}+")
+            if extra.get('early_access'):
                 benefits.append("Early access to new releases")
-            if tier.benefits.get('exclusive_offers'):
+            if extra.get('exclusive_offers'):
                 benefits.append("Exclusive member offers")
 
         return benefits
@@ -851,19 +1393,15 @@ class NudgesService:
             return False
 
         # Check if member is near tier upgrade
-        near_upgrade = self.get_members_near_tier_progress(
-            threshold_percent=config['threshold_percent']
-        )
-        for data in near_upgrade:
-            if data['member']['id'] == member_id:
-                return True
-
-        return False
+        return self.get_member_tier_progress(member_id) is not None
 
     def send_tier_progress_reminder(
         self,
         member_id: int,
-        force: bool = False
+        force: bool = False,
+        progress_data: Optional[Dict[str, Any]] = None,
+        tenant=None,
+        record_sent_later: bool = False
     ) -> Dict[str, Any]:
         """
         Send a tier progress reminder to a specific member.
@@ -871,13 +1409,45 @@ class NudgesService:
         Args:
             member_id: The member to send reminder to
             force: Skip cooldown check if True
+            progress_data: This member's entry from get_members_near_tier_progress,
+                           if the caller already has it
+            tenant: The already-loaded Tenant, if the caller has it
+            record_sent_later: Return the NudgeSent row as 'sent_record' instead of
+                               writing it, so batch callers can insert them together
 
         Returns:
             Dict with success status and details
         """
-        from app.models.tenant import Tenant
         from app.services.email_service import email_service
 
+        prepared = self._prepare_tier_progress_reminder(
+            member_id,
+            force=force,
+            progress_data=progress_data,
+            tenant=tenant,
+        )
+        if 'email' not in prepared:
+            return prepared
+
+        result = email_service.send_template_email(**prepared['email'])
+        return self._complete_tier_progress_reminder(prepared, result, record_sent_later)
+
+    def _prepare_tier_progress_reminder(
+        self,
+        member_id: int,
+        force: bool = False,
+        progress_data: Optional[Dict[str, Any]] = None,
+        tenant=None
+    ) -> Dict[str, Any]:
+        """
+        Do the database work for a tier progress reminder, without sending.
+
+        Takes the same arguments as send_tier_progress_reminder.
+
+        Returns:
+            Dict with member_id, progress_data and 'email' (send_template_email
+            keyword arguments), or an error dict if the reminder can't be sent
+        """
         member = Member.query.filter_by(
             id=member_id,
             tenant_id=self.tenant_id
@@ -898,18 +1468,14 @@ class NudgesService:
                 return {'success': False, 'error': 'Reminder not due (cooldown or not near tier upgrade)'}
 
         # Get tenant info
-        tenant = Tenant.query.get(self.tenant_id)
+        if tenant is None:
+            tenant = self._get_tenant()
         if not tenant:
             return {'success': False, 'error': 'Tenant not found'}
 
         # Get tier progress data for this member
-        progress_data = None
-        config = self.get_tier_progress_config()
-
-        for data in self.get_members_near_tier_progress(threshold_percent=config['threshold_percent']):
-            if data['member']['id'] == member_id:
-                progress_data = data
-                break
+        if progress_data is None:
+            progress_data = self.get_member_tier_progress(member_id)
 
         if not progress_data:
             return {'success': False, 'error': 'Member is not near tier upgrade'}
@@ -926,23 +1492,37 @@ class NudgesService:
             'points_needed': progress_data['points_needed'],
             'next_tier_threshold': progress_data['next_tier_threshold'],
             'next_tier_benefits': benefits_list,
-            'shop_name': tenant.shop_name or tenant.shop_domain.split('.')[0].title(),
-            'shop_url': f"https://{tenant.shop_domain}",
+            'shop_name': tenant.shop_name or tenant.shopify_domain.split('.')[0].title(),
+            'shop_url': f"https://{tenant.shopify_domain}",
         }
 
-        # Send email
-        result = email_service.send_template_email(
-            template_key='tier_progress',
-            tenant_id=self.tenant_id,
-            to_email=member.email,
-            to_name=member.name or '',
-            data=email_data,
-            from_name=email_data['shop_name'],
-        )
+        return {
+            'member_id': member_id,
+            'progress_data': progress_data,
+            'email': {
+                'template_key': 'tier_progress',
+                'tenant_id': self.tenant_id,
+                'to_email': member.email,
+                'to_name': member.name or '',
+                'data': email_data,
+                'from_name': email_data['shop_name'],
+            },
+        }
+
+    def _complete_tier_progress_reminder(
+        self,
+        prepared: Dict[str, Any],
+        result: Dict[str, Any],
+        record_sent_later: bool = False
+    ) -> Dict[str, Any]:
+        """Record and log the outcome of sending a prepared tier progress reminder."""
+        member_id = prepared['member_id']
+        progress_data = prepared['progress_data']
 
         # Record the nudge sent
+        sent_record = None
         if result.get('success'):
-            NudgeSent.record_sent(
+            sent_record = NudgeSent.sent_row(
                 tenant_id=self.tenant_id,
                 member_id=member_id,
                 nudge_type=NudgeType.TIER_PROGRESS.value,
@@ -954,6 +1534,9 @@ class NudgesService:
                 },
                 delivery_method='email',
             )
+            if not record_sent_later:
+                NudgeSent.record_sent_many([sent_record])
+                sent_record = None
             logger.info(f"Tier progress reminder sent to member {member_id} "
                        f"({progress_data['progress_percent']}% to {progress_data['next_tier']['name']})")
         else:
@@ -969,6 +1552,7 @@ class NudgesService:
             'points_needed': progress_data['points_needed'],
             'email_sent': result.get('success', False),
             'error': result.get('error'),
+            'sent_record': sent_record,
         }
 
     def process_tier_progress_reminders(
@@ -978,6 +1562,9 @@ class NudgesService:
         """
         Process and send tier progress reminders to all eligible members.
 
+        Reminders are prepared one by one, then the emails are sent concurrently
+        and the sent records inserted together.
+
         Args:
             threshold_percent: Minimum progress to include (0.0-1.0).
                              Uses config threshold_percent if not provided.
@@ -1007,30 +1594,60 @@ class NudgesService:
             'errors': [],
         }
 
+        # One cooldown query for the whole batch
+        recently_sent = NudgeSent.recently_sent_member_ids(
+            tenant_id=self.tenant_id,
+            nudge_type=NudgeType.TIER_PROGRESS.value,
+            member_ids=[data['member']['id'] for data in near_upgrade_members],
+            cooldown_days=config['frequency_days']
+        )
+
+        # Tenant is shared by every send in the batch
+        tenant = self._get_tenant()
+
+        prepared_reminders = []
         for data in near_upgrade_members:
             member_id = data['member']['id']
 
             # Check cooldown
-            if NudgeSent.was_recently_sent(
-                tenant_id=self.tenant_id,
-                member_id=member_id,
-                nudge_type=NudgeType.TIER_PROGRESS.value,
-                cooldown_days=config['frequency_days']
-            ):
+            if member_id in recently_sent:
                 results['skipped'] += 1
                 continue
 
-            # Send reminder
-            result = self.send_tier_progress_reminder(member_id, force=True)
-
-            if result.get('success'):
-                results['reminders_sent'] += 1
+            # Prepare reminder, reusing the progress already computed for this member
+            prepared = self._prepare_tier_progress_reminder(
+                member_id, force=True, progress_data=data, tenant=tenant
+            )
+            if 'email' in prepared:
+                prepared_reminders.append(prepared)
             else:
                 results['errors'].append({
                     'member_id': member_id,
-                    'error': result.get('error'),
+                    'error': prepared.get('error'),
                 })
 
+        send_results = _send_template_emails([p['email'] for p in prepared_reminders])
+
+        # Sent records are inserted together once the batch finishes
+        sent_records = []
+        try:
+            for prepared, send_result in zip(prepared_reminders, send_results):
+                result = self._complete_tier_progress_reminder(
+                    prepared, send_result, record_sent_later=True
+                )
+
+                if result.get('success'):
+                    results['reminders_sent'] += 1
+                    sent_records.append(result['sent_record'])
+                else:
+                    results['errors'].append({
+                        'member_id': result['member_id'],
+                        'error': result.get('error'),
+                    })
+        finally:
+            # Record whatever was sent, even if a later member raised
+            NudgeSent.record_sent_many(sent_records)
+
         return results
 
     def get_tier_progress_nudge_history(
@@ -1101,8 +1718,10 @@ class NudgesService:
                 config.config_options = {}
             config.config_options['threshold_percent'] = threshold_percent
 
+        flag_modified(config, 'config_options')
         config.updated_at = datetime.utcnow()
         db.session.commit()
+        self._invalidate_nudge_configs()
 
         return {
             'success': True,
@@ -1142,8 +1761,10 @@ class NudgesService:
                 config.config_options = {}
             config.config_options['threshold_days'] = sorted(threshold_days, reverse=True)
 
+        flag_modified(config, 'config_options')
         config.updated_at = datetime.utcnow()
         db.session.commit()
+        self._invalidate_nudge_configs()
 
         return {
             'success': True,
@@ -1200,23 +1821,32 @@ class NudgesService:
         if inactive_days is None:
             inactive_days = config['inactive_days']
 
-        cutoff_date = datetime.utcnow() - timedelta(days=inactive_days)
+        now = datetime.utcnow()
+        cutoff_date = now - timedelta(days=inactive_days)
 
         # Find members with no recent activity
-        inactive_members = Member.query.filter(
+        inactive_members = Member.query.options(
+            load_only(*_NUDGE_MEMBER_COLUMNS),
+            *serialization_load_options(selectinload(Member.tier))
+        ).filter(
             Member.tenant_id == self.tenant_id,
             Member.status == 'active',
             Member.updated_at < cutoff_date
         ).all()
 
         results = []
+        benefits_by_tier = {}  # tier_id -> formatted benefits, shared by the tier's members
         for member in inactive_members:
-            days_since_activity = (datetime.utcnow() - (member.updated_at or member.created_at)).days
+            days_since_activity = (now - (member.updated_at or member.created_at)).days
 
             # Get member's current status summary
             points_balance = member.points_balance or 0
             tier_name = member.tier.name if member.tier else 'Member'
-            tier_benefits = self._format_tier_benefits(member.tier) if member.tier else []
+            if member.tier_id not in benefits_by_tier:
+                benefits_by_tier[member.tier_id] = (
+                    self._format_tier_benefits(member.tier) if member.tier else []
+                )
+            tier_benefits = benefits_by_tier[member.tier_id]
 
             # Calculate what they're missing
             missed_summary = self._calculate_missed_opportunities(member, days_since_activity)
@@ -1348,7 +1978,6 @@ class NudgesService:
         Returns:
             Dict with success status and details
         """
-        from app.models.tenant import Tenant
         from app.services.email_service import email_service
 
         member = Member.query.filter_by(
@@ -1371,7 +2000,7 @@ class NudgesService:
                 return {'success': False, 'error': 'Re-engagement email not due (cooldown or not inactive enough)'}
 
         # Get tenant info
-        tenant = Tenant.query.get(self.tenant_id)
+        tenant = self._get_tenant()
         if not tenant:
             return {'success': False, 'error': 'Tenant not found'}
 
@@ -1415,8 +2044,8 @@ class NudgesService:
             'tier_name': inactivity_data['tier_name'],
             'incentive_text': incentive_text,
             'missed_opportunities': missed_text,
-            'shop_name': tenant.shop_name or tenant.shop_domain.split('.')[0].title(),
-            'shop_url': f"https://{tenant.shop_domain}",
+            'shop_name': tenant.shop_name or tenant.shopify_domain.split('.')[0].title(),
+            'shop_url': f"https://{tenant.shopify_domain}",
         }
 
         # Send email
@@ -1659,8 +2288,10 @@ class NudgesService:
                 return {'success': False, 'error': 'Incentive amount must be positive'}
             config.config_options['incentive_amount'] = incentive_amount
 
+        flag_modified(config, 'config_options')
         config.updated_at = datetime.utcnow()
         db.session.commit()
+        self._invalidate_nudge_configs()
 
         return {
             'success': True,
@@ -1741,10 +2372,9 @@ class NudgesService:
         Returns:
             True if trade-ins are enabled, False otherwise
         """
-        from app.models.tenant import Tenant
         from app.utils.settings_defaults import get_settings_with_defaults
 
-        tenant = Tenant.query.get(self.tenant_id)
+        tenant = self._get_tenant()
         if not tenant:
             return False
 
@@ -1785,7 +2415,8 @@ class NudgesService:
 
     def get_members_needing_trade_in_reminder(
         self,
-        min_days_since_last: Optional[int] = None
+        min_days_since_last: Optional[int] = None,
+        member_id: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Get members who haven't done a trade-in in a while and may benefit from a reminder.
@@ -1797,6 +2428,7 @@ class NudgesService:
 
         Args:
             min_days_since_last: Minimum days since last trade-in to qualify (default: from config)
+            member_id: Only check this member (optional)
 
         Returns:
             List of dicts with member info and last trade-in details
@@ -1811,13 +2443,20 @@ class NudgesService:
         if min_days_since_last is None:
             min_days_since_last = config['min_days_since_last']
 
-        cutoff_date = datetime.utcnow() - timedelta(days=min_days_since_last)
+        now = datetime.utcnow()
+        cutoff_date = now - timedelta(days=min_days_since_last)
 
         # Get all active members with their most recent trade-in
-        members = Member.query.filter_by(
+        members_query = Member.query.options(
+            load_only(*_NUDGE_MEMBER_COLUMNS),
+            *serialization_load_options(selectinload(Member.tier))
+        ).filter_by(
             tenant_id=self.tenant_id,
             status='active'
-        ).all()
+        )
+        if member_id is not None:
+            members_query = members_query.filter_by(id=member_id)
+        members = members_query.all()
 
         results = []
         for member in members:
@@ -1836,7 +2475,7 @@ class NudgesService:
             if last_trade_in.trade_in_date >= cutoff_date:
                 continue  # Too recent, skip
 
-            days_since_last = (datetime.utcnow() - last_trade_in.trade_in_date).days
+            days_since_last = (now - last_trade_in.trade_in_date).days
 
             # Get trade-in stats for this member
             trade_in_count = TradeInBatch.query.filter(
@@ -1938,7 +2577,6 @@ class NudgesService:
         Returns:
             Dict with success status and details
         """
-        from app.models.tenant import Tenant
         from app.services.email_service import email_service
 
         # Check if trade-ins are enabled
@@ -1965,7 +2603,7 @@ class NudgesService:
                 return {'success': False, 'error': 'Reminder not due (cooldown, no qualifying trade-in history, or trade-ins disabled)'}
 
         # Get tenant info
-        tenant = Tenant.query.get(self.tenant_id)
+        tenant = self._get_tenant()
         if not tenant:
             return {'success': False, 'error': 'Tenant not found'}
 
@@ -2005,8 +2643,8 @@ class NudgesService:
             'tier_bonus': reminder_data.get('tier_bonus', 0),
             'credit_rates': rates_text,
             'has_tier_bonus': reminder_data.get('tier_bonus', 0) > 0,
-            'shop_name': tenant.shop_name or tenant.shop_domain.split('.')[0].title(),
-            'shop_url': f"https://{tenant.shop_domain}",
+            'shop_name': tenant.shop_name or tenant.shopify_domain.split('.')[0].title(),
+            'shop_url': f"https://{tenant.shopify_domain}",
         }
 
         # Send email
@@ -2088,6 +2726,14 @@ class NudgesService:
             'errors': [],
         }
 
+        # One cooldown query for the whole batch
+        recently_sent = NudgeSent.recently_sent_member_ids(
+            tenant_id=self.tenant_id,
+            nudge_type=NudgeType.TRADE_IN_REMINDER.value,
+            member_ids=[data['member']['id'] for data in qualifying_members],
+            cooldown_days=config['frequency_days']
+        )
+
         emails_sent = 0
         for data in qualifying_members:
             if emails_sent >= max_emails:
@@ -2096,12 +2742,7 @@ class NudgesService:
             member_id = data['member']['id']
 
             # Check cooldown
-            if NudgeSent.was_recently_sent(
-                tenant_id=self.tenant_id,
-                member_id=member_id,
-                nudge_type=NudgeType.TRADE_IN_REMINDER.value,
-                cooldown_days=config['frequency_days']
-            ):
+            if member_id in recently_sent:
                 results['skipped'] += 1
                 continue
 
@@ -2237,8 +2878,10 @@ class NudgesService:
                 return {'success': False, 'error': 'min_days_since_last must be at least 1'}
             config.config_options['min_days_since_last'] = min_days_since_last
 
+        flag_modified(config, 'config_options')
         config.updated_at = datetime.utcnow()
         db.session.commit()
+        self._invalidate_nudge_configs()
 
         return {
             'success': True,
@@ -2458,3 +3101,196 @@ class NudgesService:
             'revenue_per_nudge': round(total_revenue / total_sent, 2) if total_sent > 0 else 0.0,
             'conversion_rate': round(total_conversions / total_sent * 100, 2) if total_sent > 0 else 0.0,
         }
+
+
+# ==================== Queued Reminder Emails ====================
+
+# Prepared reminders wait in a priority queue (lowest value first) drained by
+# daemon worker threads. Failed sends are re-queued with exponential backoff.
+# Keys of queued reminders are held so a later run cannot queue them twice.
+# Jobs live only in this process, so a restart drops anything still queued.
+_nudge_email_queue = None
+_nudge_email_lock = Lock()
+_nudge_email_sequence = count()
+_queued_nudge_keys = set()
+_queued_nudge_keys_lock = Lock()
+
+
+def _release_nudge_key(key) -> None:
+    """Allow a reminder to be queued again once its job is finished."""
+    with _queued_nudge_keys_lock:
+        _queued_nudge_keys.discard(key)
+
+
+def _nudge_email_worker(q):
+    """Send queued reminder emails one at a time."""
+    while True:
+        _, _, job = q.get()
+        try:
+            _deliver_nudge_email(job)
+        except Exception:
+            logger.exception('Queued nudge email failed for member %s', job['prepared']['member_id'])
+            _release_nudge_key(job['key'])
+        finally:
+            q.task_done()
+
+
+def _get_nudge_email_queue():
+    """Return the email queue, starting the daemon worker threads on first use."""
+    global _nudge_email_queue
+    if _nudge_email_queue is None:
+        with _nudge_email_lock:
+            if _nudge_email_queue is None:
+                q = queue.PriorityQueue(maxsize=NUDGE_EMAIL_QUEUE_SIZE)
+                for i in range(NUDGE_EMAIL_MAX_WORKERS):
+                    Thread(target=_nudge_email_worker, args=(q,), daemon=True,
+                           name=f'nudge-email-{i}').start()
+                _nudge_email_queue = q
+    return _nudge_email_queue
+
+
+def _put_nudge_email(job) -> bool:
+    """Put a job on the email queue, returning False if the queue is full."""
+    try:
+        _get_nudge_email_queue().put_nowait((job['priority'], next(_nudge_email_sequence), job))
+        return True
+    except queue.Full:
+        return False
+
+
+def _enqueue_nudge_email(tenant_id: int, nudge_type: str, prepared: Dict[str, Any],
+                         priority: int = 0) -> bool:
+    """
+    Queue a prepared reminder email for the background workers.
+
+    Returns:
+        False if the same reminder is already queued or the queue is full
+    """
+    key = (tenant_id, prepared['member_id'], nudge_type)
+    with _queued_nudge_keys_lock:
+        if key in _queued_nudge_keys:
+            return False
+        _queued_nudge_keys.add(key)
+
+    job = {
+        'app': current_app._get_current_object(),
+        'tenant_id': tenant_id,
+        'key': key,
+        'prepared': prepared,
+        'priority': priority,
+        'attempt': 0,
+    }
+    if not _put_nudge_email(job):
+        _release_nudge_key(key)
+        logger.warning('Nudge email queue full, reminder for member %s not queued',
+                       prepared['member_id'])
+        return False
+    return True
+
+
+def _deliver_nudge_email(job) -> None:
+    """Send one queued reminder, retrying with backoff before recording the outcome."""
+    from app.services.email_service import email_service
+
+    with job['app'].app_context():
+        try:
+            result = email_service.send_template_email(**job['prepared']['email'])
+        except Exception as e:
+            result = {'success': False, 'error': str(e)}
+
+        if not result.get('success') and job['attempt'] < NUDGE_EMAIL_MAX_RETRIES:
+            delay = NUDGE_EMAIL_RETRY_BASE_DELAY * 2 ** job['attempt']
+            job = dict(job, attempt=job['attempt'] + 1)
+            retry = Timer(delay, _retry_nudge_email, args=(job,))
+            retry.daemon = True
+            retry.start()
+            return
+
+        try:
+            NudgesService(job['tenant_id'])._complete_points_expiring_reminder(job['prepared'], result)
+        finally:
+            _release_nudge_key(job['key'])
+
+
+def _retry_nudge_email(job) -> None:
+    """Put a failed reminder back on the queue once its backoff has elapsed."""
+    if not _put_nudge_email(job):
+        logger.warning('Nudge email queue full, dropping retry for member %s',
+                       job['prepared']['member_id'])
+        _release_nudge_key(job['key'])
+
+
+# ==================== Incremental Candidate Updates ====================
+
+# Members touched in a transaction are held on the session until commit, then
+# handed to a background thread that recomputes just their candidate rows.
+_CANDIDATES_PENDING_KEY = 'nudge_candidates_pending_members'
+
+_candidates_queue = None
+_candidates_lock = Lock()
+
+
+def _candidates_worker(q):
+    """Recompute queued members' nudge candidates, one member at a time."""
+    while True:
+        app, tenant_id, member_id = q.get()
+        try:
+            with app.app_context():
+                NudgesService(tenant_id).recompute_member_nudges(member_id)
+        except Exception:
+            logger.exception('Nudge candidate recompute failed for tenant %s member %s',
+                             tenant_id, member_id)
+        finally:
+            q.task_done()
+
+
+def _get_candidates_queue():
+    """Return the recompute queue, starting the daemon worker thread on first use."""
+    global _candidates_queue
+    if _candidates_queue is None:
+        with _candidates_lock:
+            if _candidates_queue is None:
+                q = queue.Queue(maxsize=NUDGE_CANDIDATES_QUEUE_SIZE)
+                Thread(target=_candidates_worker, args=(q,), daemon=True,
+                       name='nudge-candidates').start()
+                _candidates_queue = q
+    return _candidates_queue
+
+
+@event.listens_for(PointsTransaction, 'after_insert')
+@event.listens_for(PointsTransaction, 'after_update')
+@event.listens_for(Member, 'after_update')
+def _mark_member_candidates_dirty(mapper, connection, target):
+    if isinstance(target, Member):
+        state = inspect(target)
+        if not any(state.attrs[field].history.has_changes() for field in _NUDGE_CANDIDATE_MEMBER_FIELDS):
+            return
+    session = object_session(target)
+    member_id = target.id if isinstance(target, Member) else target.member_id
+    if session is not None and target.tenant_id is not None and member_id is not None:
+        session.info.setdefault(_CANDIDATES_PENDING_KEY, set()).add((target.tenant_id, member_id))
+
+
+@event.listens_for(Session, 'after_commit')
+def _enqueue_dirty_member_candidates(session):
+    pending = session.info.pop(_CANDIDATES_PENDING_KEY, None)
+    if not pending or not has_app_context():
+        return
+    app = current_app._get_current_object()
+    if not app.config.get('NUDGE_CANDIDATES_INCREMENTAL', True):
+        return
+
+    q = _get_candidates_queue()
+    for tenant_id, member_id in pending:
+        try:
+            q.put_nowait((app, tenant_id, member_id))
+        except queue.Full:
+            # The periodic full refresh catches up on anything dropped here
+            logger.warning('Nudge candidate queue full, deferring to next refresh')
+            break
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_dirty_member_candidates(session, previous_transaction):
+    if previous_transaction.parent is None:
+        session.info.pop(_CANDIDATES_PENDING_KEY, None)
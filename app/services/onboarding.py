@@ -12,6 +12,7 @@ https://cardflowlabs.com
 from typing import Dict, List, Optional
 from ..extensions import db
 from ..models import MembershipTier, Tenant, seed_nudge_configs
+from .tier_cache_service import invalidate_tier_cache
 
 
 # Pre-built tier templates for different business types
@@ -188,6 +189,28 @@ TIER_TEMPLATES = {
     }
 }
 
+# Templates are static, so the listing and preview payloads are built once at
+# import. These are shared between requests and must not be mutated.
+_TEMPLATE_SUMMARIES = {
+    key: {
+        'key': key,
+        'name': template['name'],
+        'description': template['description'],
+        'tier_count': len(template['tiers']),
+        'tiers': template['tiers']
+    }
+    for key, template in TIER_TEMPLATES.items()
+}
+_TEMPLATE_PREVIEWS = {
+    key: {
+        'key': key,
+        'name': template['name'],
+        'description': template['description'],
+        'tiers': template['tiers']
+    }
+    for key, template in TIER_TEMPLATES.items()
+}
+
 
 class OnboardingService:
     """
@@ -205,7 +228,14 @@ class OnboardingService:
 
     def __init__(self, tenant_id: int):
         self.tenant_id = tenant_id
-        self.tenant = Tenant.query.get(tenant_id)
+        self._tenant: Optional[Tenant] = None
+
+    @property
+    def tenant(self) -> Optional[Tenant]:
+        """The tenant, loaded on first use and reused for the service's lifetime."""
+        if self._tenant is None:
+            self._tenant = Tenant.query.get(self.tenant_id)
+        return self._tenant
 
     def check_store_credit_enabled(self) -> Dict:
         """
@@ -309,19 +339,10 @@ class OnboardingService:
         plan = self.tenant.subscription_plan or 'free'
         max_tiers = self._get_max_tiers(plan)
 
-        available = []
-        for key, template in TIER_TEMPLATES.items():
-            tier_count = len(template['tiers'])
-            if tier_count <= max_tiers:
-                available.append({
-                    'key': key,
-                    'name': template['name'],
-                    'description': template['description'],
-                    'tier_count': tier_count,
-                    'tiers': template['tiers']
-                })
-
-        return available
+        return [
+            summary for summary in _TEMPLATE_SUMMARIES.values()
+            if summary['tier_count'] <= max_tiers
+        ]
 
     def apply_template(self, template_key: str) -> Dict:
         """
@@ -340,12 +361,14 @@ class OnboardingService:
 
         template = TIER_TEMPLATES[template_key]
 
-        # Delete existing tiers (if any)
+        # Delete existing tiers (if any). Keep the default session sync: loaded
+        # tiers must leave the identity map, or a reused primary key in the
+        # INSERT ... RETURNING below resolves to the stale deleted instance
         MembershipTier.query.filter_by(tenant_id=self.tenant_id).delete()
 
         # Create tiers from template
         # Map template fields to MembershipTier model fields
-        created_tiers = []
+        tier_rows = []
         for idx, tier_data in enumerate(template['tiers']):
             # Convert trade_in_rate (e.g., 50 for 50%) to bonus_rate (0.50)
             trade_in_rate = tier_data.get('trade_in_rate', 50)
@@ -364,17 +387,25 @@ class OnboardingService:
             if tier_data.get('min_spend_requirement'):
                 benefits['min_spend_requirement'] = tier_data['min_spend_requirement']
 
-            tier = MembershipTier(
-                tenant_id=self.tenant_id,
-                name=tier_data['name'],
-                monthly_price=tier_data.get('monthly_fee', 0),
-                bonus_rate=bonus_rate,
-                benefits=benefits,
-                display_order=idx,
-                is_active=True
-            )
-            db.session.add(tier)
-            created_tiers.append(tier)
+            tier_rows.append({
+                'tenant_id': self.tenant_id,
+                'name': tier_data['name'],
+                'monthly_price': tier_data.get('monthly_fee', 0),
+                'bonus_rate': bonus_rate,
+                'benefits': benefits,
+                'display_order': idx,
+                'is_active': True,
+            })
+
+        # One multi-row INSERT ... RETURNING gives back the created tiers in template order
+        created_tiers = db.session.scalars(
+            db.insert(MembershipTier).returning(MembershipTier, sort_by_parameter_order=True),
+            tier_rows
+        ).all()
+
+        # Serialize now: the commit below expires the tiers, and reading them
+        # afterwards would reload each one with its own SELECT
+        tier_dicts = [t.to_dict() for t in created_tiers]
 
         # Mark onboarding as complete
         from sqlalchemy.orm.attributes import flag_modified
@@ -388,6 +419,9 @@ class OnboardingService:
         flag_modified(self.tenant, 'settings')
         db.session.commit()
 
+        # The bulk DELETE and INSERT bypass the ORM events that keep the tier cache current
+        invalidate_tier_cache(self.tenant_id)
+
         # Seed default nudge configurations for the tenant
         seed_nudge_configs(self.tenant_id)
 
@@ -395,7 +429,7 @@ class OnboardingService:
             'success': True,
             'template': template_key,
             'tiers_created': len(created_tiers),
-            'tiers': [t.to_dict() for t in created_tiers]
+            'tiers': tier_dicts
         }
 
     def get_onboarding_status(self) -> Dict:
@@ -431,16 +465,7 @@ def get_template_preview(template_key: str) -> Optional[Dict]:
 
     Used to show merchants what they'll get before applying.
     """
-    if template_key not in TIER_TEMPLATES:
-        return None
-
-    template = TIER_TEMPLATES[template_key]
-    return {
-        'key': template_key,
-        'name': template['name'],
-        'description': template['description'],
-        'tiers': template['tiers']
-    }
+    return _TEMPLATE_PREVIEWS.get(template_key)
 
 
 def calculate_member_rate(tier_trade_in_rate: float, market_value: float) -> float:
@@ -3,17 +3,81 @@ Shopify Admin API client.
 Handles store credit operations and customer management.
 """
 import logging
+import threading
 import time
 import httpx
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Dict, Any, List
 from flask import current_app
 
+from ..utils.json_provider import dumps_bytes
+
 logger = logging.getLogger(__name__)
 
 # Rate limit configuration
 MAX_RETRIES = 3
 INITIAL_BACKOFF_SECONDS = 1.0
 
+# Optional HTTP/2 support (graceful fallback to HTTP/1.1 if h2 not installed)
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+# Shared keep-alive connection pool for Admin API calls. httpx.Client is
+# thread-safe; reusing it skips a TCP+TLS handshake on every GraphQL request.
+# With HTTP/2, concurrent requests to a shop (e.g. a batch of Flow triggers)
+# multiplex over one connection instead of queueing for pooled HTTP/1.1 ones.
+HTTP_POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0
+)
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """Return the process-wide pooled HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    limits=HTTP_POOL_LIMITS,
+                    timeout=30.0,
+                    http2=h2 is not None
+                )
+    return _http_client
+
+
+# Shared worker pool for Shopify side effects the caller does not wait on
+# (e.g. metafield syncs after a tier change). Workers reuse the pooled client.
+BACKGROUND_MAX_WORKERS = 20
+_background_executor = None
+
+
+def _run_background(fn, args, kwargs):
+    try:
+        return fn(*args, **kwargs)
+    except Exception as e:
+        logger.exception('Background Shopify task %s failed: %s', getattr(fn, '__name__', fn), e)
+        raise
+
+
+def submit_background(fn, *args, **kwargs) -> Future:
+    """Run fn(*args, **kwargs) on the shared background pool; failures are logged."""
+    global _background_executor
+    if _background_executor is None:
+        with _http_client_lock:
+            if _background_executor is None:
+                _background_executor = ThreadPoolExecutor(
+                    max_workers=BACKGROUND_MAX_WORKERS,
+                    thread_name_prefix='shopify-background'
+                )
+    return _background_executor.submit(_run_background, fn, args, kwargs)
+
+
 # Valid Shopify metafield types (as of 2025-01 API)
 # https://shopify.dev/docs/apps/custom-data/metafields/types
 VALID_METAFIELD_TYPES = {
@@ -148,46 +212,48 @@ class ShopifyClient:
         payload = {'query': query}
         if variables:
             payload['variables'] = variables
+        # Encode once up front (orjson when installed) rather than on every retry
+        body = dumps_bytes(payload)
 
         last_exception = None
         backoff = INITIAL_BACKOFF_SECONDS
 
         for attempt in range(MAX_RETRIES):
             try:
-                with httpx.Client() as client:
-                    response = client.post(
-                        self.graphql_url,
-                        headers=headers,
-                        json=payload,
-                        timeout=30.0
-                    )
+                client = _get_http_client()
+                response = client.post(
+                    self.graphql_url,
+                    headers=headers,
+                    content=body,
+                    timeout=30.0
+                )
 
-                    # Handle HTTP 429 Too Many Requests
-                    if response.status_code == 429:
-                        retry_after = float(response.headers.get('Retry-After', backoff))
-                        logger.warning(f'Rate limited (HTTP 429), retrying in {retry_after}s (attempt {attempt + 1}/{MAX_RETRIES})')
-                        time.sleep(retry_after)
-                        backoff *= 2  # Exponential backoff
+                # Handle HTTP 429 Too Many Requests
+                if response.status_code == 429:
+                    retry_after = float(response.headers.get('Retry-After', backoff))
+                    logger.warning(f'Rate limited (HTTP 429), retrying in {retry_after}s (attempt {attempt + 1}/{MAX_RETRIES})')
+                    time.sleep(retry_after)
+                    backoff *= 2  # Exponential backoff
+                    continue
+
+                response.raise_for_status()
+                result = response.json()
+
+                # Check for GraphQL THROTTLED errors
+                if 'errors' in result:
+                    is_throttled = any(
+                        error.get('extensions', {}).get('code') == 'THROTTLED'
+                        for error in result['errors']
+                    )
+                    if is_throttled and attempt < MAX_RETRIES - 1:
+                        logger.warning(f'Rate limited (THROTTLED), retrying in {backoff}s (attempt {attempt + 1}/{MAX_RETRIES})')
+                        time.sleep(backoff)
+                        backoff *= 2
                         continue
+                    # Non-throttle error or final attempt
+                    raise Exception(f"GraphQL errors: {result['errors']}")
 
-                    response.raise_for_status()
-                    result = response.json()
-
-                    # Check for GraphQL THROTTLED errors
-                    if 'errors' in result:
-                        is_throttled = any(
-                            error.get('extensions', {}).get('code') == 'THROTTLED'
-                            for error in result['errors']
-                        )
-                        if is_throttled and attempt < MAX_RETRIES - 1:
-                            logger.warning(f'Rate limited (THROTTLED), retrying in {backoff}s (attempt {attempt + 1}/{MAX_RETRIES})')
-                            time.sleep(backoff)
-                            backoff *= 2
-                            continue
-                        # Non-throttle error or final attempt
-                        raise Exception(f"GraphQL errors: {result['errors']}")
-
-                    return result.get('data', {})
+                return result.get('data', {})
 
             except httpx.HTTPStatusError as e:
                 last_exception = e
@@ -34,6 +34,25 @@ from ..models.promotions import (
 )
 from .shopify_client import ShopifyClient
 
+# Shopify balances are cached briefly for read-heavy callers (e.g. Flow
+# get-member actions). Credits and debits made through this service drop the
+# cached value; changes made elsewhere in Shopify show up within the TTL.
+SHOPIFY_BALANCE_CACHE_TTL = 60
+
+
+def _get_cache():
+    """Get cache instance, returns None if unavailable."""
+    try:
+        from ..utils.cache import cache
+        return cache
+    except ImportError:
+        return None
+
+
+def _make_balance_cache_key(tenant_id: int, shopify_customer_id: str) -> str:
+    """Generate cache key for a customer's Shopify store credit balance."""
+    return f'shopify_credit_balance:{tenant_id}:{shopify_customer_id}'
+
 
 class StoreCreditService:
     """
@@ -76,6 +95,38 @@ class StoreCreditService:
             current_app.logger.error(f"Error fetching Shopify balance for member {member.id}: {e}")
             return {'balance': 0, 'currency': 'USD', 'account_id': None, 'error': str(e)}
 
+    def get_cached_shopify_balance(self, member: Member) -> Dict[str, Any]:
+        """
+        Get the Shopify store credit balance, cached for SHOPIFY_BALANCE_CACHE_TTL.
+
+        Failed lookups are not cached.
+
+        Args:
+            member: Member with shopify_customer_id
+
+        Returns:
+            Dict with balance, currency, account_id
+        """
+        cache = _get_cache()
+        if not cache or not member.shopify_customer_id:
+            return self.get_shopify_balance(member)
+
+        cache_key = _make_balance_cache_key(member.tenant_id, member.shopify_customer_id)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        balance_info = self.get_shopify_balance(member)
+        if 'error' not in balance_info:
+            cache.set(cache_key, balance_info, timeout=SHOPIFY_BALANCE_CACHE_TTL)
+        return balance_info
+
+    def invalidate_shopify_balance(self, member: Member) -> None:
+        """Drop the member's cached Shopify balance after a credit or debit."""
+        cache = _get_cache()
+        if cache and member.shopify_customer_id:
+            cache.delete(_make_balance_cache_key(member.tenant_id, member.shopify_customer_id))
+
     def get_member_balance(self, member_id: int) -> MemberCreditBalance:
         """
         Get member's credit stats (legacy method for compatibility).
@@ -138,6 +189,7 @@ class StoreCreditService:
 
                 if not shopify_result.get('success'):
                     raise ValueError("Shopify store credit operation failed")
+                self.invalidate_shopify_balance(member)
 
                 new_balance = Decimal(str(shopify_result.get('new_balance', 0)))
                 current_app.logger.info(
@@ -257,6 +309,7 @@ class StoreCreditService:
 
                 if not shopify_result.get('success'):
                     raise ValueError("Shopify store credit debit failed")
+                self.invalidate_shopify_balance(member)
 
                 new_balance = Decimal(str(shopify_result.get('new_balance', 0)))
                 current_app.logger.info(
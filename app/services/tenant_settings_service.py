@@ -12,10 +12,15 @@ Usage:
 
     # After updating settings, invalidate cache
     invalidate_tenant_settings(tenant_id)
+
+Tenant.settings changes flushed through the ORM also invalidate the cache
+automatically once the session commits.
 """
 import logging
 from typing import Optional, Dict, Any
-from flask import current_app
+from flask import current_app, has_app_context
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
 
 from ..models import Tenant
 from ..utils.settings_defaults import DEFAULT_SETTINGS, get_settings_with_defaults
@@ -153,3 +158,31 @@ def get_notification_setting(tenant_id: int, notification: str) -> bool:
         return False
 
     return notifications.get(notification, True)
+
+
+# Pending invalidations are held on the session until commit so a concurrent
+# request cannot re-cache the old settings between flush and commit.
+_PENDING_KEY = 'tenant_settings_pending_tenants'
+
+
+@event.listens_for(Tenant, 'after_update')
+def _mark_settings_dirty(mapper, connection, target):
+    if not inspect(target).attrs.settings.history.has_changes():
+        return
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_KEY, set()).add(target.id)
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_dirty_settings(session):
+    tenant_ids = session.info.pop(_PENDING_KEY, None)
+    if tenant_ids and has_app_context():
+        for tenant_id in tenant_ids:
+            invalidate_tenant_settings(tenant_id)
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_dirty_settings(session, previous_transaction):
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
@@ -16,13 +16,21 @@ Usage:
 
     # Get specific tier (uses cached tier list)
     tier = get_cached_tier_by_id(tenant_id, tier_id)
+    tier = get_cached_tier_by_name(tenant_id, 'Gold')
 
     # After creating/updating/deleting tier, invalidate cache
     invalidate_tier_cache(tenant_id)
+
+Tier inserts, updates and deletes flushed through the ORM also invalidate
+the tenant's cache automatically once the session commits.
 """
 import logging
 from typing import Optional, Dict, Any, List
 
+from flask import has_app_context
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
 from ..models import MembershipTier
 
 logger = logging.getLogger(__name__)
@@ -40,9 +48,11 @@ def _get_cache():
         return None
 
 
-def _make_cache_key(tenant_id: int) -> str:
+def _make_cache_key(tenant_id: int, active_only: bool = True) -> str:
     """Generate cache key for tenant tiers."""
-    return f'tenant_tiers:{tenant_id}'
+    if active_only:
+        return f'tenant_tiers:{tenant_id}'
+    return f'tenant_tiers_all:{tenant_id}'
 
 
 def get_cached_tiers(tenant_id: int, active_only: bool = True) -> List[Dict[str, Any]]:
@@ -60,10 +70,9 @@ def get_cached_tiers(tenant_id: int, active_only: bool = True) -> List[Dict[str,
         List of tier dicts sorted by display_order
     """
     cache = _get_cache()
-    cache_key = _make_cache_key(tenant_id)
+    cache_key = _make_cache_key(tenant_id, active_only)
 
-    # Only use cache for active_only=True (most common case)
-    if cache and active_only:
+    if cache:
         cached = cache.get(cache_key)
         if cached is not None:
             logger.debug('Cache HIT for tiers: tenant=%d', tenant_id)
@@ -79,8 +88,7 @@ def get_cached_tiers(tenant_id: int, active_only: bool = True) -> List[Dict[str,
     tiers = query.order_by(MembershipTier.display_order).all()
     tier_list = [t.to_dict() for t in tiers]
 
-    # Cache the result (only for active_only=True)
-    if cache and active_only:
+    if cache:
         cache.set(cache_key, tier_list, timeout=TIER_CACHE_TTL)
         logger.debug('Cached tiers: tenant=%d count=%d (TTL=%d)', tenant_id, len(tier_list), TIER_CACHE_TTL)
 
@@ -105,6 +113,27 @@ def get_cached_tier_by_id(tenant_id: int, tier_id: int) -> Optional[Dict[str, An
     return None
 
 
+def get_cached_tier_by_name(tenant_id: int, name: str) -> Optional[Dict[str, Any]]:
+    """
+    Get an active tier by name from the cached tier list.
+
+    An exact name match wins; otherwise the name is matched case-insensitively.
+
+    Args:
+        tenant_id: Tenant ID
+        name: Tier name to find
+
+    Returns:
+        Tier dict or None if not found
+    """
+    tiers = get_cached_tiers(tenant_id, active_only=True)
+    for tier in tiers:
+        if tier.get('name') == name:
+            return tier
+    by_lower_name = {(tier.get('name') or '').lower(): tier for tier in reversed(tiers)}
+    return by_lower_name.get(name.lower())
+
+
 def get_tier_for_member(tenant_id: int, tier_id: Optional[int]) -> Optional[Dict[str, Any]]:
     """
     Get tier data for a member, with caching.
@@ -139,8 +168,7 @@ def invalidate_tier_cache(tenant_id: int) -> bool:
     if not cache:
         return False
 
-    cache_key = _make_cache_key(tenant_id)
-    cache.delete(cache_key)
+    cache.delete_many(_make_cache_key(tenant_id), _make_cache_key(tenant_id, active_only=False))
     logger.debug('Invalidated cache for tiers: tenant=%d', tenant_id)
     return True
 
@@ -176,3 +204,31 @@ def get_tier_bonus_rate(tenant_id: int, tier_id: Optional[int]) -> float:
     if tier:
         return float(tier.get('bonus_rate', 0))
     return 0.0
+
+
+# Pending invalidations are held on the session until commit so a concurrent
+# request cannot re-cache the old rows between flush and commit.
+_PENDING_KEY = 'tier_cache_pending_tenants'
+
+
+@event.listens_for(MembershipTier, 'after_insert')
+@event.listens_for(MembershipTier, 'after_update')
+@event.listens_for(MembershipTier, 'after_delete')
+def _mark_tier_cache_dirty(mapper, connection, target):
+    session = object_session(target)
+    if session is not None and target.tenant_id is not None:
+        session.info.setdefault(_PENDING_KEY, set()).add(target.tenant_id)
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_dirty_tier_caches(session):
+    tenant_ids = session.info.pop(_PENDING_KEY, None)
+    if tenant_ids and has_app_context():
+        for tenant_id in tenant_ids:
+            invalidate_tier_cache(tenant_id)
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_dirty_tier_caches(session, previous_transaction):
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
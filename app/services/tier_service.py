@@ -21,6 +21,8 @@ from ..extensions import db
 from ..models import Member, MembershipTier, Tenant
 from ..models.tier_history import TierChangeLog, TierEligibilityRule, TierPromotion, MemberPromoUsage
 from ..models.trade_in import TradeInBatch
+from ..utils.money import to_cents
+from ..utils.serialization import serialization_load_options
 
 
 # Source priority (higher number = higher priority)
@@ -154,7 +156,7 @@ class TierService:
             try:
                 from .membership_service import MembershipService
                 membership_svc = MembershipService(self.tenant_id, self.shopify_client)
-                membership_svc.sync_member_metafields_to_shopify(member)
+                membership_svc.sync_member_metafields_to_shopify(member, background=True)
             except Exception as sync_err:
                 current_app.logger.warning(f'Metafield sync failed: {sync_err}')
 
@@ -1089,7 +1091,7 @@ class TierService:
         ).order_by(TierChangeLog.created_at.desc())
 
         total = query.count()
-        logs = query.limit(limit).offset(offset).all()
+        logs = query.options(*serialization_load_options()).limit(limit).offset(offset).all()
 
         return {
             'success': True,
@@ -1233,8 +1235,9 @@ class TierService:
 
     def _evaluate_rule(self, rule: TierEligibilityRule, stats: Dict) -> bool:
         """Evaluate a single eligibility rule against member stats."""
-        current_value = Decimal(str(stats.get(rule.metric, 0)))
-        threshold = rule.threshold_value
+        # Compare in integer cents, converting both sides the same way
+        current_value = to_cents(stats.get(rule.metric, 0) or 0)
+        threshold = rule.threshold_cents
 
         if rule.threshold_operator == '>=':
             return current_value >= threshold
@@ -1247,7 +1250,8 @@ class TierService:
         elif rule.threshold_operator == '==':
             return current_value == threshold
         elif rule.threshold_operator == 'between':
-            return threshold <= current_value <= (rule.threshold_max or threshold)
+            threshold_max = rule.max_threshold_cents
+            return threshold <= current_value <= (threshold_max or threshold)
 
         return False
 
@@ -57,6 +57,13 @@ def get_encryption_key() -> bytes:
 
 _fernet_instance = None
 
+# Every Fernet token starts with this (version byte 0x80 + timestamp, base64)
+ENCRYPTED_PREFIX = 'gAAAAA'
+
+# Shortest possible Fernet token: 57 header/HMAC bytes + one 16-byte AES
+# block, urlsafe-base64 encoded. Anything shorter cannot be ciphertext.
+FERNET_MIN_TOKEN_LENGTH = 100
+
 
 def get_fernet() -> Fernet:
     """Get a Fernet instance for encryption/decryption."""
@@ -116,8 +123,8 @@ def is_encrypted(value: str) -> bool:
     """
     Check if a value appears to be encrypted.
 
-    Encrypted values are Fernet tokens which start with 'gAAAAA'.
+    Encrypted values are Fernet tokens which start with ENCRYPTED_PREFIX.
     """
     if not value:
         return False
-    return value.startswith('gAAAAA')
+    return value.startswith(ENCRYPTED_PREFIX)
@@ -0,0 +1,64 @@
+"""
+JSON provider for TradeUp.
+
+Serializes datetimes as ISO 8601 strings (matching what model to_dict
+methods used to pre-format), so to_dict can return native datetime objects
+and leave formatting to the encoder. Uses orjson when it is installed,
+which formats datetimes in C; falls back to the stdlib json module.
+
+dumps_bytes() exposes the same encoding for outbound request bodies.
+"""
+import json
+import uuid
+import dataclasses
+from datetime import date, datetime
+from decimal import Decimal
+
+from flask.json.provider import DefaultJSONProvider
+
+# Optional fast path (graceful fallback if not installed)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(o):
+    """Serialize types the JSON encoder does not handle natively."""
+    if isinstance(o, (datetime, date)):
+        return o.isoformat()
+    if isinstance(o, (Decimal, uuid.UUID)):
+        return str(o)
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    if hasattr(o, '__html__'):
+        return str(o.__html__())
+    raise TypeError(f'Object of type {type(o).__name__} is not JSON serializable')
+
+
+def dumps_bytes(obj) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes for an HTTP request body."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_default, separators=(',', ':')).encode()
+
+
+class TradeUpJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider with ISO 8601 datetimes and optional orjson."""
+
+    default = staticmethod(_default)
+
+    def dumps(self, obj, **kwargs):
+        # orjson only covers the options Flask itself passes
+        if orjson is not None and set(kwargs) <= {'indent', 'separators'}:
+            option = orjson.OPT_NON_STR_KEYS
+            if self.sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            if kwargs.get('indent'):
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+
+        kwargs.setdefault('default', self.default)
+        kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+        kwargs.setdefault('sort_keys', self.sort_keys)
+        return json.dumps(obj, **kwargs)
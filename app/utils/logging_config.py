@@ -10,9 +10,28 @@ Provides centralized logging setup with:
 import os
 import sys
 import logging
+from contextvars import ContextVar
 from logging.handlers import RotatingFileHandler
 
 
+# Current request ID, set by the request ID middleware. A ContextVar (rather
+# than flask.g) keeps the value correct per-task under async workers too.
+request_id_var: ContextVar[str] = ContextVar('request_id', default='-')
+
+
+class RequestIdFormatter(logging.Formatter):
+    """
+    Formatter that exposes the current request ID as %(request_id)s.
+
+    The lookup happens only when a record is actually formatted, so no
+    per-handler filters are needed and handler reconfiguration is harmless.
+    """
+
+    def format(self, record):
+        record.request_id = request_id_var.get()
+        return super().format(record)
+
+
 def setup_logging(app=None):
     """
     Configure application-wide logging.
@@ -31,13 +50,14 @@ def setup_logging(app=None):
     # Create formatter
     if is_production:
         # Production: JSON-like structured format for log aggregation
-        formatter = logging.Formatter(
-            '{"time":"%(asctime)s","level":"%(levelname)s","logger":"%(name)s","message":"%(message)s"}'
+        formatter = RequestIdFormatter(
+            '{"time":"%(asctime)s","level":"%(levelname)s","request_id":"%(request_id)s",'
+            '"logger":"%(name)s","message":"%(message)s"}'
         )
     else:
         # Development: Human-readable format
-        formatter = logging.Formatter(
-            '[%(asctime)s] %(levelname)s %(name)s: %(message)s',
+        formatter = RequestIdFormatter(
+            '[%(asctime)s] %(levelname)s [%(request_id)s] %(name)s: %(message)s',
             datefmt='%H:%M:%S'
         )
 
@@ -0,0 +1,39 @@
+"""
+Money helpers for TradeUp.
+
+Monetary values are mirrored into integer-cent columns so hot read paths
+can avoid Decimal -> float conversion while keeping exact precision.
+"""
+from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
+
+_CENT = Decimal('1')
+
+
+def to_cents(value):
+    """
+    Convert a dollar amount to integer cents.
+
+    Args:
+        value: Decimal, int, float, numeric string, or None
+
+    Returns:
+        int cents (rounded half-up), or None if value is None
+    """
+    if value is None:
+        return None
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return int((value * 100).quantize(_CENT, rounding=ROUND_HALF_UP))
+
+
+@lru_cache(maxsize=256, typed=True)
+def to_decimal(value):
+    """
+    Convert a configured amount (int, float or string) to an exact Decimal.
+
+    Goes through str() so 0.1 becomes Decimal('0.1'). Cached because
+    Decimal is immutable and settings amounts repeat across a reward run;
+    typed so True and 1 (equal as dict keys) are cached separately.
+    """
+    return Decimal(str(value))
@@ -124,11 +124,20 @@ def init_scheduler(app):
             replace_existing=True
         )
 
+        # Nudge candidates refresh - Every 15 minutes
+        _scheduler.add_job(
+            run_nudge_candidates_refresh,
+            trigger=CronTrigger(minute='*/15'),
+            id='nudge_candidates_refresh',
+            name='Refresh precomputed pending nudges',
+            replace_existing=True
+        )
+
         _scheduler.start()
         os.environ['SCHEDULER_RUNNING'] = 'true'
 
         # Use print during init to avoid app context issues
-        print('[Scheduler] Started with 7 scheduled jobs:')
+        print('[Scheduler] Started with 8 scheduled jobs:')
         print('  - Monthly credits: 1st of month at 6:00 UTC (creates pending for approval)')
         print('  - Credit expiration: Daily at 0:00 UTC')
         print('  - Pending expiration: Daily at 1:00 UTC')
@@ -136,6 +145,7 @@ def init_scheduler(app):
         print('  - Anniversary rewards: Daily at 8:00 UTC')
         print('  - Expiration warnings: Daily at 9:00 UTC')
         print('  - Nudges processor: Daily at 10:00 UTC')
+        print('  - Nudge candidates refresh: Every 15 minutes')
 
         # Register shutdown
         import atexit
@@ -588,7 +598,8 @@ def run_nudges_processor():
                                 result = nudge_service.process_points_expiring_reminders()
                                 tenant_results['points_expiring'] = result
                                 if result.get('success'):
-                                    sent = result.get('reminders_sent', 0)
+                                    # Emails handed to the background sender count toward the cap
+                                    sent = result.get('reminders_sent', 0) + result.get('queued', 0)
                                     tenant_emails_sent += sent
                                     total_stats['points_expiring']['sent'] += sent
                                     total_stats['points_expiring']['skipped'] += result.get('skipped', 0)
@@ -658,7 +669,7 @@ def run_nudges_processor():
                     if tenant_emails_sent > 0:
                         logger.info(
                             f'[Scheduler] Tenant {tenant.id}: {tenant_emails_sent} nudges sent - '
-                            f'Points: {tenant_results["points_expiring"].get("reminders_sent", 0) if tenant_results["points_expiring"] else 0}, '
+                            f'Points: {tenant_results["points_expiring"].get("reminders_sent", 0) + tenant_results["points_expiring"].get("queued", 0) if tenant_results["points_expiring"] else 0}, '
                             f'Tier: {tenant_results["tier_progress"].get("reminders_sent", 0) if tenant_results["tier_progress"] else 0}, '
                             f'Inactive: {tenant_results["inactive_reengagement"].get("emails_sent", 0) if tenant_results["inactive_reengagement"] else 0}, '
                             f'Trade-in: {tenant_results["trade_in_reminder"].get("reminders_sent", 0) if tenant_results["trade_in_reminder"] else 0}'
@@ -702,6 +713,38 @@ def run_nudges_processor():
             logger.error(f'[Scheduler] Nudges processing failed: {e}')
 
 
+def run_nudge_candidates_refresh():
+    """
+    Recompute the precomputed pending nudges for all tenants.
+
+    Runs every 15 minutes so the pending-nudges endpoints can read the
+    nudge_candidates table instead of scanning members per request.
+    """
+    global _flask_app
+
+    if not _flask_app:
+        logger.error('[Scheduler] Flask app not initialized')
+        return
+
+    with _flask_app.app_context():
+        from ..extensions import db
+        from ..models.tenant import Tenant
+        from ..services.nudges_service import NudgesService
+
+        tenants = Tenant.query.filter_by(subscription_active=True).all()
+
+        refreshed = 0
+        for tenant in tenants:
+            try:
+                NudgesService(tenant.id, tenant.settings or {}).refresh_nudge_candidates()
+                refreshed += 1
+            except Exception as e:
+                db.session.rollback()
+                logger.error('[Scheduler] Nudge candidates refresh failed for tenant %s: %s', tenant.id, e)
+
+        logger.info('[Scheduler] Nudge candidates refreshed for %d/%d tenants', refreshed, len(tenants))
+
+
 def get_next_run_times() -> dict:
     """Get the next scheduled run times for all jobs."""
     global _scheduler
@@ -0,0 +1,74 @@
+"""
+Serialization helpers for TradeUp models.
+
+Generates per-class ``to_dict`` functions from a static field list so the
+field layout is computed once at class-definition time instead of being
+rebuilt as a dict literal on every call.
+
+Usage:
+    class Thing(db.Model):
+        _TO_DICT_FIELDS = (
+            ('id', 'self.id'),
+            ('created_at', 'self.created_at.isoformat() if self.created_at else None'),
+        )
+        to_dict = make_to_dict(_TO_DICT_FIELDS)
+
+Plain-column fields can read the instance ``__dict__`` directly (exposed to
+expressions as ``d``) by passing ``columns=``; see make_to_dict.
+
+Also provides serialization_load_options() for queries whose results are
+passed straight to to_dict.
+"""
+from flask import current_app, has_app_context
+from sqlalchemy.orm import raiseload
+
+
+def make_to_dict(field_specs, name='to_dict', columns=()):
+    """
+    Compile a ``to_dict(self)`` method from (key, expression) pairs.
+
+    Args:
+        field_specs: Sequence of (output_key, python_expression) tuples.
+            Expressions are evaluated with ``self`` bound to the instance.
+        name: Name given to the generated function (shows in tracebacks).
+        columns: Column attribute names the expressions read as
+            ``d.get('<name>')`` instead of ``self.<name>``, skipping the
+            instrumented descriptor. If any of them is missing from
+            ``self.__dict__`` (expired after commit, or deferred) they are
+            touched through the descriptor first so the usual refresh runs.
+
+    Returns:
+        A function suitable for assignment as a model method.
+    """
+    items = ',\n        '.join(f'{key!r}: {expr}' for key, expr in field_specs)
+    preamble = ''
+    if columns:
+        preamble = (
+            '    d = self.__dict__\n'
+            '    if not _columns <= d.keys():\n'
+            '        for column in _columns:\n'
+            '            getattr(self, column)\n'
+        )
+    source = f'def {name}(self):\n{preamble}    return {{\n        {items}\n    }}\n'
+    namespace = {'_columns': frozenset(columns)}
+    exec(compile(source, f'<generated {name}>', 'exec'), namespace)
+    func = namespace[name]
+    func._source = source
+    return func
+
+
+def serialization_load_options(*options):
+    """
+    Loader options for queries whose rows are serialized with to_dict.
+
+    Returns the given eager-load options, plus raiseload('*') when the
+    STRICT_LOADING config flag is on, so a relationship touched inside
+    to_dict without an explicit eager load fails loudly instead of issuing
+    one query per row.
+
+    Usage:
+        logs = query.options(*serialization_load_options()).all()
+    """
+    if has_app_context() and current_app.config.get('STRICT_LOADING'):
+        return (*options, raiseload('*'))
+    return options
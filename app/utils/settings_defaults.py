@@ -147,6 +147,11 @@ DEFAULT_SETTINGS = {
 
         # Points expiration (also available in 'points' section for backward compat)
         'points_expiration_days': None,  # Days until points expire (None = never expire)
+    },
+    'flow_triggers': {
+        # Trigger name -> whether any Flow workflow uses it, as last reported
+        # by Shopify's trigger lifecycle callback (e.g. 'points-earned': False).
+        # Triggers with no report yet are always sent.
     }
 }
 
@@ -46,6 +46,9 @@ target_db = current_app.extensions['migrate'].db
 
 
 def get_metadata():
+    # app.models imports submodules lazily; register every table for autogenerate
+    from app.models import load_all_models
+    load_all_models()
     if hasattr(target_db, 'metadatas'):
         return target_db.metadatas[None]
     return target_db.metadata
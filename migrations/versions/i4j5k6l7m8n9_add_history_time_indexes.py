@@ -0,0 +1,60 @@
+"""Add composite (owner, created_at) indexes on audit history tables
+
+Revision ID: i4j5k6l7m8n9
+Revises: h2a3b4c5d6e7
+Create Date: 2026-10-17
+
+Indexes added:
+- tier_change_logs (tenant_id, created_at) - latest tier changes for tenant
+- tier_change_logs (member_id, created_at) - member tier timeline
+- billing_history (tenant_id, created_at) - latest billing events for tenant
+
+tier_promotions code/active-window indexes already exist
+(i3j4k5l6m7n8) and are now declared on the model as well.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'i4j5k6l7m8n9'
+down_revision = 'h2a3b4c5d6e7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_tier_change_logs_tenant_created',
+        'tier_change_logs',
+        ['tenant_id', 'created_at'],
+        unique=False,
+        if_not_exists=True
+    )
+    op.create_index(
+        'ix_tier_change_logs_member_created',
+        'tier_change_logs',
+        ['member_id', 'created_at'],
+        unique=False,
+        if_not_exists=True
+    )
+
+    # billing_history is created outside migrations in some environments
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    if 'billing_history' in tables:
+        op.create_index(
+            'ix_billing_history_tenant_created',
+            'billing_history',
+            ['tenant_id', 'created_at'],
+            unique=False,
+            if_not_exists=True
+        )
+
+
+def downgrade():
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    if 'billing_history' in tables:
+        op.drop_index('ix_billing_history_tenant_created', table_name='billing_history', if_exists=True)
+
+    op.drop_index('ix_tier_change_logs_member_created', table_name='tier_change_logs', if_exists=True)
+    op.drop_index('ix_tier_change_logs_tenant_created', table_name='tier_change_logs', if_exists=True)
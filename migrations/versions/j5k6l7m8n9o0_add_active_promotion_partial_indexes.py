@@ -0,0 +1,43 @@
+"""Add partial indexes for active tier promotions
+
+Revision ID: j5k6l7m8n9o0
+Revises: i4j5k6l7m8n9
+Create Date: 2026-10-17
+
+Indexes added (PostgreSQL partial, WHERE is_active = true):
+- tier_promotions (tenant_id, ends_at) - active-window lookups
+- tier_promotions (tenant_id, code) - promo code lookups
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'j5k6l7m8n9o0'
+down_revision = 'i4j5k6l7m8n9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_tier_promotions_active_window',
+        'tier_promotions',
+        ['tenant_id', 'ends_at'],
+        unique=False,
+        postgresql_where=sa.text('is_active = true'),
+        if_not_exists=True
+    )
+    op.create_index(
+        'ix_tier_promotions_active_code',
+        'tier_promotions',
+        ['tenant_id', 'code'],
+        unique=False,
+        postgresql_where=sa.text('is_active = true'),
+        if_not_exists=True
+    )
+
+
+def downgrade():
+    op.drop_index('ix_tier_promotions_active_code', table_name='tier_promotions', if_exists=True)
+    op.drop_index('ix_tier_promotions_active_window', table_name='tier_promotions', if_exists=True)
@@ -0,0 +1,91 @@
+"""Convert tenant and tier-history JSON columns to JSONB with GIN indexes
+
+Revision ID: k6l7m8n9o0p1
+Revises: j5k6l7m8n9o0
+Create Date: 2026-10-17
+
+Columns converted to JSONB:
+- tenants.settings
+- api_keys.permissions
+- billing_history.extra_data
+- tier_change_logs.extra_data
+- tier_promotions.target_tiers, tier_promotions.target_tags
+
+GIN indexes added:
+- api_keys.permissions - permissions @> '["admin"]'
+- tier_promotions.target_tags - target_tags @> '["vip"]'
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'k6l7m8n9o0p1'
+down_revision = 'j5k6l7m8n9o0'
+branch_labels = None
+depends_on = None
+
+
+JSON_COLUMNS = [
+    ('tenants', 'settings'),
+    ('api_keys', 'permissions'),
+    ('billing_history', 'extra_data'),
+    ('tier_change_logs', 'extra_data'),
+    ('tier_promotions', 'target_tiers'),
+    ('tier_promotions', 'target_tags'),
+]
+
+
+def _existing_columns():
+    # billing_history is created outside migrations in some environments
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    return [(table, column) for table, column in JSON_COLUMNS if table in tables]
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table, column in _existing_columns():
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            postgresql_using=f'{column}::jsonb'
+        )
+
+    op.create_index(
+        'ix_api_keys_permissions',
+        'api_keys',
+        ['permissions'],
+        unique=False,
+        postgresql_using='gin',
+        if_not_exists=True
+    )
+    op.create_index(
+        'ix_tier_promotions_target_tags',
+        'tier_promotions',
+        ['target_tags'],
+        unique=False,
+        postgresql_using='gin',
+        if_not_exists=True
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_tier_promotions_target_tags', table_name='tier_promotions', if_exists=True)
+    op.drop_index('ix_api_keys_permissions', table_name='api_keys', if_exists=True)
+
+    for table, column in reversed(_existing_columns()):
+        op.alter_column(
+            table,
+            column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            postgresql_using=f'{column}::json'
+        )
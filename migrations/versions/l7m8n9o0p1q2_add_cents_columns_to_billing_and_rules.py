@@ -0,0 +1,46 @@
+"""Add integer-cent mirror columns to billing_history and tier_eligibility_rules
+
+Revision ID: l7m8n9o0p1q2
+Revises: k6l7m8n9o0p1
+Create Date: 2026-10-17
+
+Columns added (backfilled from the Numeric columns):
+- billing_history.amount_cents
+- tier_eligibility_rules.threshold_value_cents
+- tier_eligibility_rules.threshold_max_cents
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'l7m8n9o0p1q2'
+down_revision = 'k6l7m8n9o0p1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+
+    # billing_history is created outside migrations in some environments
+    if 'billing_history' in tables:
+        op.add_column('billing_history', sa.Column('amount_cents', sa.BigInteger(), nullable=True))
+        op.execute('UPDATE billing_history SET amount_cents = ROUND(amount * 100) WHERE amount IS NOT NULL')
+
+    op.add_column('tier_eligibility_rules', sa.Column('threshold_value_cents', sa.BigInteger(), nullable=True))
+    op.add_column('tier_eligibility_rules', sa.Column('threshold_max_cents', sa.BigInteger(), nullable=True))
+    op.execute(
+        'UPDATE tier_eligibility_rules SET '
+        'threshold_value_cents = ROUND(threshold_value * 100), '
+        'threshold_max_cents = ROUND(threshold_max * 100)'
+    )
+
+
+def downgrade():
+    op.drop_column('tier_eligibility_rules', 'threshold_max_cents')
+    op.drop_column('tier_eligibility_rules', 'threshold_value_cents')
+
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    if 'billing_history' in tables:
+        op.drop_column('billing_history', 'amount_cents')
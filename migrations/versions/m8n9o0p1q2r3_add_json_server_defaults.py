@@ -0,0 +1,44 @@
+"""Set empty-object server defaults on JSON settings/extra_data columns
+
+Revision ID: m8n9o0p1q2r3
+Revises: l7m8n9o0p1q2
+Create Date: 2026-10-17
+
+The database now fills in '{}' for these columns, replacing the Python-side
+default=dict callable on every insert:
+- tenants.settings
+- billing_history.extra_data
+- tier_change_logs.extra_data
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'm8n9o0p1q2r3'
+down_revision = 'l7m8n9o0p1q2'
+branch_labels = None
+depends_on = None
+
+
+JSON_DEFAULT_COLUMNS = [
+    ('tenants', 'settings'),
+    ('billing_history', 'extra_data'),
+    ('tier_change_logs', 'extra_data'),
+]
+
+
+def _existing_columns():
+    # billing_history is created outside migrations in some environments
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    return [(table, column) for table, column in JSON_DEFAULT_COLUMNS if table in tables]
+
+
+def upgrade():
+    for table, column in _existing_columns():
+        op.alter_column(table, column, server_default=sa.text("'{}'"))
+
+
+def downgrade():
+    for table, column in _existing_columns():
+        op.alter_column(table, column, server_default=None)
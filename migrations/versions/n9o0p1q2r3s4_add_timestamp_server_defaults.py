@@ -0,0 +1,52 @@
+"""Set UTC server defaults on tenant and tier-history timestamp columns
+
+Revision ID: n9o0p1q2r3s4
+Revises: m8n9o0p1q2r3
+Create Date: 2026-10-17
+
+Timestamps stay naive UTC; the database now fills them in on insert instead
+of the Python-side datetime.utcnow default.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'n9o0p1q2r3s4'
+down_revision = 'm8n9o0p1q2r3'
+branch_labels = None
+depends_on = None
+
+
+TIMESTAMP_COLUMNS = [
+    ('tenants', 'created_at'),
+    ('tenants', 'updated_at'),
+    ('api_keys', 'created_at'),
+    ('billing_history', 'created_at'),
+    ('tier_change_logs', 'created_at'),
+    ('tier_eligibility_rules', 'created_at'),
+    ('tier_eligibility_rules', 'updated_at'),
+    ('tier_promotions', 'created_at'),
+    ('member_promo_usages', 'applied_at'),
+]
+
+
+def _existing_columns():
+    # billing_history is created outside migrations in some environments
+    tables = set(sa.inspect(op.get_bind()).get_table_names())
+    return [(table, column) for table, column in TIMESTAMP_COLUMNS if table in tables]
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        default = sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+    else:
+        default = sa.text('CURRENT_TIMESTAMP')
+
+    for table, column in _existing_columns():
+        op.alter_column(table, column, server_default=default)
+
+
+def downgrade():
+    for table, column in _existing_columns():
+        op.alter_column(table, column, server_default=None)
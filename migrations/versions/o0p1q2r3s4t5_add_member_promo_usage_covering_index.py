@@ -0,0 +1,33 @@
+"""Add covering index for active promo usage lookups
+
+Revision ID: o0p1q2r3s4t5
+Revises: n9o0p1q2r3s4
+Create Date: 2026-10-17
+
+Indexes added:
+- member_promo_usages (member_id, status) INCLUDE (promotion_id, expires_at)
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'o0p1q2r3s4t5'
+down_revision = 'n9o0p1q2r3s4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_member_promo_usages_member_status',
+        'member_promo_usages',
+        ['member_id', 'status'],
+        unique=False,
+        postgresql_include=['promotion_id', 'expires_at'],
+        if_not_exists=True
+    )
+
+
+def downgrade():
+    op.drop_index('ix_member_promo_usages_member_status', table_name='member_promo_usages', if_exists=True)
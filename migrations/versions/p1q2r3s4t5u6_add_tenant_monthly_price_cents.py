@@ -0,0 +1,27 @@
+"""Add integer-cent mirror of tenants.monthly_price
+
+Revision ID: p1q2r3s4t5u6
+Revises: o0p1q2r3s4t5
+Create Date: 2026-10-17
+
+Columns added (backfilled from the Numeric column):
+- tenants.monthly_price_cents
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'p1q2r3s4t5u6'
+down_revision = 'o0p1q2r3s4t5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('tenants', sa.Column('monthly_price_cents', sa.Integer(), nullable=True))
+    op.execute('UPDATE tenants SET monthly_price_cents = ROUND(monthly_price * 100) WHERE monthly_price IS NOT NULL')
+
+
+def downgrade():
+    op.drop_column('tenants', 'monthly_price_cents')
@@ -0,0 +1,90 @@
+"""Hash-partition tier_change_logs by tenant_id (PostgreSQL only)
+
+Revision ID: q2r3s4t5u6v7
+Revises: p1q2r3s4t5u6
+Create Date: 2026-10-17
+
+Rebuilds tier_change_logs as a PARTITION BY HASH (tenant_id) table with
+16 partitions (tier_change_logs_p0 .. tier_change_logs_p15), so tenant-scoped
+history reads only touch one partition and its smaller indexes.
+
+PostgreSQL requires the partition key in every unique constraint, so the
+primary key becomes (id, tenant_id). ids still come from the existing
+sequence and stay unique; the ORM keeps mapping id alone as the identity.
+
+No-op on other dialects.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'q2r3s4t5u6v7'
+down_revision = 'p1q2r3s4t5u6'
+branch_labels = None
+depends_on = None
+
+
+PARTITIONS = 16
+
+FOREIGN_KEYS = (
+    ('tier_change_logs_tenant_id_fkey', 'tenant_id', 'tenants'),
+    ('tier_change_logs_member_id_fkey', 'member_id', 'members'),
+    ('tier_change_logs_previous_tier_id_fkey', 'previous_tier_id', 'membership_tiers'),
+    ('tier_change_logs_new_tier_id_fkey', 'new_tier_id', 'membership_tiers'),
+)
+
+INDEXES = (
+    ('ix_tier_change_logs_member', 'member_id'),
+    ('ix_tier_change_logs_tenant', 'tenant_id'),
+    ('ix_tier_change_logs_created', 'created_at'),
+    ('ix_tier_change_logs_tenant_created', 'tenant_id, created_at'),
+    ('ix_tier_change_logs_member_created', 'member_id, created_at'),
+)
+
+
+def _rebuild(partitioned):
+    """Copy tier_change_logs into a fresh table, partitioned or not."""
+    op.execute('ALTER TABLE tier_change_logs RENAME TO tier_change_logs_old')
+    # The id sequence is owned by the old table; detach it so the DROP below
+    # does not take it along.
+    op.execute('ALTER SEQUENCE tier_change_logs_id_seq OWNED BY NONE')
+
+    partition_clause = ' PARTITION BY HASH (tenant_id)' if partitioned else ''
+    op.execute(
+        'CREATE TABLE tier_change_logs '
+        '(LIKE tier_change_logs_old INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+        + partition_clause
+    )
+    if partitioned:
+        op.execute('ALTER TABLE tier_change_logs ADD PRIMARY KEY (id, tenant_id)')
+        for remainder in range(PARTITIONS):
+            op.execute(
+                f'CREATE TABLE tier_change_logs_p{remainder} PARTITION OF tier_change_logs '
+                f'FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})'
+            )
+    else:
+        op.execute('ALTER TABLE tier_change_logs ADD PRIMARY KEY (id)')
+
+    op.execute('INSERT INTO tier_change_logs SELECT * FROM tier_change_logs_old')
+    op.execute('DROP TABLE tier_change_logs_old')
+    op.execute('ALTER SEQUENCE tier_change_logs_id_seq OWNED BY tier_change_logs.id')
+
+    for name, column, target in FOREIGN_KEYS:
+        op.execute(
+            f'ALTER TABLE tier_change_logs ADD CONSTRAINT {name} '
+            f'FOREIGN KEY ({column}) REFERENCES {target} (id)'
+        )
+    for name, columns in INDEXES:
+        op.execute(f'CREATE INDEX {name} ON tier_change_logs ({columns})')
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    _rebuild(partitioned=True)
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    _rebuild(partitioned=False)
@@ -0,0 +1,48 @@
+"""Add expression index for member anniversary lookups
+
+Revision ID: r3s4t5u6v7w8
+Revises: q2r3s4t5u6v7
+Create Date: 2026-10-17
+
+Indexes added:
+- members (tenant_id, anniversary_key) WHERE status = 'active'
+  anniversary_key = month * 100 + day of
+  COALESCE(membership_start_date, date(created_at)), matching
+  Member.anniversary_key so daily anniversary jobs skip the full scan.
+
+PostgreSQL only; the expression is written in its dialect.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'r3s4t5u6v7w8'
+down_revision = 'q2r3s4t5u6v7'
+branch_labels = None
+depends_on = None
+
+
+ENROLLMENT = 'coalesce(membership_start_date, date(created_at))'
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.create_index(
+        'ix_members_tenant_anniversary',
+        'members',
+        [
+            'tenant_id',
+            sa.text(f'(EXTRACT(month FROM {ENROLLMENT}) * 100 + EXTRACT(day FROM {ENROLLMENT}))'),
+        ],
+        unique=False,
+        postgresql_where=sa.text("status = 'active'"),
+        if_not_exists=True
+    )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_members_tenant_anniversary', table_name='members', if_exists=True)
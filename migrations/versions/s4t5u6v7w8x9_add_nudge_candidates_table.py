@@ -0,0 +1,41 @@
+"""Add nudge_candidates table for precomputed pending nudges
+
+Revision ID: s4t5u6v7w8x9
+Revises: r3s4t5u6v7w8
+Create Date: 2026-10-17
+
+Holds the pending nudges per tenant as refreshed by the scheduler, so the
+pending-nudges endpoints read one indexed table instead of scanning members.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 's4t5u6v7w8x9'
+down_revision = 'r3s4t5u6v7w8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create nudge_candidates table."""
+    op.create_table(
+        'nudge_candidates',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('tenant_id', sa.Integer(), nullable=False),
+        sa.Column('member_id', sa.Integer(), nullable=False),
+        sa.Column('nudge_type', sa.String(50), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('generated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['member_id'], ['members.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_nudge_candidates_tenant_type', 'nudge_candidates', ['tenant_id', 'nudge_type'])
+
+
+def downgrade():
+    """Remove nudge_candidates table."""
+    op.drop_index('ix_nudge_candidates_tenant_type', table_name='nudge_candidates')
+    op.drop_table('nudge_candidates')
@@ -0,0 +1,48 @@
+"""Add composite indexes for nudge member scans
+
+Revision ID: t5u6v7w8x9y0
+Revises: s4t5u6v7w8x9
+Create Date: 2026-10-17
+
+Indexes added:
+- points_transactions (tenant_id, expires_at)
+  WHERE transaction_type = 'earn' AND reversed_at IS NULL AND remaining_points > 0
+  Partial index covering only unspent earn rows, for the expiring-points nudge.
+- members (tenant_id, status, updated_at) - inactive member nudges
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 't5u6v7w8x9y0'
+down_revision = 's4t5u6v7w8x9'
+branch_labels = None
+depends_on = None
+
+
+UNSPENT_EARN = "transaction_type = 'earn' AND reversed_at IS NULL AND remaining_points > 0"
+
+
+def upgrade():
+    op.create_index(
+        'ix_points_transactions_tenant_unspent_expiry',
+        'points_transactions',
+        ['tenant_id', 'expires_at'],
+        unique=False,
+        postgresql_where=sa.text(UNSPENT_EARN),
+        sqlite_where=sa.text(UNSPENT_EARN),
+        if_not_exists=True
+    )
+    op.create_index(
+        'ix_members_tenant_status_updated',
+        'members',
+        ['tenant_id', 'status', 'updated_at'],
+        unique=False,
+        if_not_exists=True
+    )
+
+
+def downgrade():
+    op.drop_index('ix_members_tenant_status_updated', table_name='members', if_exists=True)
+    op.drop_index('ix_points_transactions_tenant_unspent_expiry', table_name='points_transactions', if_exists=True)
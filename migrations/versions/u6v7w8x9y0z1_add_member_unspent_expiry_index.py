@@ -0,0 +1,42 @@
+"""Add per-member covering index for expiring points aggregation
+
+Revision ID: u6v7w8x9y0z1
+Revises: t5u6v7w8x9y0
+Create Date: 2026-10-17
+
+Indexes added:
+- points_transactions (tenant_id, member_id, expires_at) INCLUDE (remaining_points)
+  WHERE transaction_type = 'earn' AND reversed_at IS NULL AND remaining_points > 0
+  Serves the SUM(remaining_points) / MIN(expires_at) GROUP BY member_id
+  aggregation of the expiring-points nudge from the index alone, in member
+  order, and the single-member lookups used when recomputing one member.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'u6v7w8x9y0z1'
+down_revision = 't5u6v7w8x9y0'
+branch_labels = None
+depends_on = None
+
+
+UNSPENT_EARN = "transaction_type = 'earn' AND reversed_at IS NULL AND remaining_points > 0"
+
+
+def upgrade():
+    op.create_index(
+        'ix_points_transactions_member_unspent_expiry',
+        'points_transactions',
+        ['tenant_id', 'member_id', 'expires_at'],
+        unique=False,
+        postgresql_include=['remaining_points'],
+        postgresql_where=sa.text(UNSPENT_EARN),
+        sqlite_where=sa.text(UNSPENT_EARN),
+        if_not_exists=True
+    )
+
+
+def downgrade():
+    op.drop_index('ix_points_transactions_member_unspent_expiry', table_name='points_transactions', if_exists=True)
@@ -0,0 +1,36 @@
+"""Add unique key on nudge_candidates for upserts
+
+Revision ID: v7w8x9y0z1a2
+Revises: u6v7w8x9y0z1
+Create Date: 2026-10-17
+
+Indexes added:
+- nudge_candidates (tenant_id, member_id, nudge_type) UNIQUE
+  Conflict target for candidate upserts, so a member recompute racing the
+  full refresh can't write duplicate rows.
+
+Candidates are a cache rebuilt by the next refresh, so existing rows (which
+may already hold duplicates) are cleared before the index is created.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'v7w8x9y0z1a2'
+down_revision = 'u6v7w8x9y0z1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute('DELETE FROM nudge_candidates')
+    op.create_index(
+        'uq_nudge_candidates_tenant_member_type',
+        'nudge_candidates',
+        ['tenant_id', 'member_id', 'nudge_type'],
+        unique=True
+    )
+
+
+def downgrade():
+    op.drop_index('uq_nudge_candidates_tenant_member_type', table_name='nudge_candidates')
@@ -0,0 +1,55 @@
+"""Track nudge candidate refreshes per tenant and store payloads as JSONB
+
+Revision ID: w8x9y0z1a2b3
+Revises: v7w8x9y0z1a2
+Create Date: 2026-10-17
+
+Adds nudge_candidate_refreshes, one row per tenant holding the time of its
+last candidate refresh, so a refresh that finds no candidates still counts
+as fresh. Converts nudge_candidates.payload to JSONB on PostgreSQL to match
+the other JSON columns.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'w8x9y0z1a2b3'
+down_revision = 'v7w8x9y0z1a2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create nudge_candidate_refreshes table."""
+    op.create_table(
+        'nudge_candidate_refreshes',
+        sa.Column('tenant_id', sa.Integer(), nullable=False),
+        sa.Column('generated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['tenant_id'], ['tenants.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('tenant_id')
+    )
+
+    if op.get_bind().dialect.name == 'postgresql':
+        op.alter_column(
+            'nudge_candidates',
+            'payload',
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            postgresql_using='payload::jsonb'
+        )
+
+
+def downgrade():
+    """Remove nudge_candidate_refreshes table."""
+    if op.get_bind().dialect.name == 'postgresql':
+        op.alter_column(
+            'nudge_candidates',
+            'payload',
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            postgresql_using='payload::json'
+        )
+
+    op.drop_table('nudge_candidate_refreshes')
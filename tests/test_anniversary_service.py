@@ -0,0 +1,250 @@
+"""
+Tests for AnniversaryService.
+
+Tests cover:
+- Anniversary key matching, including Feb 29 enrollments
+- SQL-side filtering of today's anniversaries
+"""
+from datetime import date
+
+
+class TestAnniversaryKeys:
+    """Tests for anniversary_keys_for and Member.anniversary_key."""
+
+    def test_keys_for_regular_day(self):
+        """Test an ordinary day maps to a single key."""
+        from app.services.anniversary_service import anniversary_keys_for
+
+        assert anniversary_keys_for(date(2026, 7, 4)) == [704]
+
+    def test_feb_28_includes_leap_day_in_non_leap_year(self):
+        """Test Feb 29 enrollments match Feb 28 only when the year has no Feb 29."""
+        from app.services.anniversary_service import anniversary_keys_for
+
+        assert anniversary_keys_for(date(2026, 2, 28)) == [228, 229]
+        assert anniversary_keys_for(date(2028, 2, 28)) == [228]
+
+    def test_sql_expression_matches_python(self, app, db_session, sample_member):
+        """Test the anniversary_key SQL expression agrees with the Python value."""
+        from app.models import Member
+
+        sample_member.membership_start_date = date(2020, 2, 29)
+        db_session.commit()
+        stored = db_session.query(Member.anniversary_key).filter(Member.id == sample_member.id).scalar()
+        assert stored == sample_member.anniversary_key == 229
+
+
+class TestTodaysAnniversaries:
+    """Tests for AnniversaryService.get_todays_anniversaries."""
+
+    def test_returns_only_members_enrolled_on_this_day(self, app, db_session, sample_member):
+        """Test members are matched on enrollment month and day in SQL."""
+        from app.services.anniversary_service import AnniversaryService
+
+        today = date.today()
+        service = AnniversaryService(sample_member.tenant_id, settings={})
+
+        sample_member.membership_start_date = today.replace(year=today.year - 4)
+        db_session.commit()
+        assert sample_member in service.get_todays_anniversaries()
+
+        sample_member.membership_start_date = date(2020, today.month % 12 + 1, 1)
+        db_session.commit()
+        assert sample_member not in service.get_todays_anniversaries()
+
+
+class TestUpcomingAnniversaries:
+    """Tests for AnniversaryService.get_members_with_upcoming_anniversaries."""
+
+    def test_window_filters_in_sql(self, app, db_session, sample_member):
+        """Test members inside the window are returned with days_until set."""
+        from datetime import timedelta
+        from app.services.anniversary_service import AnniversaryService
+
+        service = AnniversaryService(sample_member.tenant_id, settings={})
+        in_window = date.today() + timedelta(days=3)
+        sample_member.membership_start_date = date(2020, in_window.month, min(in_window.day, 28))
+        db_session.commit()
+
+        upcoming = service.get_members_with_upcoming_anniversaries(days_ahead=7)
+        match = [u for u in upcoming if u['member_id'] == sample_member.id]
+        assert len(match) == 1
+        assert match[0]['days_until'] == sample_member.days_until_anniversary()
+        assert match[0]['anniversary_date'] == (date.today() + timedelta(days=match[0]['days_until'])).isoformat()
+        assert match[0]['member'] == {
+            'id': sample_member.id,
+            'member_number': sample_member.member_number,
+            'name': sample_member.name,
+            'email': sample_member.email,
+            'tier': 'Gold',
+        }
+
+        sample_member.membership_start_date = date.today() - timedelta(days=30)
+        db_session.commit()
+        upcoming = service.get_members_with_upcoming_anniversaries(days_ahead=7)
+        assert sample_member.id not in [u['member_id'] for u in upcoming]
+
+
+class TestAnniversarySettings:
+    """Tests for AnniversaryService settings loading."""
+
+    def test_settings_refresh_after_tenant_update(self, app, db_session, sample_tenant):
+        """Test settings come from the cache and are invalidated when the tenant commits."""
+        from app.services.anniversary_service import AnniversaryService
+        from app.utils.cache import cache
+
+        cache.clear()
+        original = sample_tenant.settings
+        assert AnniversaryService(sample_tenant.id).get_anniversary_settings()['enabled'] is False
+
+        sample_tenant.settings = {**(original or {}), 'anniversary': {'enabled': True}}
+        db_session.commit()
+        try:
+            assert AnniversaryService(sample_tenant.id).get_anniversary_settings()['enabled'] is True
+        finally:
+            sample_tenant.settings = original
+            db_session.commit()
+
+
+class TestProcessAnniversaryRewards:
+    """Tests for AnniversaryService.process_anniversary_rewards."""
+
+    def test_points_rewards_share_one_commit(self, app, db_session, sample_member):
+        """Test a points run rewards members without per-member lookups or commits."""
+        from unittest.mock import patch
+        from app.models import Member
+        from app.models.gamification import MemberActivity
+        from app.models.points import PointsTransaction
+        from app.services.anniversary_service import AnniversaryService
+
+        today = date.today()
+        sample_member.membership_start_date = today.replace(year=today.year - 4)
+        sample_member.points_balance = 0
+        db_session.commit()
+
+        service = AnniversaryService(sample_member.tenant_id, settings={
+            'anniversary': {'enabled': True, 'reward_type': 'points', 'reward_amount': 50},
+        })
+        try:
+            with patch.object(db_session, 'commit', wraps=db_session.commit) as commit:
+                result = service.process_anniversary_rewards()
+            assert commit.call_count == 1
+            assert result['successful'] == 1
+            db_session.expire_all()
+            member = db_session.get(Member, sample_member.id)
+            assert member.points_balance == 50
+            assert member.last_anniversary_reward_year == today.year
+        finally:
+            PointsTransaction.query.filter_by(member_id=sample_member.id).delete()
+            MemberActivity.query.filter_by(member_id=sample_member.id).delete()
+            db_session.commit()
+
+
+class TestAnniversaryStats:
+    """Tests for AnniversaryService.get_anniversary_stats."""
+
+    def test_counts_active_and_rewarded(self, app, db_session, sample_member):
+        """Test active and rewarded-this-year counts come back together."""
+        from app.services.anniversary_service import AnniversaryService
+
+        today = date.today()
+        sample_member.last_anniversary_reward_year = today.year
+        sample_member.membership_start_date = today.replace(year=today.year - 4)
+        db_session.commit()
+
+        stats = AnniversaryService(sample_member.tenant_id, settings={}).get_anniversary_stats()
+        assert stats['total_active_members'] == 1
+        assert stats['rewarded_this_year'] == 1
+        assert stats['anniversaries_today'] == 1
+        assert stats['upcoming_7_days'] == 1
+        assert [u['member_id'] for u in stats['upcoming_anniversaries']] == [sample_member.id]
+        assert stats['upcoming_anniversaries'][0]['days_until'] == 0
+
+
+class TestOrdinal:
+    """Tests for AnniversaryService._ordinal."""
+
+    def test_suffixes(self):
+        """Test st/nd/rd/th suffixes including the 11-13 exception."""
+        from app.services.anniversary_service import AnniversaryService
+
+        cases = {1: '1st', 2: '2nd', 3: '3rd', 4: '4th', 11: '11th', 12: '12th',
+                 13: '13th', 21: '21st', 22: '22nd', 101: '101st', 111: '111th'}
+        for n, expected in cases.items():
+            assert AnniversaryService._ordinal(n) == expected
+
+    def test_run_date_threaded_through_rewards(self, app, db_session, sample_member):
+        """Test an explicit run date drives matching, anniversary year and references."""
+        from app.models.gamification import MemberActivity
+        from app.models.points import PointsTransaction
+        from app.services.anniversary_service import AnniversaryService
+
+        run_date = date(2030, 6, 15)
+        sample_member.membership_start_date = date(2026, 6, 15)
+        db_session.commit()
+
+        service = AnniversaryService(sample_member.tenant_id, settings={
+            'anniversary': {'enabled': True, 'reward_type': 'points', 'reward_amount': 10},
+        })
+        try:
+            result = service.process_anniversary_rewards(today=run_date)
+            assert result['successful'] == 1
+            assert result['details'][0]['anniversary_year'] == 4
+            txn = PointsTransaction.query.filter_by(member_id=sample_member.id).one()
+            assert txn.reference_id == '2030'
+            assert sample_member.last_anniversary_reward_year == 2030
+        finally:
+            PointsTransaction.query.filter_by(member_id=sample_member.id).delete()
+            MemberActivity.query.filter_by(member_id=sample_member.id).delete()
+            db_session.commit()
+
+    def test_milestone_badges_awarded_in_bulk(self, app, db_session, sample_member):
+        """Test first-anniversary badges are awarded for the run and linked to the activity."""
+        from app.models.gamification import Badge, MemberActivity, MemberBadge
+        from app.models.points import PointsTransaction
+        from app.services.anniversary_service import AnniversaryService
+
+        run_date = date(2030, 6, 15)
+        sample_member.membership_start_date = date(2029, 6, 15)
+        badge = Badge(
+            tenant_id=sample_member.tenant_id,
+            name='1 Year Member',
+            criteria_type='member_anniversary',
+            criteria_value=365,
+        )
+        db_session.add(badge)
+        db_session.commit()
+
+        service = AnniversaryService(sample_member.tenant_id, settings={
+            'anniversary': {'enabled': True, 'reward_type': 'points', 'reward_amount': 10},
+        })
+        try:
+            result = service.process_anniversary_rewards(today=run_date)
+            detail = result['details'][0]
+            assert detail['badge_awarded'] == {'id': badge.id, 'name': '1 Year Member'}
+            activity = MemberActivity.query.filter_by(member_id=sample_member.id).one()
+            assert activity.related_badge_id == badge.id
+            assert MemberBadge.query.filter_by(member_id=sample_member.id, badge_id=badge.id).count() == 1
+        finally:
+            PointsTransaction.query.filter_by(member_id=sample_member.id).delete()
+            MemberActivity.query.filter_by(member_id=sample_member.id).delete()
+            MemberBadge.query.filter_by(member_id=sample_member.id).delete()
+            Badge.query.filter_by(id=badge.id).delete()
+            db_session.commit()
+
+
+class TestDiscountCodeReward:
+    """Tests for AnniversaryService._issue_discount_code_reward."""
+
+    def test_code_uses_run_date_stamp(self, app, sample_member):
+        """Test the generated code embeds the run date as YYYYMMDD."""
+        from unittest.mock import patch
+        from app.services.anniversary_service import AnniversaryService
+
+        service = AnniversaryService(sample_member.tenant_id, settings={})
+        with patch('app.services.shopify_client.ShopifyClient') as client_cls:
+            client_cls.return_value.create_reward_discount_code.side_effect = (
+                lambda **kwargs: {'success': True, 'code': kwargs['code']}
+            )
+            result = service._issue_discount_code_reward(sample_member, 10, 3, date(2030, 1, 5))
+        assert result['discount_code'] == f'ANNIV3Y-{sample_member.member_number}-20300105'
@@ -0,0 +1,290 @@
+"""
+Tests for the Shopify Flow integration service.
+
+Tests cover:
+- Inline trigger delivery
+- Early return when no Shopify client is configured
+- Background queueing of triggers when FLOW_TRIGGERS_ASYNC is enabled
+- Per-request coalescing of triggers flushed on teardown
+- One payload timestamp per request
+- Dropping buffered triggers when the request fails
+- Per-failure warnings plus aggregated failure counters
+- Skipping triggers with no enabled workflows (lifecycle callback)
+- Cached member and tier lookups in Flow actions
+"""
+from unittest.mock import MagicMock, patch
+
+
+class TestSendFlowTrigger:
+    """Tests for FlowService._send_flow_trigger."""
+
+    def test_trigger_without_client_skips_payload(self, app):
+        """Test trigger methods return before building a payload when Shopify is not linked."""
+        from app.services import flow_service as module
+
+        with app.app_context(), patch.object(module, '_flow_timestamp') as timestamp:
+            result = module.FlowService(1).trigger_member_enrolled(
+                member_id=1, member_number='TU1001', email='a@example.com', tier_name='Gold'
+            )
+            timestamp.assert_not_called()
+
+        assert result == {'success': False, 'error': 'Shopify client not configured'}
+
+    def test_sends_inline_when_async_disabled(self, app):
+        """Test the trigger is delivered on the calling thread by default in tests."""
+        from app.services.flow_service import FlowService
+
+        client = MagicMock()
+        client._execute_query.return_value = {'flowTriggerReceive': {'userErrors': []}}
+
+        with app.app_context():
+            result = FlowService(1, client)._send_flow_trigger('member-enrolled', {'id': 1})
+
+        assert result == {'success': True, 'trigger': 'member-enrolled', 'payload': {'id': 1}}
+        variables = client._execute_query.call_args[0][1]
+        assert variables == {'handle': 'tradeup/member-enrolled', 'payload': {'id': 1}}
+
+    def test_queues_trigger_for_background_sender(self, app):
+        """Test async mode returns immediately and the worker delivers the trigger."""
+        from app.services import flow_service as module
+
+        client = MagicMock()
+        client._execute_query.return_value = {'flowTriggerReceive': {'userErrors': []}}
+
+        with patch.object(module, '_flow_trigger_queue', None), \
+                patch.dict(app.config, {'FLOW_TRIGGERS_ASYNC': True}):
+            with app.app_context():
+                result = module.FlowService(1, client)._send_flow_trigger(
+                    'tier-upgraded', {'id': 2}
+                )
+            assert result == {'success': True, 'queued': True, 'trigger': 'tier-upgraded'}
+            module._get_flow_trigger_queue().join()
+
+        variables = client._execute_query.call_args[0][1]
+        assert variables == {'handle': 'tradeup/tier-upgraded', 'payload': {'id': 2}}
+
+    def test_request_triggers_are_coalesced_and_flushed(self, app):
+        """Test triggers in a request are deduplicated and sent as one batch on teardown."""
+        from flask import g
+        from app.services import flow_service as module
+
+        client = MagicMock()
+        client._execute_query.return_value = {'flowTriggerReceive': {'userErrors': []}}
+
+        with patch.object(module, '_flow_trigger_queue', None), \
+                patch.dict(app.config, {'FLOW_TRIGGERS_ASYNC': True}):
+            with app.test_request_context():
+                flow = module.FlowService(1, client)
+                first = flow._send_flow_trigger('points-earned', {'id': 1, 'points': 10})
+                repeat = flow._send_flow_trigger('points-earned', {'points': 10, 'id': 1})
+                other = flow._send_flow_trigger('points-earned', {'id': 2, 'points': 10})
+
+                assert first['queued'] and not first['was_duplicate']
+                assert repeat['was_duplicate']
+                assert not other['was_duplicate']
+                assert len(g._flow_triggers) == 2
+                client._execute_query.assert_not_called()
+            module._get_flow_trigger_queue().join()
+
+        sent = sorted(call[0][1]['payload']['id'] for call in client._execute_query.call_args_list)
+        assert sent == [1, 2]
+
+    def test_unknown_trigger_name_is_not_sent(self, app):
+        """Test a trigger name without a registered handle fails instead of being sent."""
+        from app.services.flow_service import FlowService
+
+        client = MagicMock()
+        with app.app_context():
+            result = FlowService(1, client)._send_flow_trigger('member_enrolled', {'id': 1})
+
+        assert result['success'] is False
+        client._execute_query.assert_not_called()
+
+    def test_failures_are_logged_and_counted(self, app):
+        """Test a failed send is logged with its trigger and tenant and tallied for the report."""
+        from app.services import flow_service as module
+
+        client = MagicMock(shop_domain='test-shop.myshopify.com')
+        client._execute_query.side_effect = Exception('HTTP 503')
+        module._drain_flow_failure_counts()
+
+        with app.app_context(), patch.object(module.logger, 'warning') as warning:
+            result = module.FlowService(7, client)._send_flow_trigger('credit-issued', {'id': 1})
+
+        assert result['success'] is False
+        warning.assert_called_once()
+        assert warning.call_args[0][1:3] == ('credit-issued', 7)
+        assert module._drain_flow_failure_counts() == {('test-shop.myshopify.com', 'credit-issued'): 1}
+        assert module.get_recent_flow_failures()[-1]['error'] == 'HTTP 503'
+        assert module.get_recent_flow_failures()[-1]['tenant_id'] == 7
+
+    def test_full_queue_sends_buffered_triggers_inline(self, app):
+        """Test teardown delivers the request's triggers inline when the queue is full."""
+        import queue
+        from app.services import flow_service as module
+
+        client = MagicMock()
+        client._execute_query.return_value = {'flowTriggerReceive': {'userErrors': []}}
+        full = MagicMock()
+        full.put_nowait.side_effect = queue.Full
+
+        with patch.dict(app.config, {'FLOW_TRIGGERS_ASYNC': True}), \
+                patch.object(module, '_get_flow_trigger_queue', return_value=full):
+            with app.test_request_context():
+                flow = module.FlowService(1, client)
+                flow._send_flow_trigger('points-earned', {'id': 1})
+                flow._send_flow_trigger('points-earned', {'id': 2})
+                client._execute_query.assert_not_called()
+                module._flush_flow_triggers()
+
+        sent = sorted(call[0][1]['payload']['id'] for call in client._execute_query.call_args_list)
+        assert sent == [1, 2]
+
+    def test_failed_request_drops_buffered_triggers(self, app):
+        """Test teardown after an exception discards the request's triggers instead of sending them."""
+        from flask import g
+        from app.services import flow_service as module
+
+        client = MagicMock()
+        with patch.dict(app.config, {'FLOW_TRIGGERS_ASYNC': True}), \
+                patch.object(module, '_get_flow_trigger_queue') as get_queue:
+            with app.test_request_context():
+                module.FlowService(1, client)._send_flow_trigger('points-earned', {'id': 1})
+                module._flush_flow_triggers(RuntimeError('rolled back'))
+                assert '_flow_triggers' not in g
+
+        get_queue.assert_not_called()
+        client._execute_query.assert_not_called()
+
+    def test_request_triggers_share_one_timestamp(self, app):
+        """Test triggers fired in the same request carry the same timestamp."""
+        from app.services import flow_service as module
+
+        with app.test_request_context():
+            first = module._flow_timestamp()
+            assert module._flow_timestamp() == first
+            assert first.endswith('Z')
+
+    def test_skips_trigger_without_enabled_workflows(self, app, client, sample_tenant):
+        """Test the lifecycle callback turns a trigger off and sends are skipped."""
+        from app.services.flow_service import FlowService
+
+        response = client.post(
+            '/flow/lifecycle/points-earned',
+            json={'shopify_domain': sample_tenant.shopify_domain, 'has_enabled_flow': False}
+        )
+        assert response.status_code == 200
+
+        shopify = MagicMock()
+        flow = FlowService(sample_tenant.id, shopify)
+        result = flow._send_flow_trigger('points-earned', {'id': 1})
+
+        assert result == {'success': True, 'skipped': True, 'trigger': 'points-earned'}
+        shopify._execute_query.assert_not_called()
+        assert flow.is_trigger_subscribed('member-enrolled')
+
+    def test_lifecycle_rejects_unknown_trigger(self, app, client, sample_tenant):
+        """Test the lifecycle callback only accepts registered trigger handles."""
+        response = client.post(
+            '/flow/lifecycle/not-a-trigger',
+            json={'shopify_domain': sample_tenant.shopify_domain, 'has_enabled_flow': True}
+        )
+        assert response.status_code == 400
+
+
+class TestFlowActions:
+    """Tests for Flow action member and tier lookups."""
+
+    def test_member_lookup_reuses_cached_id(self, app, db_session, sample_member):
+        """Test a repeat lookup loads the member by primary key instead of by email."""
+        from app.models import Member
+        from app.services.flow_service import FlowService
+        from app.utils.cache import cache
+
+        cache.clear()
+        flow = FlowService(sample_member.tenant_id)
+        assert flow._get_member_by_email(sample_member.email).id == sample_member.id
+
+        with patch.object(Member, 'query') as query:
+            assert flow._get_member_by_email(sample_member.email).id == sample_member.id
+            query.filter_by.assert_not_called()
+
+    def test_member_lookup_ignores_stale_cached_id(self, app, db_session, sample_member):
+        """Test a cached id is not trusted once the member's email has changed."""
+        from app.services.flow_service import FlowService
+        from app.utils.cache import cache
+
+        cache.clear()
+        flow = FlowService(sample_member.tenant_id)
+        old_email = sample_member.email
+        assert flow._get_member_by_email(old_email) is not None
+
+        sample_member.email = f'changed-{old_email}'
+        db_session.commit()
+        try:
+            assert flow._get_member_by_email(old_email) is None
+        finally:
+            sample_member.email = old_email
+            db_session.commit()
+
+    def test_change_tier_resolves_tier_name_case_insensitively(self, app, db_session, sample_member, sample_tier):
+        """Test action_change_tier finds the tier by a differently cased name."""
+        from app.services.flow_service import FlowService
+        from app.utils.cache import cache
+
+        cache.clear()
+        result = FlowService(sample_member.tenant_id).action_change_tier(sample_member.email, 'gold')
+
+        assert result['success'] is True
+        assert result['new_tier'] == 'Gold'
+
+    def test_get_member_returns_projected_fields(self, app, sample_member):
+        """Test action_get_member builds its response from a projection and caches the balance."""
+        from app.services.flow_service import FlowService
+        from app.services.store_credit_service import store_credit_service
+        from app.utils.cache import cache
+
+        cache.clear()
+        with patch.object(store_credit_service, 'get_shopify_balance', return_value={'balance': 7.5}) as balance:
+            result = FlowService(sample_member.tenant_id).action_get_member(sample_member.email)
+            FlowService(sample_member.tenant_id).action_get_member(sample_member.email)
+
+        assert result['is_member'] is True
+        assert result['member']['id'] == sample_member.id
+        assert result['member']['tier'] == 'Gold'
+        assert result['member']['credit_balance'] == 7.5
+        assert balance.call_count == 1
+        assert balance.call_args[0][0].shopify_customer_id == sample_member.shopify_customer_id
+
+    def test_add_credit_route_passes_decimal_amount(self, app, client, sample_member, sample_tenant):
+        """Test the add-credit route parses the amount to Decimal once and rejects junk."""
+        from decimal import Decimal
+        from app.services.store_credit_service import store_credit_service
+
+        with patch.object(store_credit_service, 'add_credit') as add_credit, \
+                patch.object(store_credit_service, 'get_shopify_balance', return_value={'balance': 0}):
+            add_credit.return_value.id = 1
+            response = client.post('/flow/actions/add-credit', json={
+                'shop_domain': sample_tenant.shopify_domain,
+                'customer_email': sample_member.email,
+                'amount': 12.34
+            })
+            assert response.status_code == 200
+            assert add_credit.call_args.kwargs['amount'] == Decimal('12.34')
+
+            response = client.post('/flow/actions/add-credit', json={
+                'shop_domain': sample_tenant.shopify_domain,
+                'customer_email': sample_member.email,
+                'amount': 'abc'
+            })
+            assert response.status_code == 400
+
+            # Non-finite amounts and booleans are rejected, not a 500 or a cached 1
+            for junk in ('NaN', 'Infinity', '-Infinity', '1e999999', True, [5], None):
+                response = client.post('/flow/actions/add-credit', json={
+                    'shop_domain': sample_tenant.shopify_domain,
+                    'customer_email': sample_member.email,
+                    'amount': junk
+                })
+                assert response.status_code == 400, junk
+            assert add_credit.call_count == 1
@@ -0,0 +1,370 @@
+"""
+Tests for model-level helpers.
+
+Tests cover:
+- Generated to_dict methods
+- Model to_dict output shape
+- API key prefix verification
+"""
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+
+class TestMakeToDict:
+    """Tests for make_to_dict code generation."""
+
+    def test_generates_dict_from_field_specs(self):
+        """Test generated function evaluates each expression against self."""
+        from app.utils.serialization import make_to_dict
+
+        class Thing:
+            a = 1
+            b = None
+            to_dict = make_to_dict((
+                ('a', 'self.a'),
+                ('b', 'self.b.upper() if self.b else None'),
+            ))
+
+        assert Thing().to_dict() == {'a': 1, 'b': None}
+
+    def test_preserves_field_order(self):
+        """Test keys are emitted in declaration order."""
+        from app.utils.serialization import make_to_dict
+
+        class Thing:
+            to_dict = make_to_dict((('z', '1'), ('a', '2'), ('m', '3')))
+
+        assert list(Thing().to_dict()) == ['z', 'a', 'm']
+
+    def test_columns_read_from_instance_dict(self):
+        """Test column fields are read from __dict__, touching missing ones first."""
+        from app.utils.serialization import make_to_dict
+
+        class Thing:
+            def __getattr__(self, name):
+                self.__dict__[name] = name.upper()
+                return self.__dict__[name]
+
+            to_dict = make_to_dict((('a', "d.get('a')"),), columns=('a',))
+
+        thing = Thing()
+        assert thing.to_dict() == {'a': 'A'}
+        thing.__dict__['a'] = 'cached'
+        assert thing.to_dict() == {'a': 'cached'}
+
+    def test_tenant_to_dict_after_expire(self, app, db_session, sample_tenant):
+        """Test Tenant.to_dict reloads expired attributes instead of returning None."""
+        db_session.expire(sample_tenant)
+        data = sample_tenant.to_dict()
+        assert data['id'] == sample_tenant.id
+        assert data['shop_slug'] == sample_tenant.shop_slug
+
+
+class TestModelToDict:
+    """Tests for model to_dict output."""
+
+    def test_tenant_to_dict(self, app, sample_tenant):
+        """Test Tenant.to_dict exposes public fields only."""
+        with app.app_context():
+            data = sample_tenant.to_dict()
+            assert data['id'] == sample_tenant.id
+            assert data['shop_slug'] == sample_tenant.shop_slug
+            assert 'shopify_access_token' not in data
+
+    def test_billing_history_to_dict(self):
+        """Test BillingHistory.to_dict formats amount and timestamps."""
+        from app.models import BillingHistory
+
+        created = datetime(2026, 1, 2, 3, 4, 5)
+        entry = BillingHistory(
+            id=1, tenant_id=1, event_type='payment',
+            amount=Decimal('19.99'), currency='USD', created_at=created,
+        )
+        data = entry.to_dict()
+        assert data['amount'] == 19.99
+        assert data['created_at'] == created
+        assert data['event_type'] == 'payment'
+
+
+class TestAPIKeyVerifyPrefix:
+    """Tests for APIKey.verify_prefix."""
+
+    def test_matching_prefix(self):
+        """Test identical prefixes verify."""
+        from app.models import APIKey
+        assert APIKey.verify_prefix('tu_abc12', 'tu_abc12') is True
+
+    def test_mismatched_prefix(self):
+        """Test differing or missing prefixes are rejected."""
+        from app.models import APIKey
+        assert APIKey.verify_prefix('tu_abc12', 'tu_abc13') is False
+        assert APIKey.verify_prefix('tu_abc', 'tu_abc12') is False
+        assert APIKey.verify_prefix(None, 'tu_abc12') is False
+
+
+class TestTierPromotionActiveForTenant:
+    """Tests for TierPromotion.active_for_tenant."""
+
+    def test_filters_by_window_and_flag(self, app, sample_tenant, sample_tier):
+        """Test only enabled promotions inside their window are returned."""
+        from app.extensions import db
+        from app.models import TierPromotion
+
+        with app.app_context():
+            tier = sample_tier
+            now = datetime.utcnow()
+            day = timedelta(days=1)
+            promos = [
+                TierPromotion(tenant_id=sample_tenant.id, tier_id=tier.id, name='running',
+                              starts_at=now - day, ends_at=now + day, is_active=True),
+                TierPromotion(tenant_id=sample_tenant.id, tier_id=tier.id, name='disabled',
+                              starts_at=now - day, ends_at=now + day, is_active=False),
+                TierPromotion(tenant_id=sample_tenant.id, tier_id=tier.id, name='ended',
+                              starts_at=now - 3 * day, ends_at=now - day, is_active=True),
+            ]
+            db.session.add_all(promos)
+            db.session.commit()
+
+            try:
+                names = {p.name for p in TierPromotion.active_for_tenant(sample_tenant.id)}
+                assert names == {'running'}
+            finally:
+                for promo in promos:
+                    db.session.delete(promo)
+                db.session.commit()
+
+
+class TestEncryptedAccessToken:
+    """Tests for the encrypted shopify_access_token column."""
+
+    def test_token_encrypted_at_rest(self, app, sample_tenant):
+        """Test the stored value is ciphertext but the attribute is plaintext."""
+        from app.extensions import db
+        from app.models import Tenant
+
+        with app.app_context():
+            raw = db.session.execute(
+                db.text('SELECT shopify_access_token FROM tenants WHERE id = :id'),
+                {'id': sample_tenant.id}
+            ).scalar()
+            assert raw.startswith('gAAAAA')
+
+            db.session.expire_all()
+            tenant = db.session.get(Tenant, sample_tenant.id)
+            assert tenant.shopify_access_token == 'shpat_test_token_12345'
+
+    def test_short_legacy_value_skips_decrypt(self):
+        """Test values too short to be Fernet tokens are returned without decrypting."""
+        from unittest.mock import patch
+        from app.models.types import EncryptedText
+
+        with patch('app.models.types.decrypt_value') as decrypt:
+            assert EncryptedText().process_result_value('shpca_legacy', None) == 'shpca_legacy'
+            decrypt.assert_not_called()
+
+
+class TestSerializationLoadOptions:
+    """Tests for serialization_load_options."""
+
+    def test_adds_raiseload_when_strict(self, app):
+        """Test raiseload('*') is appended when STRICT_LOADING is on."""
+        from app.utils.serialization import serialization_load_options
+
+        with app.app_context():
+            app.config['STRICT_LOADING'] = True
+            assert len(serialization_load_options()) == 1
+
+    def test_passthrough_when_not_strict(self, app):
+        """Test options are returned unchanged when STRICT_LOADING is off."""
+        from app.utils.serialization import serialization_load_options
+
+        with app.app_context():
+            app.config['STRICT_LOADING'] = False
+            try:
+                assert serialization_load_options() == ()
+            finally:
+                app.config['STRICT_LOADING'] = True
+
+
+class TestTierPromotionIsCurrentlyActive:
+    """Tests for the is_currently_active hybrid."""
+
+    def test_sql_expression_matches_python(self, app, sample_tenant, sample_tier):
+        """Test filtering in SQL agrees with the instance property."""
+        from app.extensions import db
+        from app.models import TierPromotion
+
+        with app.app_context():
+            now = datetime.utcnow()
+            day = timedelta(days=1)
+            base = dict(tenant_id=sample_tenant.id, tier_id=sample_tier.id,
+                        starts_at=now - day, ends_at=now + day, is_active=True)
+            promos = [
+                TierPromotion(name='open', max_uses=None, current_uses=0, **base),
+                TierPromotion(name='room-left', max_uses=5, current_uses=4, **base),
+                TierPromotion(name='used-up', max_uses=5, current_uses=5, **base),
+            ]
+            db.session.add_all(promos)
+            db.session.commit()
+
+            try:
+                active = TierPromotion.query.filter(
+                    TierPromotion.tenant_id == sample_tenant.id,
+                    TierPromotion.is_currently_active
+                ).all()
+                assert {p.name for p in active} == {'open', 'room-left'}
+                assert all(p.is_currently_active for p in active)
+                assert not promos[2].is_currently_active
+            finally:
+                for promo in promos:
+                    db.session.delete(promo)
+                db.session.commit()
+
+
+class TestCentsMirrors:
+    """Tests for integer-cent mirror columns."""
+
+    def test_to_cents_rounding(self):
+        """Test to_cents handles the supported input types."""
+        from app.utils.money import to_cents
+
+        assert to_cents(None) is None
+        assert to_cents(Decimal('19.99')) == 1999
+        assert to_cents(0.1 + 0.2) == 30
+        assert to_cents('500') == 50000
+        assert to_cents(Decimal('0.005')) == 1
+
+    def test_to_decimal_exact_and_cached(self):
+        """Test to_decimal parses via str() and reuses the cached Decimal."""
+        from app.utils.money import to_decimal
+
+        assert to_decimal(0.1) == Decimal('0.1')
+        assert to_decimal(10) is to_decimal(10)
+
+    def test_rule_thresholds_kept_in_sync(self):
+        """Test TierEligibilityRule threshold cents follow the Decimal columns."""
+        from app.models import TierEligibilityRule
+
+        rule = TierEligibilityRule(threshold_value=Decimal('250.50'), threshold_max=None)
+        assert rule.threshold_value_cents == 25050
+        assert rule.threshold_max_cents is None
+        rule.threshold_max = 1000
+        assert rule.threshold_max_cents == 100000
+        assert rule.to_dict()['threshold_value'] == 250.5
+
+    def test_rule_to_dict_without_threshold_cents(self):
+        """Test to_dict falls back to threshold_value for rows written without the validator."""
+        from sqlalchemy.orm.attributes import set_committed_value
+        from app.models import TierEligibilityRule
+
+        rule = TierEligibilityRule()
+        assert rule.to_dict()['threshold_value'] is None
+        set_committed_value(rule, 'threshold_value', Decimal('99.99'))  # as loaded, bypassing @validates
+        assert rule.threshold_value_cents is None
+        assert rule.to_dict()['threshold_value'] == 99.99
+
+
+class TestTierChangeLogExport:
+    """Tests for TierChangeLog.export_rows."""
+
+    def test_streams_rows_with_iso_timestamps(self, app, sample_tenant, sample_member):
+        """Test export yields plain mappings with DB-formatted timestamps."""
+        from app.extensions import db
+        from app.models import TierChangeLog
+
+        with app.app_context():
+            log = TierChangeLog(
+                tenant_id=sample_tenant.id, member_id=sample_member.id,
+                previous_tier_name=None, new_tier_name='Gold',
+                change_type='assigned', source_type='staff',
+                created_at=datetime(2026, 3, 4, 5, 6, 7),
+            )
+            db.session.add(log)
+            db.session.commit()
+            try:
+                rows = list(TierChangeLog.export_rows(db.session, sample_tenant.id))
+                row = next(r for r in rows if r['id'] == log.id)
+                assert row['new_tier'] == 'Gold'
+                assert row['created_at'] == '2026-03-04T05:06:07'
+                assert row['expires_at'] is None
+            finally:
+                db.session.delete(log)
+                db.session.commit()
+
+
+class TestTierChangeLogBulkLog:
+    """Tests for TierChangeLog.bulk_log."""
+
+    def test_inserts_in_batches_and_returns_ids(self, app, sample_tenant, sample_member):
+        """Test rows are inserted across batches and ids come back in order."""
+        from app.extensions import db
+        from app.models import TierChangeLog
+
+        with app.app_context():
+            changes = [
+                {
+                    'tenant_id': sample_tenant.id,
+                    'member_id': sample_member.id,
+                    'new_tier_name': f'Tier {i}',
+                    'change_type': 'assigned',
+                    'source_type': 'system',
+                }
+                for i in range(5)
+            ]
+            ids = TierChangeLog.bulk_log(db.session, changes, batch_size=2)
+            db.session.commit()
+            try:
+                assert len(ids) == 5
+                names = [db.session.get(TierChangeLog, i).new_tier_name for i in ids]
+                assert names == [f'Tier {i}' for i in range(5)]
+                assert db.session.get(TierChangeLog, ids[0]).created_at is not None
+            finally:
+                TierChangeLog.query.filter(TierChangeLog.id.in_(ids)).delete()
+                db.session.commit()
+
+
+class TestTierChangeLogTierRelationships:
+    """Tests for the lazy='raise' tier relationships on TierChangeLog."""
+
+    def test_tier_relationships_require_explicit_load(self, app, db_session, sample_member, sample_tier):
+        """Test previous_tier raises on lazy access but loads via joinedload."""
+        import pytest
+        from sqlalchemy.exc import InvalidRequestError
+        from sqlalchemy.orm import joinedload
+        from app.models import TierChangeLog
+
+        log = TierChangeLog(
+            tenant_id=sample_member.tenant_id,
+            member_id=sample_member.id,
+            previous_tier_id=sample_tier.id,
+            previous_tier_name=sample_tier.name,
+            change_type='removed',
+            source_type='system',
+        )
+        db_session.add(log)
+        db_session.commit()
+        try:
+            with pytest.raises(InvalidRequestError):
+                log.previous_tier
+            loaded = TierChangeLog.query.options(
+                joinedload(TierChangeLog.previous_tier)
+            ).populate_existing().filter_by(id=log.id).one()
+            assert loaded.previous_tier.name == sample_tier.name
+        finally:
+            TierChangeLog.query.filter_by(id=log.id).delete()
+            db_session.commit()
+
+
+class TestJSONProvider:
+    """Tests for the app JSON provider used to encode to_dict output."""
+
+    def test_datetimes_encoded_as_iso(self, app):
+        """Test native datetimes from to_dict are emitted as ISO 8601."""
+        from app.models import BillingHistory
+
+        created = datetime(2026, 1, 2, 3, 4, 5)
+        entry = BillingHistory(event_type='payment', amount=Decimal('5'), created_at=created)
+        with app.app_context():
+            encoded = app.json.loads(app.json.dumps(entry.to_dict()))
+        assert encoded['created_at'] == '2026-01-02T03:04:05'
+        assert encoded['amount'] == 5.0
@@ -0,0 +1,596 @@
+"""
+Tests for NudgesService.
+
+Tests cover:
+- Members with points expiring soon
+- Members close to their next tier
+- Per-instance nudge config caching
+- Precomputed nudge candidates
+"""
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+
+class TestExpiringPoints:
+    """Tests for NudgesService.get_members_with_expiring_points."""
+
+    def test_groups_expiring_points_per_member(self, app, db_session, sample_member):
+        """Test unspent earn transactions are totalled per member with the earliest expiry."""
+        from app.models.points import PointsTransaction
+        from app.services.nudges_service import NudgesService
+
+        now = datetime.utcnow()
+        rows = [
+            PointsTransaction(tenant_id=sample_member.tenant_id, member_id=sample_member.id,
+                              points=100, remaining_points=40, transaction_type='earn',
+                              expires_at=now + timedelta(days=10, hours=1)),
+            PointsTransaction(tenant_id=sample_member.tenant_id, member_id=sample_member.id,
+                              points=60, remaining_points=60, transaction_type='earn',
+                              expires_at=now + timedelta(days=3, hours=1)),
+            PointsTransaction(tenant_id=sample_member.tenant_id, member_id=sample_member.id,
+                              points=50, remaining_points=50, transaction_type='earn',
+                              expires_at=now + timedelta(days=90)),
+        ]
+        db_session.add_all(rows)
+        db_session.commit()
+        try:
+            results = NudgesService(sample_member.tenant_id).get_members_with_expiring_points(days_ahead=30)
+
+            assert len(results) == 1
+            assert results[0]['member']['id'] == sample_member.id
+            assert results[0]['member']['tier']['name'] == 'Gold'
+            assert results[0]['expiring_points'] == 100
+            assert results[0]['days_until_expiry'] == 3
+
+            service = NudgesService(sample_member.tenant_id)
+            nudges = service.get_nudges_for_member(sample_member.id)
+            assert [n['nudge_type'] for n in nudges] == ['points_expiring']
+            assert service.get_members_with_expiring_points(member_id=sample_member.id + 1000) == []
+        finally:
+            for row in rows:
+                db_session.delete(row)
+            db_session.commit()
+
+
+    def test_reminder_batch_reuses_expiring_data(self, app, db_session, sample_member):
+        """Test batch reminders reuse the listing and record sends in one insert."""
+        from app.models.nudge_sent import NudgeSent
+        from app.models.points import PointsTransaction
+        from app.services.nudges_service import NudgesService
+
+        row = PointsTransaction(tenant_id=sample_member.tenant_id, member_id=sample_member.id,
+                                points=75, remaining_points=75, transaction_type='earn',
+                                expires_at=datetime.utcnow() + timedelta(days=2, hours=1))
+        db_session.add(row)
+        db_session.commit()
+        try:
+            service = NudgesService(sample_member.tenant_id)
+            with patch.object(service, 'get_members_with_expiring_points',
+                              wraps=service.get_members_with_expiring_points) as listing, \
+                    patch('app.services.email_service.email_service.send_template_email',
+                          return_value={'success': True}) as send:
+                results = service.process_points_expiring_reminders(days_threshold=7)
+
+            assert results['total_eligible'] == 1
+            assert results['reminders_sent'] == 1
+            assert listing.call_count == 1
+            assert send.call_args.kwargs['data']['expiring_points'] == 75
+            assert send.call_args.kwargs['data']['current_balance'] == (sample_member.points_balance or 0)
+
+            sent = NudgeSent.query.filter_by(member_id=sample_member.id).all()
+            assert len(sent) == 1
+            assert sent[0].context_data['expiring_points'] == 75
+            assert sent[0].tracking_id.startswith(f'nudge_{sample_member.tenant_id}_{sample_member.id}_')
+        finally:
+            NudgeSent.query.filter_by(member_id=sample_member.id).delete()
+            db_session.delete(row)
+            db_session.commit()
+
+
+    def test_reminder_batch_skips_members_in_cooldown(self, app, db_session, sample_member):
+        """Test members sent this nudge recently are skipped by the batch cooldown check."""
+        from app.models.nudge_config import NudgeType
+        from app.models.nudge_sent import NudgeSent
+        from app.models.points import PointsTransaction
+        from app.services.nudges_service import NudgesService
+
+        row = PointsTransaction(tenant_id=sample_member.tenant_id, member_id=sample_member.id,
+                                points=75, remaining_points=75, transaction_type='earn',
+                                expires_at=datetime.utcnow() + timedelta(days=2, hours=1))
+        db_session.add(row)
+        db_session.commit()
+        sent = NudgeSent.record_sent(tenant_id=sample_member.tenant_id, member_id=sample_member.id,
+                                     nudge_type=NudgeType.POINTS_EXPIRING.value)
+        try:
+            assert NudgeSent.recently_sent_member_ids(
+                sample_member.tenant_id, NudgeType.POINTS_EXPIRING.value,
+                [sample_member.id, sample_member.id + 1000]
+            ) == {sample_member.id}
+
+            with patch('app.services.email_service.email_service.send_template_email') as send:
+                results = NudgesService(sample_member.tenant_id).process_points_expiring_reminders(
+                    days_threshold=7
+                )
+
+            assert results['skipped'] == 1
+            send.assert_not_called()
+        finally:
+            db_session.delete(sent)
+            db_session.delete(row)
+            db_session.commit()
+
+
+    def test_template_emails_sent_concurrently_in_order(self, app):
+        """Test batch sends keep input order and turn exceptions into failed results."""
+        import threading
+        from app.services.nudges_service import _send_template_emails
+
+        threads = set()
+
+        def fake_send(**email):
+            threads.add(threading.current_thread().name)
+            if email['to_email'] == 'bad@example.com':
+                raise RuntimeError('provider down')
+            return {'success': True, 'to': email['to_email']}
+
+        emails = [{'to_email': f'{name}@example.com'} for name in ('a', 'bad', 'c')]
+        with patch('app.services.email_service.email_service.send_template_email', side_effect=fake_send):
+            results = _send_template_emails(emails)
+
+        assert [r.get('to') for r in results] == ['a@example.com', None, 'c@example.com']
+        assert results[1] == {'success': False, 'error': 'provider down'}
+        assert all(name.startswith('nudge-email') for name in threads)
+
+
+    def test_reminder_batch_queued_by_urgency(self, app, db_session, sample_member):
+        """Test async batches queue prepared reminders instead of sending them inline."""
+        import queue
+        from app.models.nudge_sent import NudgeSent
+        from app.models.points import PointsTransaction
+        from app.services import nudges_service
+        from app.services.nudges_service import NudgesService
+
+        row = PointsTransaction(tenant_id=sample_member.tenant_id, member_id=sample_member.id,
+                                points=75, remaining_points=75, transaction_type='earn',
+                                expires_at=datetime.utcnow() + timedelta(days=2, hours=1))
+        db_session.add(row)
+        db_session.commit()
+        email_queue = queue.PriorityQueue()
+        app.config['NUDGE_EMAILS_ASYNC'] = True
+        try:
+            with patch.object(nudges_service, '_get_nudge_email_queue', return_value=email_queue), \
+                    patch('app.services.email_service.email_service.send_template_email') as send:
+                service = NudgesService(sample_member.tenant_id)
+                results = service.process_points_expiring_reminders(days_threshold=7)
+                again = service.process_points_expiring_reminders(days_threshold=7)
+
+            assert results['queued'] == 1
+            assert again['queued'] == 0
+            assert len(again['errors']) == 1
+            send.assert_not_called()
+            assert NudgeSent.query.filter_by(member_id=sample_member.id).count() == 0
+
+            priority, _, job = email_queue.get_nowait()
+            assert priority == 2
+            assert job['prepared']['member_id'] == sample_member.id
+            assert job['prepared']['email']['data']['expiring_points'] == 75
+        finally:
+            app.config['NUDGE_EMAILS_ASYNC'] = False
+            nudges_service._queued_nudge_keys.clear()
+            db_session.delete(row)
+            db_session.commit()
+
+    def test_queued_email_retries_then_records(self, app, db_session, sample_member):
+        """Test a failed queued send is retried with backoff and recorded once it succeeds."""
+        from app.models.nudge_config import NudgeType
+        from app.models.nudge_sent import NudgeSent
+        from app.services import nudges_service
+
+        key = (sample_member.tenant_id, sample_member.id, NudgeType.POINTS_EXPIRING.value)
+        job = {
+            'app': app,
+            'tenant_id': sample_member.tenant_id,
+            'key': key,
+            'priority': 2,
+            'attempt': 0,
+            'prepared': {
+                'member_id': sample_member.id,
+                'expiring_data': {'expiring_points': 75, 'earliest_expiry': None, 'days_until_expiry': 2},
+                'email': {'to_email': sample_member.email},
+            },
+        }
+        nudges_service._queued_nudge_keys.add(key)
+        try:
+            with patch('app.services.email_service.email_service.send_template_email',
+                       side_effect=RuntimeError('provider down')), \
+                    patch.object(nudges_service, 'Timer') as timer:
+                nudges_service._deliver_nudge_email(job)
+
+            delay, _ = timer.call_args.args
+            retry_job = timer.call_args.kwargs['args'][0]
+            assert delay == nudges_service.NUDGE_EMAIL_RETRY_BASE_DELAY
+            assert retry_job['attempt'] == 1
+            assert key in nudges_service._queued_nudge_keys
+
+            with patch('app.services.email_service.email_service.send_template_email',
+                       return_value={'success': True}):
+                nudges_service._deliver_nudge_email(retry_job)
+
+            assert key not in nudges_service._queued_nudge_keys
+            assert NudgeSent.query.filter_by(member_id=sample_member.id).count() == 1
+        finally:
+            nudges_service._queued_nudge_keys.discard(key)
+            NudgeSent.query.filter_by(member_id=sample_member.id).delete()
+            db_session.commit()
+
+
+    def test_scheduler_counts_queued_emails_toward_tenant_cap(self, app, db_session, sample_tenant):
+        """Test emails queued by an async points-expiring run still use up the per-tenant cap."""
+        from app.services.nudges_service import NudgesService
+        from app.utils import scheduler
+
+        queued_run = {'success': True, 'reminders_sent': 0, 'queued': 45, 'skipped': 0, 'errors': []}
+        tier_run = {'success': True, 'reminders_sent': 30, 'skipped': 0, 'errors': []}
+        later_run = {'success': True, 'emails_sent': 0, 'reminders_sent': 0, 'skipped': 0, 'errors': []}
+
+        original_active = sample_tenant.subscription_active
+        sample_tenant.subscription_active = True
+        db_session.commit()
+        try:
+            with patch.object(scheduler, '_flask_app', app), \
+                    patch.object(NudgesService, 'is_nudge_enabled', return_value=True), \
+                    patch.object(NudgesService, 'process_points_expiring_reminders', return_value=queued_run), \
+                    patch.object(NudgesService, 'process_tier_progress_reminders', return_value=tier_run), \
+                    patch.object(NudgesService, 'process_reengagement_emails', return_value=later_run) as reengage, \
+                    patch.object(NudgesService, 'process_trade_in_reminders', return_value=later_run) as trade_in:
+                scheduler.run_nudges_processor()
+
+            # 45 queued + 30 sent of the 100 per-tenant budget leaves 25
+            reengage_limits = [call.kwargs['max_emails'] for call in reengage.call_args_list]
+            assert 25 in reengage_limits
+            assert all(limit <= 50 for limit in reengage_limits)
+            assert 25 in [call.kwargs['max_emails'] for call in trade_in.call_args_list]
+        finally:
+            sample_tenant.subscription_active = original_active
+            db_session.commit()
+
+
+class TestTierProgress:
+    """Tests for the near-upgrade and tier progress nudges."""
+
+    def _check_candidates(self, db_session, sample_member, fetch, points_by_result):
+        from app.models.member import MembershipTier
+
+        top_tier = MembershipTier(tenant_id=sample_member.tenant_id, name='Platinum',
+                                  monthly_price=99.99, bonus_rate=0.5, is_active=True)
+        db_session.add(top_tier)
+        db_session.commit()
+        original_points = sample_member.lifetime_points_earned
+        try:
+            for points, expected in points_by_result:
+                sample_member.lifetime_points_earned = points
+                db_session.commit()
+                ids = [r['member']['id'] for r in fetch()]
+                assert (sample_member.id in ids) is expected, points
+        finally:
+            sample_member.lifetime_points_earned = original_points
+            db_session.delete(top_tier)
+            db_session.commit()
+
+    def test_near_tier_upgrade_filters_in_sql(self, app, db_session, sample_member):
+        """Test only members between the threshold and the next tier are returned."""
+        from app.services.nudges_service import NudgesService
+
+        service = NudgesService(sample_member.tenant_id)
+        self._check_candidates(
+            db_session, sample_member,
+            lambda: service.get_members_near_tier_upgrade(threshold=0.9),
+            [(4400, False), (4600, True), (5000, False)],
+        )
+
+    def test_near_tier_progress_filters_in_sql(self, app, db_session, sample_member):
+        """Test progress through the current tier range is filtered by the threshold."""
+        from app.services.nudges_service import NudgesService
+
+        service = NudgesService(sample_member.tenant_id)
+        self._check_candidates(
+            db_session, sample_member,
+            lambda: service.get_members_near_tier_progress(threshold_percent=0.9),
+            [(400, False), (460, True), (500, False)],
+        )
+
+
+    def test_reminder_batch_reuses_progress_data(self, app, db_session, sample_member):
+        """Test batch tier progress reminders reuse the listing instead of rescanning per member."""
+        from app.models.member import MembershipTier
+        from app.models.nudge_sent import NudgeSent
+        from app.services.nudges_service import NudgesService
+
+        top_tier = MembershipTier(tenant_id=sample_member.tenant_id, name='Platinum',
+                                  monthly_price=99.99, bonus_rate=0.5, is_active=True)
+        db_session.add(top_tier)
+        original_points = sample_member.lifetime_points_earned
+        sample_member.lifetime_points_earned = 460
+        db_session.commit()
+        try:
+            service = NudgesService(sample_member.tenant_id)
+            assert service.should_send_tier_progress_reminder(sample_member.id)
+            assert service.get_member_tier_progress(sample_member.id)['progress_percent'] == 92.0
+            assert service.get_member_tier_progress(sample_member.id, threshold_percent=0.95) is None
+
+            with patch.object(service, 'get_members_near_tier_progress',
+                              wraps=service.get_members_near_tier_progress) as listing, \
+                    patch('app.services.email_service.email_service.send_template_email',
+                          return_value={'success': True}) as send:
+                results = service.process_tier_progress_reminders(threshold_percent=0.9)
+
+            assert results['reminders_sent'] == 1
+            assert listing.call_count == 1
+            assert send.call_args.kwargs['data']['next_tier'] == 'Platinum'
+            assert send.call_args.kwargs['data']['points_needed'] == 40
+            assert send.call_args.kwargs['data']['next_tier_benefits'] == '- 50.0% bonus on trade-ins'
+            assert NudgeSent.query.filter_by(member_id=sample_member.id).count() == 1
+            assert not service.should_send_tier_progress_reminder(sample_member.id)
+        finally:
+            NudgeSent.query.filter_by(member_id=sample_member.id).delete()
+            sample_member.lifetime_points_earned = original_points
+            db_session.delete(top_tier)
+            db_session.commit()
+
+    def test_points_milestone_streams_members(self, app, db_session, sample_member):
+        """Test members just past a milestone are found by the streamed scan."""
+        from app.services import nudges_service
+        from app.services.nudges_service import NudgesService
+
+        original_points = sample_member.lifetime_points_earned
+        sample_member.lifetime_points_earned = 105
+        db_session.commit()
+        try:
+            with patch.object(nudges_service, 'MEMBER_SCAN_BATCH_SIZE', 1):
+                results = NudgesService(sample_member.tenant_id).get_members_at_points_milestone()
+
+            mine = [r for r in results if r['member']['id'] == sample_member.id]
+            assert [(r['milestone'], r['member']['tier']['name']) for r in mine] == [(100, 'Gold')]
+
+            # Between milestones the member is filtered out in SQL
+            sample_member.lifetime_points_earned = 130
+            db_session.commit()
+            service = NudgesService(sample_member.tenant_id)
+            assert service.get_members_at_points_milestone(member_id=sample_member.id) == []
+        finally:
+            sample_member.lifetime_points_earned = original_points
+            db_session.commit()
+
+
+class TestNudgeConfigCache:
+    """Tests for the per-instance nudge config cache."""
+
+    def test_configs_loaded_once_and_refreshed_after_update(self, app, db_session, sample_tenant):
+        """Test config lookups share one query until a config is updated."""
+        from app.models.nudge_config import NudgeConfig, NudgeType
+        from app.services.nudges_service import NudgesService
+
+        config = NudgeConfig(tenant_id=sample_tenant.id, nudge_type=NudgeType.TIER_PROGRESS.value,
+                             message_template='Almost there', config_options={'threshold_percent': 0.8})
+        db_session.add(config)
+        db_session.commit()
+        try:
+            service = NudgesService(sample_tenant.id)
+            with patch.object(NudgeConfig, 'get_all_for_tenant',
+                              wraps=NudgeConfig.get_all_for_tenant) as get_all:
+                assert service.get_tier_progress_config()['threshold_percent'] == 0.8
+                assert service.get_nudge_settings()['tier_upgrade_threshold'] == 0.8
+                assert service.is_nudge_enabled(NudgeType.TIER_PROGRESS.value)
+                assert get_all.call_count == 1
+
+                service.update_tier_progress_config(threshold_percent=0.7)
+                assert service.get_nudge_settings()['tier_upgrade_threshold'] == 0.7
+                assert get_all.call_count == 2
+        finally:
+            db_session.delete(config)
+            db_session.commit()
+
+    def test_disabled_nudge_types_skip_their_scans(self, app, db_session, sample_tenant):
+        """Test pending nudges only run the scans for enabled nudge types."""
+        from app.models.nudge_config import NudgeConfig, NudgeType
+        from app.services.nudges_service import NudgesService
+
+        config = NudgeConfig(tenant_id=sample_tenant.id, nudge_type=NudgeType.POINTS_EXPIRING.value,
+                             is_enabled=False, message_template='Expiring')
+        db_session.add(config)
+        db_session.commit()
+        try:
+            service = NudgesService(sample_tenant.id)
+            with patch.object(service, 'get_members_with_expiring_points') as expiring:
+                nudges = service._compute_pending_nudges(service.get_nudge_settings())
+
+            expiring.assert_not_called()
+            assert 'points_expiring' not in nudges
+            assert 'points_milestones' in nudges
+        finally:
+            db_session.delete(config)
+            db_session.commit()
+
+
+class TestNudgeCandidates:
+    """Tests for the precomputed nudge_candidates table."""
+
+    def test_pending_nudges_served_from_fresh_refresh(self, app, db_session, sample_member):
+        """Test a refresh is served until it goes stale, then nudges are computed live."""
+        from app.models.nudge_candidate import NudgeCandidate, NudgeCandidateRefresh
+        from app.models.points import PointsTransaction
+        from app.services.nudges_service import NudgesService, NUDGE_CANDIDATES_MAX_AGE
+
+        row = PointsTransaction(tenant_id=sample_member.tenant_id, member_id=sample_member.id,
+                                points=80, remaining_points=80, transaction_type='earn',
+                                expires_at=datetime.utcnow() + timedelta(days=5))
+        db_session.add(row)
+        db_session.commit()
+        service = NudgesService(sample_member.tenant_id)
+        try:
+            assert service.refresh_nudge_candidates() >= 1
+
+            with patch.object(service, 'get_members_with_expiring_points') as live_scan:
+                pending = service.get_all_pending_nudges()
+            live_scan.assert_not_called()
+            assert pending['generated_at'] is not None
+            expiring = pending['nudges']['points_expiring']
+            assert [n['member']['id'] for n in expiring] == [sample_member.id]
+            assert expiring[0]['expiring_points'] == 80
+
+            NudgeCandidateRefresh.query.filter_by(tenant_id=sample_member.tenant_id).update(
+                {'generated_at': datetime.utcnow() - NUDGE_CANDIDATES_MAX_AGE - timedelta(minutes=1)}
+            )
+            db_session.commit()
+            pending = service.get_all_pending_nudges()
+            assert pending['generated_at'] is None
+            assert pending['nudges']['points_expiring'][0]['expiring_points'] == 80
+        finally:
+            NudgeCandidate.query.filter_by(tenant_id=sample_member.tenant_id).delete()
+            NudgeCandidateRefresh.query.filter_by(tenant_id=sample_member.tenant_id).delete()
+            db_session.delete(row)
+            db_session.commit()
+
+    def test_empty_refresh_counts_as_fresh(self, app, db_session, sample_member):
+        """Test a refresh that finds no candidates is served instead of rescanning."""
+        from app.models.nudge_candidate import NudgeCandidateRefresh
+        from app.services.nudges_service import NudgesService
+
+        service = NudgesService(sample_member.tenant_id)
+        try:
+            assert service.refresh_nudge_candidates() == 0
+
+            with patch.object(service, '_compute_pending_nudges') as live_scan:
+                pending = service.get_all_pending_nudges()
+                counts = service.get_nudge_counts()
+            live_scan.assert_not_called()
+            assert pending['generated_at'] is not None
+            assert pending['total_count'] == 0
+            assert set(counts.values()) == {0}
+        finally:
+            NudgeCandidateRefresh.query.filter_by(tenant_id=sample_member.tenant_id).delete()
+            db_session.commit()
+
+    def test_stats_counted_from_fresh_refresh(self, app, db_session, sample_member):
+        """Test nudge stats are grouped counts over the refresh, not built entries."""
+        from app.models.nudge_candidate import NudgeCandidate, NudgeCandidateRefresh
+        from app.models.points import PointsTransaction
+        from app.services.nudges_service import NudgesService
+
+        row = PointsTransaction(tenant_id=sample_member.tenant_id, member_id=sample_member.id,
+                                points=80, remaining_points=80, transaction_type='earn',
+                                expires_at=datetime.utcnow() + timedelta(days=5))
+        db_session.add(row)
+        db_session.commit()
+        service = NudgesService(sample_member.tenant_id)
+        try:
+            live = service.get_nudge_stats()['stats']
+            assert live['points_expiring'] == 1
+
+            service.refresh_nudge_candidates()
+            with patch.object(service, '_compute_pending_nudges') as live_scan:
+                stats = service.get_nudge_stats()['stats']
+            live_scan.assert_not_called()
+            assert stats == live
+            assert stats['total'] == sum(v for k, v in stats.items() if k != 'total')
+        finally:
+            NudgeCandidate.query.filter_by(tenant_id=sample_member.tenant_id).delete()
+            NudgeCandidateRefresh.query.filter_by(tenant_id=sample_member.tenant_id).delete()
+            db_session.delete(row)
+            db_session.commit()
+
+    def test_member_recompute_patches_fresh_refresh(self, app, db_session, sample_member):
+        """Test a member's rows are recomputed in place, keeping the refresh time."""
+        from app.models.nudge_candidate import NudgeCandidate, NudgeCandidateRefresh
+        from app.models.points import PointsTransaction
+        from app.services.nudges_service import NudgesService
+
+        rows = [PointsTransaction(tenant_id=sample_member.tenant_id, member_id=sample_member.id,
+                                  points=80, remaining_points=80, transaction_type='earn',
+                                  expires_at=datetime.utcnow() + timedelta(days=5))]
+        db_session.add(rows[0])
+        db_session.commit()
+        service = NudgesService(sample_member.tenant_id)
+        try:
+            assert service.recompute_member_nudges(sample_member.id) == 0  # nothing to patch yet
+            service.refresh_nudge_candidates()
+            generated_at = service.get_all_pending_nudges()['generated_at']
+
+            rows.append(PointsTransaction(tenant_id=sample_member.tenant_id, member_id=sample_member.id,
+                                          points=20, remaining_points=20, transaction_type='earn',
+                                          expires_at=datetime.utcnow() + timedelta(days=9)))
+            db_session.add(rows[1])
+            db_session.commit()
+            assert service.recompute_member_nudges(sample_member.id) >= 1
+
+            pending = service.get_all_pending_nudges()
+            assert pending['generated_at'] == generated_at
+            assert pending['nudges']['points_expiring'][0]['expiring_points'] == 100
+        finally:
+            NudgeCandidate.query.filter_by(tenant_id=sample_member.tenant_id).delete()
+            NudgeCandidateRefresh.query.filter_by(tenant_id=sample_member.tenant_id).delete()
+            for row in rows:
+                db_session.delete(row)
+            db_session.commit()
+
+    def test_commit_queues_touched_members(self, app, db_session, sample_member):
+        """Test committing a member change queues that member for recompute."""
+        import queue
+        from app.services import nudges_service
+
+        q = queue.Queue()
+        original_points = sample_member.lifetime_points_earned
+        with patch.dict(app.config, {'NUDGE_CANDIDATES_INCREMENTAL': True}), \
+                patch.object(nudges_service, '_get_candidates_queue', return_value=q):
+            sample_member.lifetime_points_earned = (original_points or 0) + 1
+            db_session.commit()
+        sample_member.lifetime_points_earned = original_points
+        db_session.commit()
+
+        _, tenant_id, member_id = q.get_nowait()
+        assert (tenant_id, member_id) == (sample_member.tenant_id, sample_member.id)
+
+    def test_profile_edit_does_not_queue_member(self, app, db_session, sample_member):
+        """Test updating a member field the scans don't read queues no recompute."""
+        import queue
+        from app.services import nudges_service
+
+        q = queue.Queue()
+        original_phone = sample_member.phone
+        with patch.dict(app.config, {'NUDGE_CANDIDATES_INCREMENTAL': True}), \
+                patch.object(nudges_service, '_get_candidates_queue', return_value=q):
+            sample_member.phone = '555-0100'
+            db_session.commit()
+        sample_member.phone = original_phone
+        db_session.commit()
+
+        assert q.empty()
+
+    def test_recompute_upserts_one_row_per_nudge_type(self, app, db_session, sample_member):
+        """Test recomputing a member twice overwrites its rows instead of duplicating them."""
+        from app.models.nudge_candidate import NudgeCandidate, NudgeCandidateRefresh
+        from app.models.points import PointsTransaction
+        from app.services.nudges_service import NudgesService
+
+        row = PointsTransaction(tenant_id=sample_member.tenant_id, member_id=sample_member.id,
+                                points=80, remaining_points=80, transaction_type='earn',
+                                expires_at=datetime.utcnow() + timedelta(days=5))
+        db_session.add(row)
+        db_session.commit()
+        service = NudgesService(sample_member.tenant_id)
+        try:
+            written = service.refresh_nudge_candidates()
+            assert service.recompute_member_nudges(sample_member.id) == written
+            assert service.recompute_member_nudges(sample_member.id) == written
+            service.refresh_nudge_candidates()
+
+            stored = NudgeCandidate.query.filter_by(
+                tenant_id=sample_member.tenant_id, member_id=sample_member.id
+            ).all()
+            assert len(stored) == written
+            assert len({c.nudge_type for c in stored}) == written
+        finally:
+            NudgeCandidate.query.filter_by(tenant_id=sample_member.tenant_id).delete()
+            NudgeCandidateRefresh.query.filter_by(tenant_id=sample_member.tenant_id).delete()
+            db_session.delete(row)
+            db_session.commit()
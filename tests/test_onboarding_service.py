@@ -0,0 +1,48 @@
+"""
+Tests for OnboardingService.
+
+Tests cover:
+- Applying tier templates (bulk replace of a tenant's tiers)
+"""
+
+
+class TestApplyTemplate:
+    """Tests for OnboardingService.apply_template."""
+
+    def test_reapplying_template_replaces_tiers(self, app, db_session, sample_tenant):
+        """Test each apply replaces the tenant's tiers in template order and refreshes the tier cache."""
+        from app.models import MembershipTier, NudgeConfig
+        from app.services.onboarding import OnboardingService, TIER_TEMPLATES
+        from app.services.tier_cache_service import get_cached_tiers
+
+        stale = MembershipTier(tenant_id=sample_tenant.id, name='Legacy', monthly_price=5,
+                               bonus_rate=0.1, is_active=True)
+        db_session.add(stale)
+        db_session.commit()
+        original_settings = dict(sample_tenant.settings or {})
+        try:
+            assert [t['name'] for t in get_cached_tiers(sample_tenant.id)] == ['Legacy']
+
+            for template_key in ('classic', 'simple'):
+                expected = [tier['name'] for tier in TIER_TEMPLATES[template_key]['tiers']]
+                result = OnboardingService(sample_tenant.id).apply_template(template_key)
+
+                assert result['tiers_created'] == len(expected)
+                assert [t['name'] for t in result['tiers']] == expected
+                assert [t['display_order'] for t in result['tiers']] == list(range(len(expected)))
+
+                stored = MembershipTier.query.filter_by(tenant_id=sample_tenant.id).order_by(
+                    MembershipTier.display_order
+                ).all()
+                assert [t.id for t in stored] == [t['id'] for t in result['tiers']]
+                assert [t.name for t in stored] == expected
+                assert [t['name'] for t in get_cached_tiers(sample_tenant.id)] == expected
+
+            # Only the last template's tiers remain (SQLite may reuse the stale tier's id)
+            assert MembershipTier.query.filter_by(tenant_id=sample_tenant.id, name='Legacy').count() == 0
+            assert sample_tenant.settings['template_used'] == 'simple'
+        finally:
+            MembershipTier.query.filter_by(tenant_id=sample_tenant.id).delete()
+            NudgeConfig.query.filter_by(tenant_id=sample_tenant.id).delete()
+            sample_tenant.settings = original_settings
+            db_session.commit()
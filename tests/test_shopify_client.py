@@ -0,0 +1,72 @@
+"""
+Tests for the Shopify Admin API client.
+
+Tests cover:
+- Connection pool reuse across GraphQL calls
+- HTTP/2 only when the h2 package is available
+- Pre-encoded JSON request bodies
+- Background task pool
+"""
+from unittest.mock import MagicMock, patch
+
+
+class TestExecuteQuery:
+    """Tests for ShopifyClient._execute_query."""
+
+    def test_requests_share_pooled_http_client(self, app):
+        """Test every call goes through the single process-wide httpx client."""
+        from app.services import shopify_client as module
+
+        client = module.ShopifyClient('test-shop.myshopify.com', 'shpat_test')
+        response = MagicMock(status_code=200)
+        response.json.return_value = {'data': {'shop': {'name': 'Test'}}}
+
+        with patch.object(module, '_http_client', None):
+            pooled = module._get_http_client()
+            with patch.object(pooled, 'post', return_value=response) as post:
+                assert client._execute_query('{ shop { name } }') == {'shop': {'name': 'Test'}}
+                assert client._execute_query('{ shop { name } }') == {'shop': {'name': 'Test'}}
+            assert post.call_count == 2
+            assert module._get_http_client() is pooled
+
+    def test_http2_enabled_only_with_h2(self):
+        """Test the pooled client negotiates HTTP/2 only when h2 is importable."""
+        from app.services import shopify_client as module
+
+        for h2_module, expected in ((None, False), (object(), True)):
+            with patch.object(module, '_http_client', None), \
+                    patch.object(module, 'h2', h2_module), \
+                    patch.object(module.httpx, 'Client') as client_class:
+                module._get_http_client()
+            assert client_class.call_args.kwargs['http2'] is expected
+
+    def test_request_body_encodes_variables_once(self, app):
+        """Test variables are sent as pre-encoded JSON, including Decimal values."""
+        import json
+        from decimal import Decimal
+        from app.services import shopify_client as module
+
+        client = module.ShopifyClient('test-shop.myshopify.com', 'shpat_test')
+        response = MagicMock(status_code=200)
+        response.json.return_value = {'data': {}}
+
+        with patch.object(module, '_http_client', None):
+            with patch.object(module._get_http_client(), 'post', return_value=response) as post:
+                client._execute_query('mutation { x }', {'payload': {'amount': Decimal('5.00')}})
+
+        body = post.call_args.kwargs['content']
+        assert isinstance(body, bytes)
+        assert json.loads(body) == {
+            'query': 'mutation { x }',
+            'variables': {'payload': {'amount': '5.00'}}
+        }
+
+
+class TestSubmitBackground:
+    """Tests for the shared background task pool."""
+
+    def test_runs_task_and_returns_future(self):
+        """Test tasks run on the pool and their results come back on the future."""
+        from app.services.shopify_client import submit_background
+
+        assert submit_background(lambda a, b=0: a + b, 2, b=3).result(timeout=5) == 5
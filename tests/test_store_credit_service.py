@@ -322,6 +322,38 @@ class TestStoreCreditServiceBalance:
             assert result['currency'] == 'USD'
             assert result['account_id'] == 'acc_123'
 
+    @patch('app.services.store_credit_service.ShopifyClient')
+    def test_cached_shopify_balance_dropped_after_credit(self, mock_shopify_class, app, sample_member):
+        """Test the cached balance is reused until this service credits the member."""
+        with app.app_context():
+            from app.models import Member
+            from app.services.store_credit_service import StoreCreditService
+            from app.models.promotions import CreditEventType
+            from app.utils.cache import cache
+
+            cache.clear()
+            member = Member.query.get(sample_member.id)
+
+            mock_client = MagicMock()
+            mock_client.get_store_credit_balance.return_value = {'balance': 10.0, 'currency': 'USD'}
+            mock_client.add_store_credit.return_value = {'success': True, 'new_balance': 15.0}
+            mock_shopify_class.return_value = mock_client
+
+            service = StoreCreditService()
+            assert service.get_cached_shopify_balance(member)['balance'] == 10.0
+            assert service.get_cached_shopify_balance(member)['balance'] == 10.0
+            assert mock_client.get_store_credit_balance.call_count == 1
+
+            service.add_credit(
+                member_id=member.id,
+                amount=Decimal('5.00'),
+                event_type=CreditEventType.MANUAL_ADJUSTMENT.value,
+                description='Test credit',
+                sync_to_shopify=True
+            )
+            mock_client.get_store_credit_balance.return_value = {'balance': 15.0, 'currency': 'USD'}
+            assert service.get_cached_shopify_balance(member)['balance'] == 15.0
+
     def test_get_shopify_balance_no_customer_id(self, app):
         """Test get_shopify_balance returns zero when no customer ID."""
         with app.app_context():
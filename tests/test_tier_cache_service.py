@@ -0,0 +1,64 @@
+"""
+Tests for the cached tier configuration service.
+
+Tests cover:
+- Cached lookups by tier id and name
+- Automatic invalidation when tiers are committed
+- Pending invalidations dropped on rollback
+"""
+from unittest.mock import patch
+
+
+class TestTierCache:
+    """Tests for tier cache population and invalidation."""
+
+    def test_tier_by_id_served_from_cache(self, app, sample_tier):
+        """Test get_cached_tier_by_id hits the database only once."""
+        from app.services import tier_cache_service
+        from app.utils.cache import cache
+
+        with app.app_context():
+            cache.clear()
+            first = tier_cache_service.get_cached_tier_by_id(sample_tier.tenant_id, sample_tier.id)
+            with patch.object(tier_cache_service.MembershipTier, 'query') as query:
+                second = tier_cache_service.get_cached_tier_by_id(sample_tier.tenant_id, sample_tier.id)
+                query.filter_by.assert_not_called()
+            assert first == second
+            assert second['name'] == 'Gold'
+
+    def test_tier_by_name_matches_case_insensitively(self, app, sample_tier):
+        """Test get_cached_tier_by_name falls back to a case-insensitive match."""
+        from app.services.tier_cache_service import get_cached_tier_by_name
+        from app.utils.cache import cache
+
+        with app.app_context():
+            cache.clear()
+            assert get_cached_tier_by_name(sample_tier.tenant_id, 'Gold')['id'] == sample_tier.id
+            assert get_cached_tier_by_name(sample_tier.tenant_id, 'gOLD')['id'] == sample_tier.id
+            assert get_cached_tier_by_name(sample_tier.tenant_id, 'Silver') is None
+
+    def test_commit_invalidates_tenant_cache(self, app, db_session, sample_tier):
+        """Test updating a tier through the ORM drops the tenant's cached tiers."""
+        from app.services.tier_cache_service import get_cached_tiers
+        from app.utils.cache import cache
+
+        cache.clear()
+        assert get_cached_tiers(sample_tier.tenant_id)[0]['name'] == 'Gold'
+
+        sample_tier.name = 'Platinum'
+        db_session.commit()
+        try:
+            assert get_cached_tiers(sample_tier.tenant_id)[0]['name'] == 'Platinum'
+        finally:
+            sample_tier.name = 'Gold'
+            db_session.commit()
+
+    def test_rollback_discards_pending_invalidation(self, app, db_session, sample_tier):
+        """Test a rolled back flush leaves the cache untouched."""
+        from app.services.tier_cache_service import _PENDING_KEY
+
+        sample_tier.name = 'Platinum'
+        db_session.flush()
+        assert sample_tier.tenant_id in db_session.info[_PENDING_KEY]
+        db_session.rollback()
+        assert _PENDING_KEY not in db_session.info
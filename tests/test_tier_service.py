@@ -74,6 +74,32 @@ class TestTierAssignment:
             assert result['tier_id'] == new_tier.id
             assert result['tier_name'] == 'Premium'
 
+    def test_assign_tier_syncs_metafields_in_background(self, app, sample_member, sample_tier, sample_tenant):
+        """Test the metafield sync is handed to the background pool, not run inline."""
+        from app.services.tier_service import TierService
+
+        mock_client = MagicMock()
+        mock_client.get_store_credit_balance.return_value = {'balance': {'amount': '12.50'}}
+        customer_id = sample_member.shopify_customer_id
+        service = TierService(sample_tenant.id, shopify_client=mock_client)
+        with patch('app.services.shopify_client.submit_background') as submit:
+            result = service.assign_tier(
+                member_id=sample_member.id,
+                tier_id=sample_tier.id,
+                source_type='staff',
+                source_reference='test@example.com',
+                force=True
+            )
+        assert result['success'] is True
+        mock_client.sync_member_metafields.assert_not_called()
+
+        push, fields = submit.call_args[0]
+        assert fields['tier_name'] == 'Gold'
+        push(fields)
+        kwargs = mock_client.sync_member_metafields.call_args.kwargs
+        assert kwargs['customer_id'] == customer_id
+        assert kwargs['credit_balance'] == 12.5
+
     def test_assign_tier_member_not_found(self, app, sample_tenant):
         """Test assigning tier to non-existent member."""
         from app.services.tier_service import TierService
@@ -1263,6 +1289,50 @@ class TestEvaluateRule:
             assert service._evaluate_rule(rule, {'total_spend': 500}) is True
             assert service._evaluate_rule(rule, {'total_spend': 600}) is False
 
+    def test_evaluate_rule_cent_precision(self, app, sample_tier, sample_tenant):
+        """Test fractional thresholds compare exactly at cent precision."""
+        from app.services.tier_service import TierService
+        from app.models import TierEligibilityRule
+
+        with app.app_context():
+            rule = TierEligibilityRule(
+                tenant_id=sample_tenant.id,
+                tier_id=sample_tier.id,
+                name='Cents Rule',
+                rule_type='qualification',
+                metric='total_spend',
+                threshold_value=Decimal('100.10'),
+                threshold_operator='>=',
+                is_active=True
+            )
+
+            service = TierService(sample_tenant.id)
+
+            assert service._evaluate_rule(rule, {'total_spend': 100.1}) is True
+            assert service._evaluate_rule(rule, {'total_spend': 100.09}) is False
+
+    def test_evaluate_rule_half_cent_values(self, app, sample_tier, sample_tenant):
+        """Test a stat equal to a half-cent threshold rounds the same way and matches."""
+        from app.services.tier_service import TierService
+        from app.models import TierEligibilityRule
+
+        with app.app_context():
+            service = TierService(sample_tenant.id)
+            for value in ('1.005', '0.125'):
+                for operator in ('>=', '==', 'between'):
+                    rule = TierEligibilityRule(
+                        tenant_id=sample_tenant.id,
+                        tier_id=sample_tier.id,
+                        name='Half Cent Rule',
+                        rule_type='qualification',
+                        metric='total_spend',
+                        threshold_value=Decimal(value),
+                        threshold_max=Decimal(value),
+                        threshold_operator=operator,
+                        is_active=True
+                    )
+                    assert service._evaluate_rule(rule, {'total_spend': float(value)}) is True
+
 
 class TestMemberStats:
     """Tests for _get_member_stats helper method."""